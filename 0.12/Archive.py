@@ -0,0 +1,318 @@
+'''
+Particle Swarm Optimization - PyPSO
+
+Copyright (c) 2009 Marcel Pinheiro Caraciolo
+caraciol@gmail.com
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+0.10 2026-10-19 Initial version.
+0.11 2026-10-19 The positions are copied by copyPosition() (numpy arrays of the binary particles).
+0.11 2026-10-19 Added constrainedDominates(), the archive compares the violations first.
+'''
+
+"""
+
+:mod:`Archive` -- the Pareto archive module
+==============================================================
+
+    This module contains the :class:`Archive.ParetoArchive` class, the bounded
+    external archive of non-dominated solutions used by the
+    :class:`MultiObjectiveTopology.MultiObjectiveTopology`, the
+    :func:`Archive.dominates`, :func:`Archive.constrainedDominates` and
+    :func:`Archive.copyPosition` functions.
+
+    With two objectives the archive is kept sorted by the first objective, so the
+    second objective is strictly decreasing: an insertion is a binary search
+    and the solutions dominated by the new one are a contiguous run after it.
+    With more objectives the insertion is a linear scan of the archive.
+
+"""
+
+import Consts
+import random
+from bisect import bisect_left
+
+
+def dominates(fitness, other, minimax):
+	""" Returns True if the fitness vector dominates the other one
+
+	:param fitness: the first fitness vector
+	:param other: the second fitness vector
+	:param minimax: the Consts.minimaxType of all the objectives
+	:rtype: True or False
+
+	"""
+	if minimax == Consts.minimaxType["maximize"]:
+		fitness, other = other, fitness
+	strict = False
+	for a, b in zip(fitness, other):
+		if a > b:
+			return False
+		if a < b:
+			strict = True
+	return strict
+
+
+def constrainedDominates(fitness, violation, other, other_violation, minimax):
+	""" Returns True if the first solution dominates the other one by the feasibility
+	rules (see :func:`Constraints.isBetter`): a feasible solution dominates an
+	infeasible one, two infeasible solutions are compared by the violation and two
+	feasible ones by :func:`dominates`
+
+	:param fitness: the first fitness vector
+	:param violation: the constraint violation of the first solution
+	:param other: the second fitness vector
+	:param other_violation: the constraint violation of the second solution
+	:param minimax: the Consts.minimaxType of all the objectives
+	:rtype: True or False
+
+	"""
+	if violation > 0.0 or other_violation > 0.0:
+		return violation < other_violation
+	return dominates(fitness, other, minimax)
+
+
+def copyPosition(position):
+	""" Returns a copy of the position, the numpy arrays (binary particles) and the
+	tuples of arrays (mixed particles) are copied too, a slice would be a view
+
+	:param position: the position, a list, a numpy array or a tuple of them
+	:rtype: the copy of the position
+
+	"""
+	if isinstance(position, tuple):
+		return tuple([copyPosition(block) for block in position])
+	if hasattr(position, "copy"):
+		return position.copy()
+	return position[:]
+
+
+class ParetoArchive(object):
+	""" ParetoArchive Class - The bounded archive of non-dominated solutions
+
+	When the archive is full, the most crowded solutions (lowest crowding distance)
+	are pruned. The leaders are selected by a binary tournament on the crowding
+	distance, so the less crowded regions of the front are preferred.
+
+	The solutions are compared by :func:`constrainedDominates`, so the archive
+	holds the feasible solutions, or the least violated solution while no feasible
+	solution was inserted.
+
+	Example:
+		>>> archive = topology.getArchive()
+		>>> for fitness, position in archive:
+		>>>		print fitness
+		(...)
+
+	:param size: the maximum number of solutions, default is Consts.CDefArchiveSize
+	:param minimax: the Consts.minimaxType of all the objectives
+
+	"""
+
+	def __init__(self, size=None, minimax=None):
+		""" The ParetoArchive Class Creator """
+		self.size = Consts.CDefArchiveSize if size is None else size
+		self.minimax = Consts.CDefSwarmMinimax if minimax is None else minimax
+		self.clear()
+
+	def clear(self):
+		""" Removes all the solutions of the archive """
+		#The minimization keys, the fitness vectors and the positions are parallel lists
+		self.keys = []
+		self.fitness = []
+		self.positions = []
+		self.crowding = None
+		self.insertions = 0
+		self.pruned = 0
+		#The constraint violation of the solutions, 0.0 when they are feasible
+		self.violation = 0.0
+
+	def __len__(self):
+		""" Returns the number of solutions in the archive """
+		return len(self.keys)
+
+	def __iter__(self):
+		""" Returns an iterator of the (fitness, position) solutions """
+		return iter(zip(self.fitness, self.positions))
+
+	def __repr__(self):
+		""" Returns the string representation of the archive """
+		ret = "- Pareto Archive\n"
+		ret += "\tSize:\t\t %d (max: %d)\n" % (len(self.keys), self.size)
+		ret += "\tInsertions:\t %d\n" % (self.insertions,)
+		if self.violation > 0.0:
+			ret += "\tViolation:\t %.6f\n" % (self.violation,)
+		return ret
+
+	def setMinimax(self, minimax):
+		""" Sets the Consts.minimaxType of all the objectives, the archive is cleared
+
+		:param minimax: the minimax type
+
+		"""
+		self.minimax = minimax
+		self.clear()
+
+	def getFront(self):
+		""" Returns the list of the (fitness, position) solutions """
+		return zip(self.fitness, self.positions)
+
+	def beginStep(self):
+		""" Resets the step counters of insertions and pruned solutions """
+		self.insertions = 0
+		self.pruned = 0
+
+	def key(self, fitness):
+		""" Returns the minimization key of the fitness vector """
+		if self.minimax == Consts.minimaxType["maximize"]:
+			return tuple([-value for value in fitness])
+		return tuple(fitness)
+
+	def insert(self, fitness, position, violation=0.0):
+		""" Inserts the solution if it is not dominated by the archive, the solutions
+		dominated by it are removed. The archive size is not checked, see :meth:`prune`.
+		An infeasible solution is only inserted in an empty archive or in place of
+		a more violated one, a feasible solution replaces the infeasible one.
+
+		:param fitness: the fitness vector
+		:param position: the position, it is copied
+		:param violation: the constraint violation of the solution
+		:rtype: True if the solution was inserted
+
+		"""
+		if self.keys:
+			if violation > 0.0 and violation >= self.violation:
+				return False
+			if violation < self.violation:
+				self.__remove(0, len(self.keys))
+		self.violation = violation
+		key = self.key(fitness)
+		if len(key) == 2:
+			index = self.__locate2D(key)
+		else:
+			index = self.__locate(key)
+		if index is None:
+			return False
+		self.keys.insert(index, key)
+		self.fitness.insert(index, tuple(fitness))
+		self.positions.insert(index, copyPosition(position))
+		self.crowding = None
+		self.insertions += 1
+		return True
+
+	def __locate2D(self, key):
+		""" Binary search of the insertion index of a bi-objective key, removes the
+		dominated run of solutions. Returns None if the key is dominated. """
+		keys = self.keys
+		index = bisect_left(keys, key)
+		if index > 0 and keys[index - 1][1] <= key[1]:
+			return None
+		if index < len(keys) and keys[index] == key:
+			return None
+		end = index
+		while end < len(keys) and keys[end][1] >= key[1]:
+			end += 1
+		if end > index:
+			self.__remove(index, end)
+		return index
+
+	def __locate(self, key):
+		""" Linear scan of the archive, removes the dominated solutions. Returns
+		None if the key is dominated, else the insertion index. """
+		keys = self.keys
+		minimize = Consts.minimaxType["minimize"]
+		dominated = []
+		for index in xrange(len(keys)):
+			other = keys[index]
+			if other == key or dominates(other, key, minimize):
+				return None
+			if dominates(key, other, minimize):
+				dominated.append(index)
+		for index in reversed(dominated):
+			self.__remove(index, index + 1)
+		return len(keys)
+
+	def __remove(self, start, end):
+		""" Removes the solutions in the slice start:end """
+		del self.keys[start:end]
+		del self.fitness[start:end]
+		del self.positions[start:end]
+
+	def crowdingDistance(self):
+		""" Returns the crowding distance of every solution, the extreme
+		solutions of each objective have infinite distance
+
+		:rtype: the list of distances
+
+		"""
+		if self.crowding is not None:
+			return self.crowding
+		keys = self.keys
+		count = len(keys)
+		distance = [0.0] * count
+		if count < 3:
+			self.crowding = [float("inf")] * count
+			return self.crowding
+		for objective in xrange(len(keys[0])):
+			if len(keys[0]) == 2:
+				#The bi-objective archive is already sorted by the objectives
+				order = range(count) if objective == 0 else range(count - 1, -1, -1)
+			else:
+				order = sorted(xrange(count), key=lambda index: keys[index][objective])
+			low, high = keys[order[0]][objective], keys[order[-1]][objective]
+			distance[order[0]] = distance[order[-1]] = float("inf")
+			span = high - low
+			if span <= 0.0:
+				continue
+			for rank in xrange(1, count - 1):
+				index = order[rank]
+				distance[index] += (keys[order[rank + 1]][objective] - keys[order[rank - 1]][objective]) / span
+		self.crowding = distance
+		return distance
+
+	def prune(self):
+		""" Removes the most crowded solutions while the archive is larger than its size """
+		while len(self.keys) > self.size:
+			distance = self.crowdingDistance()
+			index = min(xrange(len(distance)), key=distance.__getitem__)
+			self.__remove(index, index + 1)
+			self.crowding = None
+			self.pruned += 1
+
+	def selectLeader(self):
+		""" Selects a leader by a binary tournament on the crowding distance
+
+		:rtype: the position of the leader
+
+		"""
+		distance = self.crowdingDistance()
+		first = random.randrange(len(distance))
+		second = random.randrange(len(distance))
+		if distance[second] > distance[first]:
+			first = second
+		return self.positions[first]
+
+	def getIdealPoint(self):
+		""" Returns the best value of every objective in the archive """
+		if not self.fitness: return ()
+		if self.minimax == Consts.minimaxType["maximize"]:
+			return tuple([max(values) for values in zip(*self.fitness)])
+		return tuple([min(values) for values in zip(*self.fitness)])
+
+	def getNadirPoint(self):
+		""" Returns the worst value of every objective in the archive """
+		if not self.fitness: return ()
+		if self.minimax == Consts.minimaxType["maximize"]:
+			return tuple([min(values) for values in zip(*self.fitness)])
+		return tuple([max(values) for values in zip(*self.fitness)])
@@ -0,0 +1,190 @@
+'''
+Particle Swarm Optimization - PyPSO
+
+Copyright (c) 2009 Marcel Pinheiro Caraciolo
+caraciol@gmail.com
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+0.10 2026-10-19 Initial version.
+0.11 2026-10-19 The non continuous particles are skipped.
+'''
+
+"""
+
+:mod:`Boundaries` -- boundary handling module
+==============================================================
+
+    This module contains the *boundary handler* functions, which bring back
+    to the search space the particles moved outside of it by the position
+    communicator. The handler is a slot of the topology, applied to the whole
+    swarm after the position update and before the evaluation: ::
+
+        topology.boundary_handler.set(Boundaries.BoundaryReflect)
+
+    The search space is given by the *rangePosmin* and *rangePosmax* params of
+    the particles (defaults are Consts.CDefRangePosition). The particles inside
+    the search space and the non continuous particles (binary, categorical) are
+    skipped.
+
+"""
+
+import Consts
+import random
+
+
+def getPositionRange(pso_engine):
+	""" Returns the (rangePosmin, rangePosmax) params of the particles
+
+	:param pso_engine: the PSO Engine
+	:rtype: the tuple (minimum, maximum)
+
+	"""
+	particle = pso_engine.topology.oneSelfParticle
+	pos_min, pos_max = Consts.CDefRangePosition
+	return (particle.getParam("rangePosmin", pos_min), particle.getParam("rangePosmax", pos_max))
+
+
+def outsideParticles(pso_engine):
+	""" Generator of the (position, velocity) of the particles outside the search space
+
+	:param pso_engine: the PSO Engine
+
+	"""
+	pos_min, pos_max = getPositionRange(pso_engine)
+	for particle in pso_engine.topology.internalSwarm:
+		if not particle.continuous:
+			continue
+		position = particle.position
+		if min(position) < pos_min or max(position) > pos_max:
+			yield position, particle.velocity
+
+
+def BoundaryClampReverse(pso_engine, **args):
+	""" Boundary handler - the position is clamped to the bound and the
+	velocity is reversed, this is the default handler
+
+	:param pso_engine: the PSO Engine
+
+	"""
+	pos_min, pos_max = getPositionRange(pso_engine)
+	for position, velocity in outsideParticles(pso_engine):
+		for i in xrange(len(position)):
+			x = position[i]
+			if x > pos_max:
+				position[i] = pos_max
+				velocity[i] = -velocity[i]
+			elif x < pos_min:
+				position[i] = pos_min
+				velocity[i] = -velocity[i]
+
+
+def BoundaryAbsorb(pso_engine, **args):
+	""" Boundary handler - the position is clamped to the bound and the
+	velocity is set to zero
+
+	:param pso_engine: the PSO Engine
+
+	"""
+	pos_min, pos_max = getPositionRange(pso_engine)
+	for position, velocity in outsideParticles(pso_engine):
+		for i in xrange(len(position)):
+			x = position[i]
+			if x > pos_max:
+				position[i] = pos_max
+				velocity[i] = 0.0
+			elif x < pos_min:
+				position[i] = pos_min
+				velocity[i] = 0.0
+
+
+def BoundaryReflect(pso_engine, **args):
+	""" Boundary handler - the position is mirrored on the bound and the
+	velocity is reversed, positions beyond the whole range are clamped
+
+	:param pso_engine: the PSO Engine
+
+	"""
+	pos_min, pos_max = getPositionRange(pso_engine)
+	for position, velocity in outsideParticles(pso_engine):
+		for i in xrange(len(position)):
+			x = position[i]
+			if x > pos_max:
+				x = 2.0 * pos_max - x
+			elif x < pos_min:
+				x = 2.0 * pos_min - x
+			else:
+				continue
+			if x > pos_max: x = pos_max
+			elif x < pos_min: x = pos_min
+			position[i] = x
+			velocity[i] = -velocity[i]
+
+
+def BoundaryRandom(pso_engine, **args):
+	""" Boundary handler - the coordinates outside the search space are
+	reinitialized at random, the velocity is kept
+
+	:param pso_engine: the PSO Engine
+
+	"""
+	pos_min, pos_max = getPositionRange(pso_engine)
+	uniform = random.uniform
+	for position, velocity in outsideParticles(pso_engine):
+		for i in xrange(len(position)):
+			x = position[i]
+			if x > pos_max or x < pos_min:
+				position[i] = uniform(pos_min, pos_max)
+
+
+def BoundaryPeriodic(pso_engine, **args):
+	""" Boundary handler - the search space is a torus, the position wraps
+	around to the opposite bound and the velocity is kept
+
+	:param pso_engine: the PSO Engine
+
+	"""
+	pos_min, pos_max = getPositionRange(pso_engine)
+	width = pos_max - pos_min
+	for position, velocity in outsideParticles(pso_engine):
+		for i in xrange(len(position)):
+			x = position[i]
+			if x > pos_max or x < pos_min:
+				position[i] = pos_min + (x - pos_min) % width
+
+
+def BoundaryHyperbolic(pso_engine, **args):
+	""" Boundary handler - hyperbolic damping, the step of the particle is
+	damped by the distance to the bound it is moving to,
+	v' = v / (1 + abs(v) / distance), so the particle only approaches the bound.
+	The previous position is recovered from the velocity of the step.
+
+	:param pso_engine: the PSO Engine
+
+	"""
+	pos_min, pos_max = getPositionRange(pso_engine)
+	for position, velocity in outsideParticles(pso_engine):
+		for i in xrange(len(position)):
+			x = position[i]
+			if pos_min <= x <= pos_max:
+				continue
+			v = velocity[i]
+			previous = x - v
+			if previous > pos_max: previous = pos_max
+			elif previous < pos_min: previous = pos_min
+			if v > 0.0:
+				v = v / (1.0 + v / (pos_max - previous)) if pos_max > previous else 0.0
+			else:
+				v = v / (1.0 - v / (previous - pos_min)) if previous > pos_min else 0.0
+			position[i] = previous + v
+			velocity[i] = v
@@ -0,0 +1,150 @@
+'''
+Particle Swarm Optimization - PyPSO
+
+Copyright (c) 2009 Marcel Pinheiro Caraciolo
+caraciol@gmail.com
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+0.10 2026-10-19 Initial version.
+'''
+
+"""
+
+:mod:`Coefficients` -- the velocity coefficients module
+==============================================================
+
+    This module contains the :class:`Coefficients.CoefficientSchedule` class,
+    which computes once per step the coefficients of the velocity update
+    (C1, C2, the constriction factor chi and the inertia weight) for the
+    communicators, and the :func:`Coefficients.constrictionFactor` function.
+
+    All the PSO types share the same velocity update: ::
+
+        v = chi * (w * v + C1 * r1 * (ownBest - x) + C2 * r2 * (globalBest - x))
+
+    with chi = 1 for the BASIC and INERTIA types and w = 1 for the BASIC and
+    CONSTRICTED types, so the schedule exposes the products *inertiaWeight*
+    (chi * w), *cognitive* (chi * C1) and *social* (chi * C2).
+
+"""
+
+import Consts
+import Util
+import math
+
+
+def constrictionFactor(c1, c2):
+	""" Returns the Clerc and Kennedy constriction factor,
+	chi = 2 / abs(2 - fi - sqrt(fi^2 - 4fi)) with fi = C1 + C2
+
+	:param c1: the cognitive coefficient
+	:param c2: the social coefficient
+	:rtype: the constriction factor
+
+	.. note:: C1 + C2 must be greater than 4
+
+	"""
+	fi = c1 + c2
+	if fi <= 4.0:
+		Util.raiseException("C1 + C2 must be > 4 to use the constriction factor", ValueError)
+	return 2.0 / abs(2.0 - fi - math.sqrt(fi * fi - 4.0 * fi))
+
+
+class CoefficientSchedule(object):
+	""" CoefficientSchedule Class - The coefficients of the velocity update of each step
+
+	The initial C1 and C2 values are the *C1* and *C2* attributes of the engine. When
+	the final values are given, the coefficients change linearly along the steps
+	(Time-Varying Acceleration Coefficients, TVAC).
+
+	Example:
+		>>> schedule = Coefficients.CoefficientSchedule()
+		>>> schedule.setTimeVarying(0.5, 2.5)
+		>>> pso_engine.setCoefficients(2.5, 0.5)
+		>>> pso_engine.setCoefficientSchedule(schedule)
+
+	:param c1_final: the C1 value at the last step, None keeps C1 constant
+	:param c2_final: the C2 value at the last step, None keeps C2 constant
+
+	"""
+
+	def __init__(self, c1_final=None, c2_final=None):
+		""" The CoefficientSchedule Class Creator """
+		self.c1Final = c1_final
+		self.c2Final = c2_final
+		self.C1 = None
+		self.C2 = None
+		self.chi = 1.0
+		self.inertia = 1.0
+		#Products used by the communicators
+		self.inertiaWeight = 1.0
+		self.cognitive = None
+		self.social = None
+		#C1 and C2 of the last computed constriction factor
+		self.chiKey = None
+
+	def __repr__(self):
+		""" Returns the string representation of the schedule """
+		ret = "- Coefficient Schedule\n"
+		ret += "\tC1:\t\t %s (final: %s)\n" % (self.C1, self.c1Final)
+		ret += "\tC2:\t\t %s (final: %s)\n" % (self.C2, self.c2Final)
+		ret += "\tChi:\t\t %s\n" % (self.chi,)
+		ret += "\tInertia:\t %s\n" % (self.inertia,)
+		return ret
+
+	def setTimeVarying(self, c1_final, c2_final):
+		""" Sets the final values of C1 and C2 (TVAC)
+
+		Example:
+			>>> schedule.setTimeVarying(*Consts.CDefTVACFinalCoefficients)
+
+		:param c1_final: the C1 value at the last step, None keeps C1 constant
+		:param c2_final: the C2 value at the last step, None keeps C2 constant
+
+		"""
+		self.c1Final = c1_final
+		self.c2Final = c2_final
+
+	def update(self, pso_engine):
+		""" Computes the coefficients of the current step, called once per step by the engine
+
+		:param pso_engine: the PSO Engine
+
+		"""
+		c1, c2 = pso_engine.C1, pso_engine.C2
+		if self.c1Final is not None or self.c2Final is not None:
+			fraction = pso_engine.currentStep / float(pso_engine.timeSteps)
+			if self.c1Final is not None:
+				c1 += (self.c1Final - c1) * fraction
+			if self.c2Final is not None:
+				c2 += (self.c2Final - c2) * fraction
+		self.C1, self.C2 = c1, c2
+
+		pso_type = pso_engine.psoType
+		if pso_type == Consts.psoType["BASIC"]:
+			self.chi, self.inertia = 1.0, 1.0
+		elif pso_type == Consts.psoType["INERTIA"]:
+			pso_engine.updateInertiaFactor()
+			self.chi, self.inertia = 1.0, pso_engine.inertiaFactor
+		elif pso_type == Consts.psoType["CONSTRICTED"]:
+			if self.chiKey != (c1, c2):
+				self.chi = constrictionFactor(c1, c2)
+				self.chiKey = (c1, c2)
+			self.inertia = 1.0
+		else:
+			Util.raiseException("PsoType not yet implemented.", TypeError)
+
+		self.inertiaWeight = self.chi * self.inertia
+		self.cognitive = self.chi * c1
+		self.social = self.chi * c2
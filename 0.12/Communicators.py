@@ -18,6 +18,22 @@ limitations under the License.
 
 0.10 2009-04-16 Initial version.
 0.23 2009-09-10 Changed API, DOCS and name of the class. Reason: Be more generic.
+0.24 2026-10-19 The INERTIA type reads the inertia factor of the step from the engine.
+0.24 2026-10-19 The velocity coefficients are read from the engine coefficient schedule.
+0.24 2026-10-19 The global best is read from the topology snapshot and updated by the topology.
+0.24 2026-10-19 The information communicator compares the constrained particles (Constraints module).
+0.24 2026-10-19 The search space limits were moved to the topology boundary handler (Boundaries module).
+0.24 2026-10-19 Added the Pareto information communicator (multi-objective).
+0.24 2026-10-19 Added the binary (sigmoid) and categorical position communicators.
+0.24 2026-10-19 Added the mixed-variable position communicator.
+0.24 2026-10-19 The predicted fitness (surrogate models) does not update the own best.
+0.24 2026-10-19 The own best keeps its fidelity level (multi-fidelity evaluation).
+0.24 2026-10-19 The partial fitness (evaluations stopped early) does not update the own best.
+0.24 2026-10-19 The own best keeps its sample statistics (noisy evaluation).
+0.24 2026-10-19 The categorical velocity limits are symmetric, scaled to the number of options.
+0.24 2026-10-19 The global velocity limits are read from the particle, symmetric by default.
+0.24 2026-10-19 The Constraints and Archive modules are imported lazily.
+0.24 2026-10-19 The Pareto own best update compares the constraint violations first.
 '''
 
 """
@@ -33,12 +49,19 @@ limitations under the License.
 import Util
 import Consts
 import random
-import math
+
+Constraints = Util.LazyModule("Constraints", context=globals())
+Archive = Util.LazyModule("Archive", context=globals())
 
 def P1DGlobalPosCommunicator(particle,**args):
 	""" Global Communicator - Update method for particle position inside the search space
 	
 		:param particle: the particle to be updated
+		
+	The velocity coefficients are read from the :class:`Coefficients.CoefficientSchedule`
+	of the engine, which computes them once per step for all PSO types. The particles
+	moved outside the search space are handled by the boundary handler of the topology.
+	The velocity limits are given by :meth:`Particle1D.Particle1D.getVelocityRange`.
 	"""
 	try:
 		pso_engine = args["pso_engine"]
@@ -46,48 +69,34 @@ def P1DGlobalPosCommunicator(particle,**args):
 	except:
 		Util.raiseException("to use the P1DGlobalPosCommunicator, you must specify the args['pso_engine'] parameter")
 	
+	coefficients = pso_engine.coefficients
+	weight = coefficients.inertiaWeight
+	cognitive = coefficients.cognitive
+	social = coefficients.social
+	rand = random.random
 	
-	rand = random.Random()
+	velocity = particle.getVelocity()
+	position = particle.getPosition()
+	ownBest = particle.getOwnBestPosition()
+	globalBest = topology.getBestPosition()
 	
+	vel_min, vel_max = particle.getVelocityRange()
 
-	for i in xrange(len(particle.getPosition())):
+	for i in xrange(len(position)):
+		x = position[i]
 		
 		#Update velocity
-		if pso_engine.psoType == Consts.psoType["BASIC"]:
-			particle.getVelocity()[i] = particle.getVelocity()[i] + pso_engine.C1 * rand.random() * (particle.getOwnBestPosition()[i] - particle.getPosition()[i]) + \
-										pso_engine.C2 * rand.random() * (topology.getBestParticle().getOwnBestPosition()[i] - particle.getPosition()[i])
-		elif pso_engine.psoType == Consts.psoType["INERTIA"]:
-
-			particle.getVelocity()[i] = Pso.PSO().getInertiaFactor() * particle.getVelocity()[i] + pso_engine.C1 * rand.random() * (particle.getOwnBestPosition()[i] - particle.getPosition()[i]) + \
-										pso_engine.C2* rand.random() * (topology.getBestParticle().getOwnBestPosition()[i] - particle.getPosition()[i])
-		elif pso_engine.psoType == Consts.psoType["CONSTRICTED"]:
-			fi = pso_engine.C1 + pso_engine.C2
-
-			k = 2.0 / abs(2.0 - fi - math.sqrt(math.pow(fi,2) - 4 * fi))
-
-			particle.getVelocity()[i] = k * (particle.getVelocity()[i] + pso_engine.C1 * rand.random() * (particle.getOwnBestPosition()[i] - particle.getPosition()[i]) + \
-										pso_engine.C2 * rand.random() * (topology.getBestParticle().getOwnBestPosition()[i] - particle.getPosition()[i]))    
-			
-                                           
-		else:
-			Util.raiseException("PsoType not yet implemented.",TypeError)
+		v = weight * velocity[i] + cognitive * rand() * (ownBest[i] - x) + social * rand() * (globalBest[i] - x)
             
 		#Velocity limit
- 		if particle.getVelocity()[i] > particle.getParam("rangeVelmax",100):
-			particle.getVelocity()[i] = particle.getParam("rangeVelmax",100)
-		elif particle.getVelocity()[i] < particle.getParam("rangeVelmin",0):
-			particle.getVelocity()[i] = particle.getParam("rangeVelmin",0)
+		if v > vel_max:
+			v = vel_max
+		elif v < vel_min:
+			v = vel_min
      
+		velocity[i] = v
 		#Update position
-		particle.getPosition()[i] = particle.getPosition()[i] + particle.getVelocity()[i]
- 		#Search space limit
-		if particle.getPosition()[i] > particle.getParam("rangePosmax",100):
-			particle.getPosition()[i] = particle.getParam("rangePosmax",100)
-			particle.getVelocity()[i] = particle.getVelocity()[i] * (-1)
-		
-		elif particle.getPosition()[i] < particle.getParam("rangePosmin",-100):
-			particle.getPosition()[i] = particle.getParam("rangePosmin",-100)
-			particle.getVelocity()[i] = particle.getVelocity()[i] * (-1)
+		position[i] = x + v
 	
 	
 def P1DGlobalInfoCommunicator(particle,**args):
@@ -97,6 +106,13 @@ def P1DGlobalInfoCommunicator(particle,**args):
 		
 		You must specify the pso_engine parameter with args["pso_engine"] with 
 		the :class:`Pso.SimplePSO`  instance.
+		
+		Only the own best of the particle is updated, the global best is found by
+		the topology once per step (:meth:`TopologyBase.TopologyBase.updateBestParticle`).
+		The particles with constraints are compared by :func:`Constraints.isOwnBestImproved`.
+		The fitness predicted by a surrogate model never updates the own best, nor
+		a partial fitness (evaluation stopped early) or a fitness of lower fidelity
+		than the fidelity of the own best.
 
 	"""
 	try:
@@ -104,22 +120,214 @@ def P1DGlobalInfoCommunicator(particle,**args):
 	except:
 		Util.raiseException("to use the P1DGlobalInfoCommunicator, you must specify the args['topology'] parameter")
 	
-	if pso_engine.minimax == Consts.minimaxType["maximize"]:
-		#update globalParticle information
+	if particle.predicted or particle.partial or particle.fidelity < particle.ownBestFidelity:
+		return
+	
+	if not particle.constraints.isEmpty():
+		improved = Constraints.isOwnBestImproved(particle, pso_engine.minimax)
+	elif pso_engine.minimax == Consts.minimaxType["maximize"]:
+		improved = particle.getFitness() > particle.getOwnBestFitness()
+	else:
+		improved = particle.getFitness() < particle.getOwnBestFitness()
+	
+	if improved:
+		particle.setOwnBestFitness(particle.getFitness())
+		particle.setOwnBestPosition(particle.getPosition())
+		particle.ownBestViolation = particle.violation
+		particle.ownBestFidelity = particle.fidelity
+		particle.ownBestSamples = particle.samples
+		pso_engine.topology.improvements += 1
+
+
+def P1DParetoInfoCommunicator(particle,**args):
+	""" Pareto Communicator - Update method for particle information (fitness vector)
+
+		:param particle: the particle to be updated
 		
-		if (particle.getFitness() > particle.getOwnBestFitness()):
-			particle.setOwnBestFitness(particle.getFitness())
-			particle.setOwnBestPosition(particle.getPosition())
+		You must specify the pso_engine parameter with args["pso_engine"] with 
+		the :class:`Pso.SimplePSO`  instance.
 		
-		#update topology swarm information
-		if particle.getOwnBestFitness() > pso_engine.topology.getBestParticle().getOwnBestFitness():
-			pso_engine.topology.setBestParticle(particle)
+		The own best is replaced when the new solution dominates it (the violations
+		are compared first, see :func:`Archive.constrainedDominates`), when neither
+		dominates the other, it is replaced with probability 0.5. The archive is
+		updated by the :class:`MultiObjectiveTopology.MultiObjectiveTopology`.
 
-	else:
-		#update global Particle information
-		if (particle.getFitness() < particle.getOwnBestFitness()):
-			particle.setOwnBestFitness(particle.getFitness())
-			particle.setOwnBestPosition(particle.getPosition())
-        #update topology swarm information
-		if particle.getOwnBestFitness() < pso_engine.topology.getBestParticle().getOwnBestFitness():
-			pso_engine.topology.setBestParticle(particle)
\ No newline at end of file
+	"""
+	try:
+		pso_engine = args["pso_engine"]
+	except:
+		Util.raiseException("to use the P1DParetoInfoCommunicator, you must specify the args['pso_engine'] parameter")
+	
+	if particle.rejected:
+		return
+	fitness, ownBest = particle.getFitness(), particle.getOwnBestFitness()
+	violation, ownBestViolation = particle.violation, particle.ownBestViolation
+	if Archive.constrainedDominates(fitness, violation, ownBest, ownBestViolation, pso_engine.minimax):
+		pso_engine.topology.improvements += 1
+	elif Archive.constrainedDominates(ownBest, ownBestViolation, fitness, violation, pso_engine.minimax) or random.random() >= 0.5:
+		return
+	particle.setOwnBestFitness(fitness)
+	particle.setOwnBestPosition(particle.getPosition())
+	particle.ownBestViolation = particle.violation
+
+
+def P1DBinaryPosCommunicator(particle,**args):
+	""" Binary Communicator - Update method for the :class:`ParticleBinary.ParticleBinary` position
+	
+		:param particle: the particle to be updated
+		
+	The velocity is updated for all the bits at once with numpy arrays, clamped to the
+	*rangeVelmin* and *rangeVelmax* params (defaults are Consts.CDefBinaryVelocityRange),
+	and each bit is set with probability sigmoid(velocity).
+	"""
+	try:
+		pso_engine = args["pso_engine"]
+		topology = pso_engine.topology
+	except:
+		Util.raiseException("to use the P1DBinaryPosCommunicator, you must specify the args['pso_engine'] parameter")
+	
+	from ParticleBinary import numpy, unpackBits
+	coefficients = pso_engine.coefficients
+	size = len(particle)
+	rand = particle.getRandomState().random_sample
+	
+	vel_min, vel_max = Consts.CDefBinaryVelocityRange
+	vel_max = particle.getParam("rangeVelmax", vel_max)
+	vel_min = particle.getParam("rangeVelmin", vel_min)
+	
+	bits = particle.getBits().astype(numpy.float64)
+	ownBest = unpackBits(particle.getOwnBestPosition(), size)
+	globalBest = unpackBits(topology.getBestPosition(), size)
+	
+	velocity = particle.getVelocity()
+	velocity *= coefficients.inertiaWeight
+	velocity += coefficients.cognitive * rand(size) * (ownBest - bits)
+	velocity += coefficients.social * rand(size) * (globalBest - bits)
+	numpy.clip(velocity, vel_min, vel_max, out=velocity)
+	
+	particle.setBits(rand(size) * (1.0 + numpy.exp(-velocity)) < 1.0)
+
+
+def P1DCategoricalPosCommunicator(particle,**args):
+	""" Categorical Communicator - Update method for the :class:`Particle1D.Particle1D` whose
+	position is the list of the option indexes of the *dimmension* param, a
+	:class:`PsoDimmension.PsoDimmensions` of :class:`PsoDimmension.DimmensionList`
+	
+		:param particle: the particle to be updated
+		
+	The velocity is real, the new position is rounded to the nearest option index and
+	limited to the options of the dimmension. The options are read with
+	:meth:`PsoDimmension.PsoDimmensions.decode`. The velocity limits are the
+	*rangeVelmin* and *rangeVelmax* params, the default limits are -/+ the number
+	of options of the dimmension times the *velocityFraction* param (default is
+	Consts.CDefVelocityFraction), use it with the
+	:func:`Initializators.P1DVelListInitializatorCategorical` velocity initializator.
+	"""
+	try:
+		pso_engine = args["pso_engine"]
+		topology = pso_engine.topology
+	except:
+		Util.raiseException("to use the P1DCategoricalPosCommunicator, you must specify the args['pso_engine'] parameter")
+	
+	dimmension = particle.getParam("dimmension", None)
+	if dimmension is None:
+		Util.raiseException("to use the P1DCategoricalPosCommunicator, you must specify the 'dimmension' parameter")
+	
+	coefficients = pso_engine.coefficients
+	weight = coefficients.inertiaWeight
+	cognitive = coefficients.cognitive
+	social = coefficients.social
+	rand = random.random
+	
+	velocity = particle.getVelocity()
+	position = particle.getPosition()
+	ownBest = particle.getOwnBestPosition()
+	globalBest = topology.getBestPosition()
+	
+	for i in xrange(len(position)):
+		options = len(dimmension[i])
+		vel_min, vel_max = Util.velocityRange(particle, options)
+		x = position[i]
+		v = weight * velocity[i] + cognitive * rand() * (ownBest[i] - x) + social * rand() * (globalBest[i] - x)
+		if v > vel_max:
+			v = vel_max
+		elif v < vel_min:
+			v = vel_min
+		velocity[i] = v
+		
+		x = int(round(x + v))
+		last = options - 1
+		if x > last:
+			x = last
+		elif x < 0:
+			x = 0
+		position[i] = x
+
+
+def P1DMixedPosCommunicator(particle,**args):
+	""" Mixed Communicator - Update method for the :class:`ParticleMixed.ParticleMixed` position
+	
+		:param particle: the particle to be updated
+		
+	Each block has its own update rule:
+	
+	**real**
+		The usual velocity update, the velocity is limited to the width of the range,
+		the position is clamped to the range and the velocity is reversed.
+	
+	**integer**
+		The same velocity update, the position is rounded to the nearest integer.
+	
+	**categorical**
+		Each dimmension keeps its option, or takes the option of its own best or of the
+		global best with probabilities proportional to the inertia weight, the cognitive
+		and the social coefficients. With the *categoricalMutation* param probability
+		(default is Consts.CDefCategoricalMutation) a random option is taken.
+	
+	The global best is the own best of the best particle of the topology.
+	"""
+	try:
+		pso_engine = args["pso_engine"]
+		topology = pso_engine.topology
+	except:
+		Util.raiseException("to use the P1DMixedPosCommunicator, you must specify the args['pso_engine'] parameter")
+	
+	from ParticleMixed import numpy
+	coefficients = pso_engine.coefficients
+	weight = coefficients.inertiaWeight
+	cognitive = coefficients.cognitive
+	social = coefficients.social
+	rand = particle.getRandomState().random_sample
+	
+	real, integer, categorical = particle.getPosition()
+	ownReal, ownInt, ownCat = particle.getOwnBestPosition()
+	bestReal, bestInt, bestCat = topology.getBestParticle().getOwnBestPosition()
+	realVel, intVel = particle.getVelocity()
+	
+	for x, velocity, ownBest, globalBest, low, high in ((real, realVel, ownReal, bestReal, particle.realMin, particle.realMax),
+											(integer, intVel, ownInt, bestInt, particle.intMin, particle.intMax)):
+		size = len(x)
+		if size == 0:
+			continue
+		velocity *= weight
+		velocity += cognitive * rand(size) * (ownBest - x)
+		velocity += social * rand(size) * (globalBest - x)
+		span = high - low
+		numpy.clip(velocity, -span, span, out=velocity)
+		moved = x + velocity
+		if x.dtype.kind == "i":
+			moved = numpy.rint(moved)
+		outside = (moved < low) | (moved > high)
+		velocity[outside] *= -1.0
+		x[:] = numpy.clip(moved, low, high)
+	
+	size = len(categorical)
+	if size:
+		choice = rand(size) * (weight + cognitive + social)
+		fromOwn = (choice >= weight) & (choice < weight + cognitive)
+		fromBest = choice >= weight + cognitive
+		categorical[fromOwn] = ownCat[fromOwn]
+		categorical[fromBest] = bestCat[fromBest]
+		mutation = rand(size) < particle.getParam("categoricalMutation", Consts.CDefCategoricalMutation)
+		if mutation.any():
+			categorical[mutation] = (rand(size)[mutation] * particle.catSize[mutation]).astype(numpy.int64)
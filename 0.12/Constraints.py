@@ -0,0 +1,178 @@
+'''
+Particle Swarm Optimization - PyPSO
+
+Copyright (c) 2009 Marcel Pinheiro Caraciolo
+caraciol@gmail.com
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+0.10 2026-10-19 Initial version.
+'''
+
+"""
+
+:mod:`Constraints` -- constraint handling module
+==============================================================
+
+    This module contains the constraint functions and the *repair* operators
+    of the particles. A constraint function is added to the *constraints* slot
+    of the particle and returns the violation of the particle (0.0 when it is
+    satisfied), the violation of the particle is the sum of all the constraints: ::
+
+        particle.constraints.add(Constraints.Inequality(g1))
+        particle.constraints.add(Constraints.Equality(h1, tolerance=1e-4))
+        particle.repairer.set(Constraints.RepairBisection)
+        particle.setParams(constraintHandling=Consts.constraintHandling["feasibility"])
+
+    The *constraintHandling* param of the particle selects how the violation is used:
+
+    **penalty**
+        The fitness is penalized with *penaltyFactor* * violation.
+
+    **feasibility**
+        The particles are compared by the Deb feasibility rules: a feasible particle
+        beats an infeasible one, two feasible particles are compared by the fitness
+        and two infeasible particles by the violation. The infeasible particles which
+        cannot beat their own best are rejected without calling the evaluator.
+
+"""
+
+import Consts
+
+
+def Inequality(func):
+	""" Creates an inequality constraint g(x) <= 0
+
+	Example:
+		>>> def g1(particle):
+		>>>		return sum(particle.position) - 10.0
+		>>> particle.constraints.add(Constraints.Inequality(g1))
+
+	:param func: the function g, called with the particle
+	:rtype: the constraint function, its violation is max(0, g(x))
+
+	"""
+	def constraint(particle, **args):
+		value = func(particle)
+		return value if value > 0.0 else 0.0
+	constraint.func_name = func.func_name
+	constraint.func_doc = func.func_doc
+	return constraint
+
+
+def Equality(func, tolerance=None):
+	""" Creates an equality constraint h(x) = 0
+
+	Example:
+		>>> particle.constraints.add(Constraints.Equality(h1, tolerance=1e-3))
+
+	:param func: the function h, called with the particle
+	:param tolerance: the tolerance of the equality, default is Consts.CDefEqualityTolerance
+	:rtype: the constraint function, its violation is max(0, abs(h(x)) - tolerance)
+
+	"""
+	if tolerance is None:
+		tolerance = Consts.CDefEqualityTolerance
+	def constraint(particle, **args):
+		value = abs(func(particle)) - tolerance
+		return value if value > 0.0 else 0.0
+	constraint.func_name = func.func_name
+	constraint.func_doc = func.func_doc
+	return constraint
+
+
+def isFeasibilityHandling(particle):
+	""" Returns True if the particle uses the Deb feasibility rules
+
+	:param particle: the particle
+	:rtype: True or False
+
+	"""
+	handling = particle.getParam("constraintHandling", Consts.CDefConstraintHandling)
+	return handling == Consts.constraintHandling["feasibility"]
+
+
+def isBetter(fitness, violation, other_fitness, other_violation, minimax):
+	""" Compares two solutions by the Deb feasibility rules
+
+	:param fitness: the fitness of the first solution
+	:param violation: the violation of the first solution
+	:param other_fitness: the fitness of the second solution
+	:param other_violation: the violation of the second solution
+	:param minimax: the Consts.minimaxType of the optimization
+	:rtype: True if the first solution is strictly better than the second
+
+	"""
+	if violation > 0.0 or other_violation > 0.0:
+		return violation < other_violation
+	if minimax == Consts.minimaxType["maximize"]:
+		return fitness > other_fitness
+	return fitness < other_fitness
+
+
+def isOwnBestImproved(particle, minimax):
+	""" Returns True if the current solution of a constrained particle is
+	better than its own best, with the comparison of its *constraintHandling*
+
+	:param particle: the particle
+	:param minimax: the Consts.minimaxType of the optimization
+	:rtype: True or False
+
+	"""
+	if particle.rejected:
+		return False
+	if isFeasibilityHandling(particle):
+		return isBetter(particle.fitness, particle.violation, particle.ownBestFitness,
+							particle.ownBestViolation, minimax)
+	if minimax == Consts.minimaxType["maximize"]:
+		return particle.fitness > particle.ownBestFitness
+	return particle.fitness < particle.ownBestFitness
+
+
+def RepairOwnBest(particle, **args):
+	""" Repair operator - moves an infeasible particle back to its own best
+	position, when the own best is feasible
+
+	:param particle: the particle to be repaired
+
+	"""
+	if particle.violation > 0.0 and particle.ownBestViolation == 0.0:
+		particle.position[:] = particle.ownBestPosition
+
+
+def RepairBisection(particle, **args):
+	""" Repair operator - searches the segment between the infeasible position and
+	the feasible own best position by bisection, the particle is moved to the
+	feasible point found nearest to its position. Only the constraints are evaluated,
+	the number of bisections is the *repairSteps* param (default is Consts.CDefRepairSteps).
+
+	:param particle: the particle to be repaired
+
+	"""
+	if particle.violation == 0.0 or particle.ownBestViolation > 0.0:
+		return
+	position = particle.position
+	target = position[:]
+	ownBest = particle.ownBestPosition
+	#Fractions of the segment ownBest -> target known to be feasible and infeasible
+	feasible, infeasible = 0.0, 1.0
+	for step in xrange(particle.getParam("repairSteps", Consts.CDefRepairSteps)):
+		middle = (feasible + infeasible) * 0.5
+		for i in xrange(len(position)):
+			position[i] = ownBest[i] + (target[i] - ownBest[i]) * middle
+		if particle.evaluateConstraints(**args) > 0.0:
+			infeasible = middle
+		else:
+			feasible = middle
+	for i in xrange(len(position)):
+		position[i] = ownBest[i] + (target[i] - ownBest[i]) * feasible
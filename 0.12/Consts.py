@@ -20,6 +20,22 @@ limitations under the License.
 0.11 2009-05-25 Added constants for ReportFileCSV Adapter (Reports).
 0.12 2009-05-28 Added constants for ReportDB Adapter (Reports).
 0.23 2009-09-09 Redesigned constants for new API and Docs.
+0.24 2026-10-19 Added constants for the Step Profiler and the Interactive Listener.
+0.24 2026-10-19 Added constants for the termination criteria.
+0.24 2026-10-19 Added constants for the inertia schedules and TVAC coefficients.
+0.24 2026-10-19 Added constants for the constraint handling.
+0.24 2026-10-19 Added constants for the search space ranges and the boundary handlers.
+0.24 2026-10-19 Added constants for the multi-objective topology.
+0.24 2026-10-19 Added constants for the binary particle.
+0.24 2026-10-19 Added constants for the mixed-variable particle.
+0.24 2026-10-19 Added constants for the parameter sweep.
+0.24 2026-10-19 Added constants for the racing tuning.
+0.24 2026-10-19 Added constants for the surrogate models.
+0.24 2026-10-19 Added constants for the multi-fidelity evaluation.
+0.24 2026-10-19 Added constants for the cooperative PSO.
+0.24 2026-10-19 Added constants for the ensemble velocity limits.
+0.24 2026-10-19 Added the default velocity limit of the categorical particles.
+0.24 2026-10-19 The default velocity limits of the 1D List particles are symmetric, scaled to the search space.
 
 '''
 
@@ -52,6 +68,14 @@ General constants
 
    The ESC key ASCII code. Used to start Interactive Mode.
 
+.. attribute:: CDefInteractivePollTime
+
+   Default key polling interval (seconds) of the Interactive Mode listener thread.
+
+.. attribute:: CDefInteractiveFreq
+
+   Default step frequency the PSO Engine checks the Interactive Mode request.
+
 TopologyBase constants (:class:`TopologyBase.TopologyBase`)
 ----------------------------------------------------------------------------
 
@@ -67,6 +91,14 @@ TopologyBase constants (:class:`TopologyBase.TopologyBase`)
 
    Default scaling scheme.
 
+.. attribute:: CDefBoundaryHandler
+
+   Default boundary handler of the topology (see :mod:`Boundaries`).
+
+.. attribute:: CDefArchiveSize
+
+   Default maximum size of the Pareto archive of the multi-objective topology.
+
 
 1D List particle constants (:class:`Particle1D.Particle1D`)
 ----------------------------------------------------------------------------
@@ -87,6 +119,87 @@ TopologyBase constants (:class:`TopologyBase.TopologyBase`)
 
    Default initializator for the particle position communicator
 
+.. attribute:: CDefRangePosition
+
+   Default (rangePosmin, rangePosmax) search space of the particles.
+
+.. attribute:: CDefVelocityFraction
+
+   Default velocity limit of the particles and of the engines (:class:`Ensemble.EnsemblePSO`,
+   :class:`Cooperative.CooperativePSO`), as a fraction of the width of the search space or of the
+   number of options of a categorical dimmension (see :func:`Util.velocityRange`).
+
+
+Binary particle constants (:class:`ParticleBinary.ParticleBinary`)
+----------------------------------------------------------------------------
+
+.. attribute:: CDefBinaryPosInit
+
+   Default position initializator of the binary particle.
+
+.. attribute:: CDefBinaryVelInit
+
+   Default velocity initializator of the binary particle.
+
+.. attribute:: CDefBinaryPosCommunicator
+
+   Default position communicator of the binary particle.
+
+.. attribute:: CDefBinaryVelocityRange
+
+   Default velocity range of the binary particle, it limits the probability of the bits.
+
+
+Mixed-variable particle constants (:class:`ParticleMixed.ParticleMixed`)
+----------------------------------------------------------------------------
+
+.. attribute:: CDefMixedPosInit
+
+   Default position initializator of the mixed-variable particle.
+
+.. attribute:: CDefMixedVelInit
+
+   Default velocity initializator of the mixed-variable particle.
+
+.. attribute:: CDefMixedPosCommunicator
+
+   Default position communicator of the mixed-variable particle.
+
+.. attribute:: CDefMixedCacheSize
+
+   Default maximum size of the evaluation cache of the mixed-variable particles.
+
+.. attribute:: CDefCategoricalMutation
+
+   Default probability of a random option in the categorical block.
+
+
+Constraint handling constants (:mod:`Constraints`)
+----------------------------------------------------------------------------
+
+.. attribute:: constraintHandling
+
+   The constraint handling type of the particles, penalty or feasibility rules.
+
+   Example:
+      >>> particle.setParams(constraintHandling=Consts.constraintHandling["penalty"])
+
+.. attribute:: CDefConstraintHandling
+
+   Default constraint handling type.
+
+.. attribute:: CDefPenaltyFactor
+
+   Default factor of the violation penalty.
+
+.. attribute:: CDefEqualityTolerance
+
+   Default tolerance of the equality constraints.
+
+.. attribute:: CDefRepairSteps
+
+   Default number of bisections of :func:`Constraints.RepairBisection`.
+
 
 
 PSO Engine constants (:class:`PSO.SimplePSO`)
@@ -100,6 +213,10 @@ PSO Engine constants (:class:`PSO.SimplePSO`)
 
    Default social and cognitive coefficients (C1 and C2).
 
+.. attribute:: CDefTVACFinalCoefficients
+
+   Usual final C1 and C2 of the Time-Varying Acceleration Coefficients, starting from (2.5, 0.5).
+
 .. attribute:: CDefPsoType
 
    Default PSO type (Basic, Inertia or Constricted).
@@ -108,6 +225,53 @@ PSO Engine constants (:class:`PSO.SimplePSO`)
 
    Default swarm size.
 
+.. attribute:: CDefStagnationSteps
+
+   Default number of steps without improvement for :func:`Pso.StagnationCriteria`.
+
+.. attribute:: CDefToleranceAbs
+
+   Default absolute fitness tolerance for :func:`Pso.ToleranceCriteria`.
+
+.. attribute:: CDefToleranceRel
+
+   Default relative fitness tolerance for :func:`Pso.ToleranceCriteria`.
+
+.. attribute:: CDefToleranceSteps
+
+   Default number of steps without improvement above the tolerance for :func:`Pso.ToleranceCriteria`.
+
+.. attribute:: CDefDiameterMin
+
+   Default minimum swarm diameter for :func:`Pso.DiameterCriteria`.
+
+.. attribute:: CDefRestartPopInc
+
+   Default swarm size multiplier applied at each restart of the swarm.
+
+.. attribute:: CDefInertiaSchedule
+
+   Default inertia schedule of the INERTIA PSO type.
+
+.. attribute:: CDefInertiaRange
+
+   Default maximum and minimum inertia weights of the inertia schedules.
+
+.. attribute:: CDefInertia
+
+   Default inertia weight of :func:`Inertia.InertiaConstant`.
+
+.. attribute:: CDefInertiaDecay
+
+   Default decay rate of :func:`Inertia.InertiaExponentialDecay`.
+
+Step Profiler constants (:class:`Profiler.StepProfiler`)
+----------------------------------------------------------------------------
+
+.. attribute:: CDefProfilerPhases
+
+   The phases of a step timed by the profiler.
+
 Report Adapters constants (:mod:`ReportAdapters`)
 ----------------------------------------------------------------------------
 Constants for the Report Adapters
@@ -132,6 +296,14 @@ SQLite3 Report Adapter Constants (:class:`ReportAdapters.ReportDB`)
 
    Default particles statistical table name.
 
+.. attribute:: CDefReportDBDivTable
+
+   Default diversity statistical table name.
+
+.. attribute:: CDefReportDBProfTable
+
+   Default step profiler table name.
+
 
 .. attribute:: CDefDBStatsGenFreq
 
@@ -153,11 +325,109 @@ CSV File DB Adapter Constants (:class:`ReportAdapters.ReportFileCSV`)
 
    Default generational frequency for dump statistics.
 
+.. attribute:: CDefCSVProfileFileName
+
+   The default CSV filename to dump the step profiler timings.
+
+Parameter Sweep constants (:class:`Sweep.Sweep`)
+----------------------------------------------------------------------------
+
+.. attribute:: CDefSweepDBName
+
+   Default database filename of the sweep results.
+
+.. attribute:: CDefSweepTable
+
+   Default table name of the sweep results.
+
+.. attribute:: CDefSweepIdentify
+
+   Default identify of a sweep in the database.
+
+.. attribute:: CDefSweepTasksPerChild
+
+   Default number of runs done by a worker process before it is replaced.
+
+Racing constants (:class:`Racing.Race`)
+----------------------------------------------------------------------------
+
+.. attribute:: CDefRaceAlpha
+
+   Default significance level of the Friedman test.
+
+.. attribute:: CDefRaceFirstTest
+
+   Default number of instances done before the first test.
+
+Surrogate constants (:mod:`Surrogate`)
+----------------------------------------------------------------------------
+
+.. attribute:: CDefSurrogateArchiveSize
+
+   Default number of evaluated positions kept by the surrogate model.
+
+.. attribute:: CDefSurrogateNugget
+
+   Default regularization of the kernel matrix of the surrogate model.
+
+.. attribute:: CDefSurrogateKappa
+
+   Default weight of the deviation in the lower confidence bound of the prescreening.
+
+.. attribute:: CDefSurrogateMinPoints
+
+   Default number of evaluated positions before the prescreening starts.
+
+Evaluators constants (:mod:`Evaluators`)
+----------------------------------------------------------------------------
+
+.. attribute:: fidelityLevel
+
+   The fidelity levels of the evaluations, passed to the evaluator functions
+   as the *fidelity* argument.
+
+   Example:
+      >>> def objective(particle, fidelity=Consts.fidelityLevel["high"]):
+      >>>    (...)
+
+.. attribute:: CDefFidelity
+
+   Default fidelity of the evaluations (high).
+
+.. attribute:: CDefFidelityMargin
+
+   Default relative margin to the own best for the promotion to high fidelity.
+
+.. attribute:: CDefFidelityWindow
+
+   Default number of the last (low, high) fidelity fitness pairs used to calibrate the low fidelity.
+
+.. attribute:: CDefNoiseBudget
+
+   Default budget of the re-evaluations of the noisy evaluation per step, as a fraction of the swarm size.
+
+.. attribute:: CDefNoiseConfidence
+
+   Default separation (in standard errors) of the fitness means above which a comparison is not re-evaluated.
+
+Cooperative constants (:mod:`Cooperative`)
+----------------------------------------------------------------------------
+
+.. attribute:: CDefGroupSize
+
+   Default number of dimmensions of the groups of the cooperative PSO.
+
+.. attribute:: CDefGroupingEpsilon
+
+   Default threshold of the fitness differences of the differential grouping.
+
 
 """
 
 import Initializators
 import Communicators
+import Inertia
+import Boundaries
 
 
 # Types of sort
@@ -173,6 +443,8 @@ CDefPythonRequire = (2,5)
 
 
 CDefESCKey = 27
+CDefInteractivePollTime = 0.1
+CDefInteractiveFreq = 1
 
 
 # - Particle1D defaults
@@ -181,6 +453,33 @@ CDefP1DPosListInit      = Initializators.P1DPosListInitializatorReal
 CDefP1DVelListInit      = Initializators.P1DVelListInitializatorReal
 P1DInfoCommunicator =  Communicators.P1DGlobalInfoCommunicator
 P1DPosCommunicator = Communicators.P1DGlobalPosCommunicator
+CDefRangePosition = (-100.0, 100.0)
+CDefVelocityFraction = 0.5
+
+# - ParticleBinary defaults
+CDefBinaryPosInit = Initializators.P1DBinaryStringInitializator
+CDefBinaryVelInit = Initializators.P1DBinaryVelInitializator
+CDefBinaryPosCommunicator = Communicators.P1DBinaryPosCommunicator
+CDefBinaryVelocityRange = (-4.0, 4.0)
+
+# - ParticleMixed defaults
+CDefMixedPosInit = Initializators.P1DMixedInitializator
+CDefMixedVelInit = Initializators.P1DMixedVelInitializator
+CDefMixedPosCommunicator = Communicators.P1DMixedPosCommunicator
+CDefMixedCacheSize = 100000
+CDefCategoricalMutation = 0.02
+
+# Constraint handling types
+# - penalty: the violation penalizes the fitness
+# - feasibility: the Deb feasibility rules
+constraintHandling = {
+   "penalty"     : 0,
+   "feasibility" : 1
+}
+CDefConstraintHandling = constraintHandling["feasibility"]
+CDefPenaltyFactor = 1e6
+CDefEqualityTolerance = 1e-4
+CDefRepairSteps = 8
 
 #PSO Engine defaults
 
@@ -207,22 +506,79 @@ minimaxType = { "minimize" : 0,
                }
 #Social and Cognitive Coefficients (C1 and C2)
 CDefCoefficients = (2.05,2.05)
+CDefTVACFinalCoefficients = (0.5,2.5)
+
+#Termination criteria defaults
+CDefStagnationSteps = 100
+CDefToleranceAbs = 0.0
+CDefToleranceRel = 1e-6
+CDefToleranceSteps = 50
+CDefDiameterMin = 1e-6
+
+#Restart defaults
+CDefRestartPopInc = 2.0
+
+#Inertia defaults
+CDefInertiaSchedule = Inertia.InertiaLinearDecay
+CDefInertiaRange = (0.9, 0.4)
+CDefInertia = 0.7298
+CDefInertiaDecay = 5.0
 
 
 # - TopologyBase Defaults
 CDefSwarmSortType               = sortType["fitness"]
 CDefSwarmMinimax                = minimaxType["minimize"]
 CDefSwarmSize 					= 30
+CDefBoundaryHandler             = Boundaries.BoundaryClampReverse
+CDefArchiveSize                 = 100
+
+# - Step Profiler defaults
+CDefProfilerPhases = ("position", "evaluation", "information", "callbacks",
+                      "statistics", "report", "interactive")
 
 
 # - Report Adapters CSV File defaults
 CDefCSVFileName = "pypso.csv"
 CDefCSVFileStatsGenFreq = 1
+CDefCSVProfileFileName = "pypso_profile.csv"
 
 # - DB Adapters defaults
 CDefDBName = "simulationPSO.db"
 CDefReportDBSwarmTable = "swarm"
 CDefReportDBTopTable = "topology"
 CDefSQLiteDBPartTable = "particles"
+CDefReportDBDivTable = "diversity"
+CDefReportDBProfTable = "profile"
 CDefDBStatsGenFreq = 1
-CDefDBStatsCommitFreq = 500
\ No newline at end of file
+CDefDBStatsCommitFreq = 500
+
+# - Parameter Sweep defaults
+CDefSweepDBName = "pypso_sweep.db"
+CDefSweepTable = "sweep"
+CDefSweepIdentify = "sweep"
+CDefSweepTasksPerChild = 10
+
+# - Racing defaults
+CDefRaceAlpha = 0.05
+CDefRaceFirstTest = 5
+
+# - Surrogate defaults
+CDefSurrogateArchiveSize = 200
+CDefSurrogateNugget = 1e-6
+CDefSurrogateKappa = 1.0
+CDefSurrogateMinPoints = 20
+
+# - Evaluators defaults
+fidelityLevel = {
+   "low"  : 0,
+   "high" : 1
+}
+CDefFidelity = fidelityLevel["high"]
+CDefFidelityMargin = 0.05
+CDefFidelityWindow = 50
+CDefNoiseBudget = 1.0
+CDefNoiseConfidence = 2.0
+
+# - Cooperative defaults
+CDefGroupSize = 50
+CDefGroupingEpsilon = 1e-3
@@ -0,0 +1,640 @@
+'''
+Particle Swarm Optimization - PyPSO
+
+Copyright (c) 2009 Marcel Pinheiro Caraciolo
+caraciol@gmail.com
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+0.10 2026-10-19 Initial version.
+0.11 2026-10-19 The default velocity limits are symmetric, a fraction of the search space.
+0.11 2026-10-19 The regrouping keeps the own best scores of the unchanged groups.
+'''
+
+"""
+
+:mod:`Cooperative` -- the cooperative PSO for the large dimmensions
+==============================================================
+
+    This module contains the :class:`Cooperative.CooperativePSO` class, the
+    cooperative PSO (CPSO-S_k) of the problems with many dimmensions. The
+    dimmensions are decomposed in groups and every group is optimized by its own
+    sub-swarm, whose particles are blocks of the position. A block is evaluated
+    in the *context vector*, the best known position, with the block in place of
+    the dimmensions of its group; the context vector is updated as soon as a
+    sub-swarm finds a better block.
+
+    The groups are given by the *grouping* functions: the static groups of
+    :func:`StaticGrouping`, the random regrouping of :func:`RandomGrouping` (new
+    groups every cycle) or the interacting dimmensions found by the differential
+    grouping of :func:`DifferentialGrouping`.
+
+    The objectives which are sums of terms over the groups can also give the
+    term of a block (the *block term* slot), then the fitness of the context
+    vector and the terms of its blocks are cached and only the block of the
+    sub-swarm is computed, instead of the whole position.
+
+    The positions are numpy arrays, the sub-swarms use the velocity update of
+    the :func:`Communicators.P1DGlobalPosCommunicator` with the coefficients
+    computed by a :class:`Coefficients.CoefficientSchedule`, and the blocks
+    outside the search space are clamped and their velocity is reversed.
+
+    The numpy module is required and it is imported when the engine is initialized.
+
+"""
+
+import Consts
+import Util
+import random
+from FunctionSlot import FunctionSlot
+from Coefficients import CoefficientSchedule
+
+numpy = Util.LazyModule("numpy", "the CooperativePSO requires the numpy module !")
+
+
+def StaticGrouping(coop):
+	""" Cooperative grouping - the consecutive dimmensions are split in groups of
+	*groupSize* dimmensions (default is Consts.CDefGroupSize), the groups are
+	computed once
+
+	:param coop: the :class:`CooperativePSO` instance
+	:rtype: the list of the index arrays of the groups, None to keep the groups
+
+	"""
+	if coop.groups is not None:
+		return None
+	size = coop.getParam("groupSize", Consts.CDefGroupSize)
+	dimmensions = coop.dimmensions
+	return [numpy.arange(start, min(start + size, dimmensions)) for start in xrange(0, dimmensions, size)]
+
+
+def RandomGrouping(coop):
+	""" Cooperative grouping - random regrouping, the dimmensions are shuffled and
+	split in groups of *groupSize* dimmensions (default is Consts.CDefGroupSize)
+	every cycle, so the interacting dimmensions are often optimized together
+
+	.. note:: the own best blocks of a new group were never evaluated together, so
+	          they are scored again at every cycle, even when the context vector did
+	          not change: without the block term slot it costs the evaluation of the
+	          whole swarm per group, up to doubling the evaluations of a cycle (the
+	          static groups are only scored again after a change of the rest of the
+	          context vector). With the block term slot only the terms are computed.
+
+	:param coop: the :class:`CooperativePSO` instance
+	:rtype: the list of the index arrays of the groups
+
+	"""
+	size = coop.getParam("groupSize", Consts.CDefGroupSize)
+	permutation = coop.getRandomState().permutation(coop.dimmensions)
+	return [numpy.sort(permutation[start:start + size]) for start in xrange(0, coop.dimmensions, size)]
+
+
+def DifferentialGrouping(coop):
+	""" Cooperative grouping - differential grouping, the dimmensions i and j
+	interact when the change of the fitness caused by moving the dimmension i
+	depends on the value of the dimmension j by more than *groupingEpsilon*
+	(default is Consts.CDefGroupingEpsilon). The interacting dimmensions are
+	grouped together and the separable dimmensions are split in groups of
+	*groupSize* dimmensions (default is Consts.CDefGroupSize).
+
+	The groups are computed once, with the evaluator slot, and the evaluations are
+	counted by the engine. It needs about dimmensions ** 2 / 2 evaluations, so it
+	is only worth for the expensive runs of an objective whose structure is unknown.
+
+	:param coop: the :class:`CooperativePSO` instance
+	:rtype: the list of the index arrays of the groups, None to keep the groups
+
+	"""
+	if coop.groups is not None:
+		return None
+	size = coop.getParam("groupSize", Consts.CDefGroupSize)
+	epsilon = coop.getParam("groupingEpsilon", Consts.CDefGroupingEpsilon)
+	pos_min, pos_max = coop.getRange()
+	dimmensions = coop.dimmensions
+	middle = (pos_min + pos_max) / 2.0
+
+	lower = numpy.zeros((1, dimmensions)) + pos_min
+	base = coop.evaluate(lower)[0]
+	#The fitness of the lower position with one dimmension moved to the middle
+	moved = numpy.repeat(lower, dimmensions, axis=0)
+	moved[numpy.arange(dimmensions), numpy.arange(dimmensions)] = middle
+	base_moved = coop.evaluate(moved)
+
+	remaining = range(dimmensions)
+	separable = []
+	groups = []
+	while remaining:
+		i = remaining.pop(0)
+		upper = lower.copy()
+		upper[0, i] = pos_max
+		delta = coop.evaluate(upper)[0] - base
+		group = [i]
+		if remaining:
+			others = numpy.array(remaining)
+			rows = numpy.repeat(upper, len(others), axis=0)
+			rows[numpy.arange(len(others)), others] = middle
+			deltas = coop.evaluate(rows) - base_moved[others]
+			interacting = numpy.abs(deltas - delta) > epsilon
+			group.extend(others[interacting].tolist())
+			remaining = others[~interacting].tolist()
+		if len(group) == 1:
+			separable.append(i)
+		else:
+			groups.append(numpy.array(sorted(group)))
+	for start in xrange(0, len(separable), size):
+		groups.append(numpy.array(separable[start:start + size]))
+	return groups
+
+
+def CooperativeStagnationCriteria(coop):
+	""" Cooperative termination criteria - stops when the context vector was not
+	improved for *stagnationSteps* cycles (default is Consts.CDefStagnationSteps)
+
+	Example:
+		>>> coop.setParams(stagnationSteps=50)
+		>>> coop.terminationCriteria.set(Cooperative.CooperativeStagnationCriteria)
+
+	"""
+	steps = coop.getParam("stagnationSteps", Consts.CDefStagnationSteps)
+	return (coop.currentStep - coop.lastImprovementStep) >= steps
+
+
+class CooperativePSO(object):
+	""" CooperativePSO Class - The cooperative PSO, one sub-swarm per group of dimmensions
+
+	The evaluator functions receive the positions, a *(positions, dimmensions)*
+	array, and return their fitness, a *(positions,)* array. The results of several
+	evaluator functions are summed.
+
+	Example:
+		>>> coop = Cooperative.CooperativePSO(5000, seed=1)
+		>>> coop.evaluator.set(lambda positions: (positions ** 2).sum(axis=1))
+		>>> coop.blockTerm.set(lambda blocks, indices: (blocks ** 2).sum(axis=1))
+		>>> coop.grouping.set(Cooperative.RandomGrouping)
+		>>> coop.setParams(rangePosmin=-5.12, rangePosmax=5.12, groupSize=100)
+		>>> coop.setTimeSteps(500)
+		>>> coop.execute()
+		>>> coop.getBestFitness()
+
+	A step (a cycle) moves every sub-swarm once. The search space and the velocity
+	limits are the *rangePosmin*, *rangePosmax*, *rangeVelmin* and *rangeVelmax*
+	params, the default search space is Consts.CDefRangePosition and the default
+	velocity limits are symmetric, -/+ the width of the search space times the
+	*velocityFraction* param (default is Consts.CDefVelocityFraction).
+	The inertia schedules which read the topology (:func:`Inertia.InertiaAdaptive`)
+	are not supported.
+
+	:param dimmensions: the number of dimmensions of the positions
+	:param seed: the random seed value of the numpy random generator
+
+	"""
+
+	evaluator = None
+	""" This is the evaluator slot, the functions receive the whole positions: ::
+
+		def sphere(positions):
+			return (positions ** 2).sum(axis=1)
+
+		coop.evaluator.set(sphere)
+
+	"""
+
+	blockTerm = None
+	""" This is the block term slot, the functions receive the blocks of a group,
+	a *(blocks, group size)* array, and the index array of the dimmensions of the
+	group, and return the term of the blocks in the fitness, a *(blocks,)* array.
+	It can only be set when the fitness is the sum of the terms of the groups
+	(with the same functions as the evaluator slot): ::
+
+		def sphereTerm(blocks, indices):
+			return (blocks ** 2).sum(axis=1)
+
+		coop.blockTerm.set(sphereTerm)
+
+	"""
+
+	grouping = None
+	""" This is the grouping slot, the function receives the engine and returns the
+	list of the index arrays of the groups, or None to keep the current groups. It
+	is called at the beginning of every cycle, the default is :func:`StaticGrouping`.
+	"""
+
+	terminationCriteria = None
+	""" This is the termination criteria slot, the functions receive the engine and
+	return True to stop. The engine stops after the time steps.
+	"""
+
+	def __init__(self, dimmensions, seed=None):
+		""" The CooperativePSO Class Creator """
+		if dimmensions < 1:
+			Util.raiseException("The number of dimmensions must be >= 1", ValueError)
+		self.dimmensions = dimmensions
+		self.seed = seed
+		self.randomState = None
+		self.swarmSize = Consts.CDefSwarmSize
+		self.timeSteps = Consts.CDefSteps
+		self.psoType = Consts.CDefPsoType
+		self.C1, self.C2 = Consts.CDefCoefficients
+		self.coefficients = CoefficientSchedule()
+		self.minimax = Consts.minimaxType["minimize"]
+		self.internalParams = {}
+		self.currentStep = 0
+		self.inertiaFactor = None
+		self.inertiaState = None
+
+		self.evaluator = FunctionSlot("Cooperative Evaluator")
+		self.blockTerm = FunctionSlot("Cooperative Block Term")
+		self.grouping = FunctionSlot("Cooperative Grouping")
+		self.grouping.set(StaticGrouping)
+		self.terminationCriteria = FunctionSlot("Cooperative Termination Criteria")
+		self.inertiaSchedule = FunctionSlot("Inertia Schedule")
+		self.inertiaSchedule.set(Consts.CDefInertiaSchedule)
+		self.allSlots = [self.evaluator, self.blockTerm, self.grouping,
+						 self.terminationCriteria, self.inertiaSchedule]
+
+		#The (particles, dimmensions) arrays, every sub-swarm owns the columns of its group
+		self.position = None
+		self.velocity = None
+		self.ownBestPosition = None
+		#The list of the index arrays of the groups and the scores of the own best blocks
+		self.groups = None
+		self.ownBestScore = None
+		self.scoreVersion = None
+		#The context vector, its fitness and the terms of its blocks
+		self.context = None
+		self.contextFitness = None
+		self.contextTerms = None
+		self.contextVersion = 0
+		self.evaluations = 0
+		self.blockEvaluations = 0
+		self.lastImprovementStep = 0
+
+	def __repr__(self):
+		""" The String representation of the engine """
+		ret = "- CooperativePSO\n"
+		ret += "\tDimmensions:\t %d\n" % (self.dimmensions,)
+		ret += "\tSwarm Size:\t %d\n" % (self.swarmSize,)
+		ret += "\tTime Steps:\t %d\n" % (self.timeSteps,)
+		ret += "\tCurrent Step:\t %d\n" % (self.currentStep,)
+		if self.groups is not None:
+			ret += "\tGroups:\t\t %d\n" % (len(self.groups),)
+		ret += "\tEvaluations:\t %d (blocks: %d)\n" % (self.evaluations, self.blockEvaluations)
+		for slot in self.allSlots:
+			ret += "\t" + slot.__repr__()
+		ret += "\n"
+		return ret
+
+	def setSwarmSize(self, size):
+		""" Sets the size of every sub-swarm
+
+		:param size: the swarm size, must be >= 2
+
+		"""
+		if size < 2:
+			Util.raiseException("swarm size must be >= 2", ValueError)
+		self.swarmSize = size
+
+	def setTimeSteps(self, num_steps):
+		""" Sets the number of cycles
+
+		:param num_steps: the number of cycles
+
+		"""
+		if num_steps < 1:
+			Util.raiseException("Number of steps must be >=1", ValueError)
+		self.timeSteps = num_steps
+
+	def setPsoType(self, psoType):
+		""" Sets the psoType, use Consts.psoType(Basic,Constricted,Inertia)
+
+		:param psoType: The PSO type, from Consts.psoType
+
+		"""
+		if psoType not in Consts.psoType.values():
+			Util.raiseException("PsoType must be implemented !", TypeError)
+		self.psoType = psoType
+
+	def setCoefficients(self, c1, c2):
+		""" Sets the cognitive (C1) and social (C2) coefficients
+
+		:param c1: the cognitive coefficient
+		:param c2: the social coefficient
+
+		"""
+		if c1 < 0 or c2 < 0:
+			Util.raiseException("The coefficients must be >= 0", ValueError)
+		self.C1, self.C2 = c1, c2
+
+	def setCoefficientSchedule(self, schedule):
+		""" Sets the coefficient schedule of the sub-swarms
+
+		:param schedule: the :class:`Coefficients.CoefficientSchedule` instance
+
+		"""
+		self.coefficients = schedule
+
+	def setMinimax(self, minimax):
+		""" Sets the minimize/maximize mode, use Consts.minimaxType
+
+		:param minimax: the minimax mode, from Consts.minimaxType
+
+		"""
+		if minimax not in Consts.minimaxType.values():
+			Util.raiseException("Optimization type must be Maximize or Minimize !", TypeError)
+		self.minimax = minimax
+
+	def setParams(self, **args):
+		""" Sets the internal params of the engine (search space, grouping,
+		criteria and inertia schedule params)
+
+		:param args: the params
+
+		"""
+		self.internalParams.update(args)
+
+	def getParam(self, key, nvl=None):
+		""" Gets an internal param of the engine
+
+		:param key: the key of the param
+		:param nvl: if the key doesn't exist, the nvl will be returned
+
+		"""
+		return self.internalParams.get(key, nvl)
+
+	def getRange(self):
+		""" Returns the search space, the tuple (rangePosmin, rangePosmax) """
+		pos_min, pos_max = Consts.CDefRangePosition
+		return self.getParam("rangePosmin", pos_min), self.getParam("rangePosmax", pos_max)
+
+	def getVelocityRange(self):
+		""" Returns the velocity limits, the tuple (rangeVelmin, rangeVelmax), the
+		default limits are -/+ the width of the search space times the
+		*velocityFraction* param, see :func:`Util.velocityRange` """
+		pos_min, pos_max = self.getRange()
+		return Util.velocityRange(self, pos_max - pos_min)
+
+	def updateInertiaFactor(self):
+		""" Computes the inertia weight of the current step with the inertia schedule
+		slot, called by the coefficient schedule for the INERTIA PSO type """
+		for it in self.inertiaSchedule.applyFunctions(self):
+			self.inertiaFactor = it
+
+	def getRandomState(self):
+		""" Return the numpy random generator of the engine, seeded by the seed
+		of the engine or from the random module
+
+		:rtype: the numpy.random.RandomState instance
+
+		"""
+		if self.randomState is None:
+			seed = self.seed
+			if seed is None:
+				seed = random.getrandbits(32)
+			self.randomState = numpy.random.RandomState(seed)
+		return self.randomState
+
+	def getBestFitness(self):
+		""" Returns the fitness of the context vector, the best fitness """
+		return self.contextFitness
+
+	def getBestPosition(self):
+		""" Returns the context vector, the best position
+
+		:rtype: the (dimmensions,) array
+
+		"""
+		return self.context
+
+	def getGroups(self):
+		""" Returns the list of the index arrays of the current groups """
+		return self.groups
+
+	def getEvaluations(self):
+		""" Returns the number of evaluations of whole positions """
+		return self.evaluations
+
+	def getBlockEvaluations(self):
+		""" Returns the number of evaluations of blocks with the block term slot """
+		return self.blockEvaluations
+
+	def isMaximize(self):
+		""" Returns True if the optimization type is maximize """
+		return self.minimax == Consts.minimaxType["maximize"]
+
+	def isBetter(self, a, b):
+		""" Returns True (elementwise for the arrays) where the fitness a is better than b """
+		return a > b if self.isMaximize() else a < b
+
+	def argBest(self, scores):
+		""" Returns the index of the best score """
+		return int(scores.argmax()) if self.isMaximize() else int(scores.argmin())
+
+	def evaluate(self, positions):
+		""" Evaluates the whole positions with the evaluator slot
+
+		:param positions: the (positions, dimmensions) array
+		:rtype: the (positions,) fitness array
+
+		"""
+		fitness = None
+		for it in self.evaluator.applyFunctions(positions):
+			it = numpy.asarray(it, dtype=numpy.float64)
+			fitness = it if fitness is None else fitness + it
+		if fitness.shape != positions.shape[:1]:
+			Util.raiseException("The cooperative evaluator must return a %s array, got %s" % (positions.shape[:1], fitness.shape), ValueError)
+		self.evaluations += len(positions)
+		return fitness
+
+	def evaluateTerms(self, blocks, indices):
+		""" Computes the terms of the blocks with the block term slot
+
+		:param blocks: the (blocks, group size) array
+		:param indices: the index array of the dimmensions of the group
+		:rtype: the (blocks,) array of the terms
+
+		"""
+		terms = None
+		for it in self.blockTerm.applyFunctions(blocks, indices=indices):
+			it = numpy.asarray(it, dtype=numpy.float64)
+			terms = it if terms is None else terms + it
+		self.blockEvaluations += len(blocks)
+		return terms
+
+	def score(self, blocks, group):
+		""" Returns the scores of the blocks of a group, the comparable values of the
+		blocks in the context vector: the terms of the blocks when the block term slot
+		is set, else the fitness of the context vector with the blocks in place
+
+		:param blocks: the (blocks, group size) array
+		:param group: the index of the group
+		:rtype: the (blocks,) array of the scores
+
+		"""
+		indices = self.groups[group]
+		if not self.blockTerm.isEmpty():
+			return self.evaluateTerms(blocks, indices)
+		positions = numpy.repeat(self.context[numpy.newaxis, :], len(blocks), axis=0)
+		positions[:, indices] = blocks
+		return self.evaluate(positions)
+
+	def regroup(self, groups):
+		""" Sets the groups of the sub-swarms, the scores of the own bests and the
+		cached terms of the context vector are recomputed when they are needed. The
+		scores of the groups whose dimmensions did not change are kept, they are only
+		recomputed if the context vector changed since (without the block term slot)
+
+		:param groups: the list of the index arrays of the groups
+
+		"""
+		covered = numpy.zeros(self.dimmensions, dtype=bool)
+		for indices in groups:
+			covered[indices] = True
+		if not covered.all():
+			Util.raiseException("The groups must cover all the dimmensions", ValueError)
+		#The index of every unchanged group in the previous groups
+		kept = [None] * len(groups)
+		if self.groups is not None:
+			key = lambda indices: numpy.asarray(indices, dtype=numpy.int64).tostring()
+			previous = dict([(key(self.groups[old]), old) for old in xrange(len(self.groups))])
+			kept = [previous.get(key(indices)) for indices in groups]
+
+		scores, versions, terms = [], [], []
+		for group in xrange(len(groups)):
+			old = kept[group]
+			if old is None:
+				scores.append(None)
+				versions.append(None)
+			else:
+				scores.append(self.ownBestScore[old])
+				versions.append(self.scoreVersion[old])
+			if self.blockTerm.isEmpty():
+				continue
+			if old is None:
+				indices = groups[group]
+				terms.append(self.evaluateTerms(self.context[numpy.newaxis, indices], indices)[0])
+			else:
+				terms.append(self.contextTerms[old])
+		self.groups = groups
+		self.ownBestScore = scores
+		self.scoreVersion = versions
+		if not self.blockTerm.isEmpty():
+			self.contextTerms = numpy.array(terms)
+
+	def initialize(self):
+		""" Initializes the engine, the particles are created at random in the
+		search space and the context vector is the best of them """
+		state = self.getRandomState()
+		shape = (self.swarmSize, self.dimmensions)
+		pos_min, pos_max = self.getRange()
+		vel_min, vel_max = self.getVelocityRange()
+
+		self.evaluations = 0
+		self.blockEvaluations = 0
+		self.position = state.uniform(pos_min, pos_max, shape)
+		self.velocity = state.uniform(vel_min, vel_max, shape)
+		self.ownBestPosition = self.position.copy()
+		fitness = self.evaluate(self.position)
+		best = self.argBest(fitness)
+		self.context = self.position[best].copy()
+		self.contextFitness = float(fitness[best])
+		self.contextVersion = 0
+		self.groups = None
+		self.currentStep = 0
+		self.lastImprovementStep = 0
+		self.inertiaState = None
+
+	def updateGroup(self, group):
+		""" Moves the sub-swarm of a group, the social attractor is the block of the
+		context vector, and updates the own bests and the context vector
+
+		:param group: the index of the group
+
+		"""
+		indices = self.groups[group]
+		if self.ownBestScore[group] is None or (self.blockTerm.isEmpty() and self.scoreVersion[group] != self.contextVersion):
+			#The own best scores are stale when the rest of the context vector changed
+			self.ownBestScore[group] = self.score(self.ownBestPosition[:, indices], group)
+			self.scoreVersion[group] = self.contextVersion
+
+		state = self.randomState
+		position = self.position[:, indices]
+		velocity = self.velocity[:, indices]
+		own_best = self.ownBestPosition[:, indices]
+		vel_min, vel_max = self.getVelocityRange()
+		velocity *= self.coefficients.inertiaWeight
+		velocity += self.coefficients.cognitive * state.random_sample(position.shape) * (own_best - position)
+		velocity += self.coefficients.social * state.random_sample(position.shape) * (self.context[indices] - position)
+		numpy.clip(velocity, vel_min, vel_max, out=velocity)
+		position += velocity
+
+		pos_min, pos_max = self.getRange()
+		outside = (position < pos_min) | (position > pos_max)
+		if outside.any():
+			numpy.clip(position, pos_min, pos_max, out=position)
+			velocity[outside] *= -1.0
+
+		scores = self.score(position, group)
+		own_best_score = self.ownBestScore[group]
+		improved = self.isBetter(scores, own_best_score)
+		own_best_score[improved] = scores[improved]
+		own_best[improved] = position[improved]
+		self.position[:, indices] = position
+		self.velocity[:, indices] = velocity
+		self.ownBestPosition[:, indices] = own_best
+
+		best = self.argBest(scores)
+		if self.blockTerm.isEmpty():
+			better = self.isBetter(scores[best], self.contextFitness)
+		else:
+			better = self.isBetter(scores[best], self.contextTerms[group])
+		if better:
+			self.context[indices] = position[best]
+			if self.blockTerm.isEmpty():
+				self.contextFitness = float(scores[best])
+			else:
+				self.contextFitness += float(scores[best] - self.contextTerms[group])
+				self.contextTerms[group] = scores[best]
+			self.contextVersion += 1
+			self.scoreVersion[group] = self.contextVersion
+			self.lastImprovementStep = self.currentStep + 1
+
+	def constructSolution(self):
+		""" Does one cycle, every sub-swarm is moved once
+
+		:rtype: True if the engine is stopped
+
+		"""
+		groups = None
+		for it in self.grouping.applyFunctions(self):
+			groups = it
+		if groups is not None:
+			self.regroup(groups)
+
+		self.coefficients.update(self)
+		for group in xrange(len(self.groups)):
+			self.updateGroup(group)
+		self.currentStep += 1
+
+		if self.currentStep >= self.timeSteps:
+			return True
+		if not self.terminationCriteria.isEmpty():
+			for it in self.terminationCriteria.applyFunctions(self):
+				if it:
+					return True
+		return False
+
+	def execute(self):
+		""" Initializes the engine and does the cycles until it is stopped """
+		self.initialize()
+		while not self.constructSolution():
+			pass
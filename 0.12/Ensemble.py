@@ -0,0 +1,503 @@
+'''
+Particle Swarm Optimization - PyPSO
+
+Copyright (c) 2009 Marcel Pinheiro Caraciolo
+caraciol@gmail.com
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+0.10 2026-10-19 Initial version.
+0.11 2026-10-19 The default velocity limits are symmetric, a fraction of the search space.
+0.11 2026-10-19 Every run has its own seed and random generator, added getSeeds().
+'''
+
+"""
+
+:mod:`Ensemble` -- the ensemble of independent runs
+==============================================================
+
+    This module contains the :class:`Ensemble.EnsemblePSO` class, which executes
+    several independent runs of the same configuration (one per seed, usually for
+    statistics) at once. The positions, velocities and own bests of all the runs
+    are stacked in *(runs, particles, dimmensions)* numpy arrays and every step
+    moves all the runs with a single vectorized update, so the interpreter
+    overhead is shared by the runs.
+
+    The runs use the global topology, real positions and the velocity update of
+    the :func:`Communicators.P1DGlobalPosCommunicator`, with the coefficients
+    computed by a :class:`Coefficients.CoefficientSchedule`. The particles outside
+    the search space are clamped and their velocity is reversed, as by the
+    default boundary handler :func:`Boundaries.BoundaryClampReverse`.
+
+    The *ensemble termination criteria* functions receive the ensemble and return
+    a boolean array, one flag per run; a stopped run is no longer moved nor
+    evaluated.
+
+    Every run has its own seed and numpy random generator, so a run of the ensemble
+    is reproduced by an ensemble of one run with its seed (see
+    :meth:`EnsemblePSO.getSeeds`), whatever the other runs are.
+
+    The numpy module is required and it is imported when the ensemble is initialized.
+
+"""
+
+import Consts
+import Util
+import random
+from FunctionSlot import FunctionSlot
+from Coefficients import CoefficientSchedule
+
+numpy = Util.LazyModule("numpy", "the EnsemblePSO requires the numpy module !")
+
+
+def EnsembleFitnessCriteria(ensemble):
+	""" Ensemble termination criteria - stops the runs whose best fitness reached
+	the *bestFitness* param of the ensemble
+
+	Example:
+		>>> ensemble.setParams(bestFitness=1e-8)
+		>>> ensemble.terminationCriteria.set(Ensemble.EnsembleFitnessCriteria)
+
+	"""
+	best_fitness = ensemble.getParam("bestFitness")
+	if best_fitness is None:
+		Util.raiseException("You must specify the bestFitness parameter", ValueError)
+	if ensemble.minimax == Consts.minimaxType["maximize"]:
+		return ensemble.bestFitness >= best_fitness
+	return ensemble.bestFitness <= best_fitness
+
+
+def EnsembleStagnationCriteria(ensemble):
+	""" Ensemble termination criteria - stops the runs whose best fitness was not
+	improved for *stagnationSteps* steps (default is Consts.CDefStagnationSteps)
+
+	Example:
+		>>> ensemble.setParams(stagnationSteps=50)
+		>>> ensemble.terminationCriteria.add(Ensemble.EnsembleStagnationCriteria)
+
+	"""
+	steps = ensemble.getParam("stagnationSteps", Consts.CDefStagnationSteps)
+	return (ensemble.currentStep - ensemble.lastImprovementStep) >= steps
+
+
+class EnsemblePSO(object):
+	""" EnsemblePSO Class - Independent runs of the same PSO configuration, advanced together
+
+	The evaluator functions receive the positions of the active runs, a
+	*(active runs, particles, dimmensions)* array, and return their fitness, a
+	*(active runs, particles)* array. The results of several evaluator functions
+	are summed.
+
+	Example:
+		>>> ensemble = Ensemble.EnsemblePSO(30, 10, seed=1)
+		>>> ensemble.evaluator.set(lambda positions: (positions ** 2).sum(axis=2))
+		>>> ensemble.setParams(rangePosmin=-5.12, rangePosmax=5.12)
+		>>> ensemble.setTimeSteps(1000)
+		>>> ensemble.execute()
+		>>> ensemble.getBestFitness().mean()
+		>>> zip(ensemble.getSeeds(), ensemble.getBestFitness())
+
+	The search space is the *rangePosmin* and *rangePosmax* params (default is
+	Consts.CDefRangePosition). The velocity limits are the *rangeVelmin* and
+	*rangeVelmax* params, the default limits are -/+ the width of the search space
+	times the *velocityFraction* param (default is Consts.CDefVelocityFraction).
+	The inertia schedules which read the topology
+	(:func:`Inertia.InertiaAdaptive`) are not supported.
+
+	:param runs: the number of runs
+	:param dimmensions: the number of dimmensions of the particles
+	:param seed: the random seed value, the seeds of the runs are drawn from it
+	:param seeds: the list of the seeds of the runs, one per run, it overrides the *seed*
+
+	"""
+
+	evaluator = None
+	""" This is the batched evaluator slot, the functions receive the positions of
+	all the active runs: ::
+
+		def sphere(positions):
+			return (positions ** 2).sum(axis=2)
+
+		ensemble.evaluator.set(sphere)
+
+	"""
+
+	terminationCriteria = None
+	""" This is the ensemble termination criteria slot, the functions receive the
+	ensemble and return one flag per run (a boolean array), the runs whose flag is
+	True are stopped. All the runs stop after the time steps.
+	"""
+
+	def __init__(self, runs, dimmensions, seed=None, seeds=None):
+		""" The EnsemblePSO Class Creator """
+		if runs < 1:
+			Util.raiseException("The number of runs must be >= 1", ValueError)
+		if seeds is not None and len(seeds) != runs:
+			Util.raiseException("The ensemble requires one seed per run, got %d seeds for %d runs" % (len(seeds), runs), ValueError)
+		self.runs = runs
+		self.dimmensions = dimmensions
+		self.seed = seed
+		self.seeds = None if seeds is None else list(seeds)
+		self.randomStates = None
+		self.swarmSize = Consts.CDefSwarmSize
+		self.timeSteps = Consts.CDefSteps
+		self.psoType = Consts.CDefPsoType
+		self.C1, self.C2 = Consts.CDefCoefficients
+		self.coefficients = CoefficientSchedule()
+		self.minimax = Consts.minimaxType["minimize"]
+		self.internalParams = {}
+		self.currentStep = 0
+		self.inertiaFactor = None
+		self.inertiaState = None
+
+		self.evaluator = FunctionSlot("Ensemble Evaluator")
+		self.terminationCriteria = FunctionSlot("Ensemble Termination Criteria")
+		self.inertiaSchedule = FunctionSlot("Inertia Schedule")
+		self.inertiaSchedule.set(Consts.CDefInertiaSchedule)
+		self.allSlots = [self.evaluator, self.terminationCriteria, self.inertiaSchedule]
+
+		#The (runs, particles, dimmensions) arrays
+		self.position = None
+		self.velocity = None
+		self.ownBestPosition = None
+		#The (runs, particles) arrays
+		self.fitness = None
+		self.ownBestFitness = None
+		#The per run arrays
+		self.bestFitness = None
+		self.bestPosition = None
+		self.evaluations = None
+		self.lastImprovementStep = None
+		self.active = None
+		self.stoppedStep = None
+
+	def __repr__(self):
+		""" The String representation of the ensemble """
+		ret = "- EnsemblePSO\n"
+		ret += "\tRuns:\t\t %d\n" % (self.runs,)
+		ret += "\tSwarm Size:\t %d\n" % (self.swarmSize,)
+		ret += "\tDimmensions:\t %d\n" % (self.dimmensions,)
+		ret += "\tTime Steps:\t %d\n" % (self.timeSteps,)
+		ret += "\tCurrent Step:\t %d\n" % (self.currentStep,)
+		if self.active is not None:
+			ret += "\tActive Runs:\t %d\n" % (int(self.active.sum()),)
+		for slot in self.allSlots:
+			ret += "\t" + slot.__repr__()
+		ret += "\n"
+		return ret
+
+	def setSwarmSize(self, size):
+		""" Sets the swarm size of every run
+
+		:param size: the swarm size, must be >= 2
+
+		"""
+		if size < 2:
+			Util.raiseException("swarm size must be >= 2", ValueError)
+		self.swarmSize = size
+
+	def setTimeSteps(self, num_steps):
+		""" Sets the number of steps of the runs
+
+		:param num_steps: the number of steps
+
+		"""
+		if num_steps < 1:
+			Util.raiseException("Number of steps must be >=1", ValueError)
+		self.timeSteps = num_steps
+
+	def setPsoType(self, psoType):
+		""" Sets the psoType, use Consts.psoType(Basic,Constricted,Inertia)
+
+		:param psoType: The PSO type, from Consts.psoType
+
+		"""
+		if psoType not in Consts.psoType.values():
+			Util.raiseException("PsoType must be implemented !", TypeError)
+		self.psoType = psoType
+
+	def setCoefficients(self, c1, c2):
+		""" Sets the cognitive (C1) and social (C2) coefficients
+
+		:param c1: the cognitive coefficient
+		:param c2: the social coefficient
+
+		"""
+		if c1 < 0 or c2 < 0:
+			Util.raiseException("The coefficients must be >= 0", ValueError)
+		self.C1, self.C2 = c1, c2
+
+	def setCoefficientSchedule(self, schedule):
+		""" Sets the coefficient schedule of the runs
+
+		:param schedule: the :class:`Coefficients.CoefficientSchedule` instance
+
+		"""
+		self.coefficients = schedule
+
+	def setMinimax(self, minimax):
+		""" Sets the minimize/maximize mode, use Consts.minimaxType
+
+		:param minimax: the minimax mode, from Consts.minimaxType
+
+		"""
+		if minimax not in Consts.minimaxType.values():
+			Util.raiseException("Optimization type must be Maximize or Minimize !", TypeError)
+		self.minimax = minimax
+
+	def setParams(self, **args):
+		""" Sets the internal params of the ensemble (search space, criteria and
+		inertia schedule params)
+
+		:param args: the params
+
+		"""
+		self.internalParams.update(args)
+
+	def getParam(self, key, nvl=None):
+		""" Gets an internal param of the ensemble
+
+		:param key: the key of the param
+		:param nvl: if the key doesn't exist, the nvl will be returned
+
+		"""
+		return self.internalParams.get(key, nvl)
+
+	def getRange(self):
+		""" Returns the search space, the tuple (rangePosmin, rangePosmax) """
+		pos_min, pos_max = Consts.CDefRangePosition
+		return self.getParam("rangePosmin", pos_min), self.getParam("rangePosmax", pos_max)
+
+	def getVelocityRange(self):
+		""" Returns the velocity limits, the tuple (rangeVelmin, rangeVelmax), the
+		default limits are -/+ the width of the search space times the
+		*velocityFraction* param, see :func:`Util.velocityRange` """
+		pos_min, pos_max = self.getRange()
+		return Util.velocityRange(self, pos_max - pos_min)
+
+	def updateInertiaFactor(self):
+		""" Computes the inertia weight of the current step with the inertia schedule
+		slot, called by the coefficient schedule for the INERTIA PSO type """
+		for it in self.inertiaSchedule.applyFunctions(self):
+			self.inertiaFactor = it
+
+	def getSeeds(self):
+		""" Returns the seeds of the runs, the *seeds* of the ensemble or drawn from
+		its *seed* (from the random module without seed)
+
+		:rtype: the list of the seeds, one per run
+
+		"""
+		if self.seeds is None:
+			if self.seed is None:
+				self.seeds = [random.getrandbits(32) for run in xrange(self.runs)]
+			else:
+				rand = random.Random(self.seed)
+				self.seeds = [rand.getrandbits(32) for run in xrange(self.runs)]
+		return self.seeds
+
+	def getRandomStates(self):
+		""" Return the numpy random generators of the runs, seeded by their seeds
+
+		:rtype: the list of the numpy.random.RandomState instances, one per run
+
+		"""
+		if self.randomStates is None:
+			self.randomStates = [numpy.random.RandomState(seed) for seed in self.getSeeds()]
+		return self.randomStates
+
+	def randomSample(self, runs, function, shape, *args):
+		""" Draws the random numbers of the runs, every run from its own generator
+
+		:param runs: the indexes of the runs
+		:param function: the name of the numpy.random.RandomState method
+		:param shape: the shape of the numbers of one run
+		:param args: the parameters passed before the shape to the method
+		:rtype: the (len(runs),) + shape array
+
+		"""
+		states = self.getRandomStates()
+		sample = numpy.empty((len(runs),) + shape)
+		for i, run in enumerate(runs):
+			sample[i] = getattr(states[run], function)(*(args + (shape,)))
+		return sample
+
+	def getBestFitness(self):
+		""" Returns the best fitness of every run
+
+		:rtype: the (runs,) array
+
+		"""
+		return self.bestFitness
+
+	def getBestPosition(self):
+		""" Returns the best position of every run
+
+		:rtype: the (runs, dimmensions) array
+
+		"""
+		return self.bestPosition
+
+	def getEvaluations(self):
+		""" Returns the number of evaluations of every run
+
+		:rtype: the (runs,) array
+
+		"""
+		return self.evaluations
+
+	def getActiveRuns(self):
+		""" Returns the flags of the runs still running
+
+		:rtype: the (runs,) boolean array
+
+		"""
+		return self.active
+
+	def getStoppedStep(self):
+		""" Returns the step every run was stopped at, the time steps for the runs
+		stopped by the end of the execution
+
+		:rtype: the (runs,) array
+
+		"""
+		return self.stoppedStep
+
+	def isMaximize(self):
+		""" Returns True if the optimization type is maximize """
+		return self.minimax == Consts.minimaxType["maximize"]
+
+	def evaluate(self, positions):
+		""" Evaluates the positions with the evaluator slot
+
+		:param positions: the (runs, particles, dimmensions) array
+		:rtype: the (runs, particles) fitness array
+
+		"""
+		fitness = None
+		for it in self.evaluator.applyFunctions(positions):
+			it = numpy.asarray(it, dtype=numpy.float64)
+			fitness = it if fitness is None else fitness + it
+		if fitness.shape != positions.shape[:2]:
+			Util.raiseException("The ensemble evaluator must return a %s array, got %s" % (positions.shape[:2], fitness.shape), ValueError)
+		return fitness
+
+	def initialize(self):
+		""" Initializes all the runs, the particles are created at random in the
+		search space and evaluated """
+		shape = (self.swarmSize, self.dimmensions)
+		runs = numpy.arange(self.runs)
+		pos_min, pos_max = self.getRange()
+		vel_min, vel_max = self.getVelocityRange()
+
+		self.position = self.randomSample(runs, "uniform", shape, pos_min, pos_max)
+		self.velocity = self.randomSample(runs, "uniform", shape, vel_min, vel_max)
+		self.ownBestPosition = self.position.copy()
+		self.fitness = self.evaluate(self.position)
+		self.ownBestFitness = self.fitness.copy()
+
+		index = self.ownBestFitness.argmax(axis=1) if self.isMaximize() else self.ownBestFitness.argmin(axis=1)
+		self.bestFitness = self.ownBestFitness[runs, index]
+		self.bestPosition = self.ownBestPosition[runs, index]
+
+		self.evaluations = numpy.zeros(self.runs, dtype=numpy.int64) + self.swarmSize
+		self.lastImprovementStep = numpy.zeros(self.runs, dtype=numpy.int64)
+		self.active = numpy.ones(self.runs, dtype=bool)
+		self.stoppedStep = numpy.zeros(self.runs, dtype=numpy.int64)
+		self.currentStep = 0
+		self.inertiaState = None
+
+	def constructSolution(self):
+		""" Does one step of all the active runs
+
+		:rtype: True if all the runs are stopped
+
+		"""
+		self.coefficients.update(self)
+		weight = self.coefficients.inertiaWeight
+		cognitive = self.coefficients.cognitive
+		social = self.coefficients.social
+
+		#The active runs are selected by a slice (views) while all the runs are active
+		active = self.active
+		indexes = numpy.flatnonzero(active)
+		if len(indexes) == self.runs:
+			runs = slice(None)
+		else:
+			runs = indexes
+
+		position = self.position[runs]
+		velocity = self.velocity[runs]
+		own_best = self.ownBestPosition[runs]
+		global_best = self.bestPosition[runs][:, numpy.newaxis, :]
+
+		shape = position.shape[1:]
+		vel_min, vel_max = self.getVelocityRange()
+		velocity *= weight
+		velocity += cognitive * self.randomSample(indexes, "random_sample", shape) * (own_best - position)
+		velocity += social * self.randomSample(indexes, "random_sample", shape) * (global_best - position)
+		numpy.clip(velocity, vel_min, vel_max, out=velocity)
+		position += velocity
+
+		#Boundary handling, clamp and reverse
+		pos_min, pos_max = self.getRange()
+		outside = (position < pos_min) | (position > pos_max)
+		if outside.any():
+			numpy.clip(position, pos_min, pos_max, out=position)
+			velocity[outside] *= -1.0
+
+		fitness = self.evaluate(position)
+		own_best_fitness = self.ownBestFitness[runs]
+		improved = fitness > own_best_fitness if self.isMaximize() else fitness < own_best_fitness
+		own_best_fitness[improved] = fitness[improved]
+		own_best[improved] = position[improved]
+
+		index = own_best_fitness.argmax(axis=1) if self.isMaximize() else own_best_fitness.argmin(axis=1)
+		rows = numpy.arange(len(index))
+		candidate = own_best_fitness[rows, index]
+		best_fitness = self.bestFitness[runs]
+		better = candidate > best_fitness if self.isMaximize() else candidate < best_fitness
+
+		if isinstance(runs, slice):
+			self.fitness = fitness
+			changed = numpy.flatnonzero(better)
+		else:
+			self.position[runs] = position
+			self.velocity[runs] = velocity
+			self.ownBestPosition[runs] = own_best
+			self.ownBestFitness[runs] = own_best_fitness
+			self.fitness[runs] = fitness
+			changed = runs[better]
+		self.bestFitness[changed] = candidate[better]
+		self.bestPosition[changed] = own_best[rows[better], index[better]]
+		self.lastImprovementStep[changed] = self.currentStep + 1
+
+		self.evaluations[runs] += self.swarmSize
+		self.currentStep += 1
+
+		stop = numpy.zeros(self.runs, dtype=bool)
+		if self.currentStep >= self.timeSteps:
+			stop[:] = True
+		elif not self.terminationCriteria.isEmpty():
+			for it in self.terminationCriteria.applyFunctions(self):
+				stop |= numpy.asarray(it, dtype=bool)
+		stop &= active
+		self.stoppedStep[stop] = self.currentStep
+		self.active = active & ~stop
+		return not self.active.any()
+
+	def execute(self):
+		""" Initializes the ensemble and does the steps until all the runs are stopped """
+		self.initialize()
+		while not self.constructSolution():
+			pass
@@ -0,0 +1,396 @@
+'''
+Particle Swarm Optimization - PyPSO
+
+Copyright (c) 2009 Marcel Pinheiro Caraciolo
+caraciol@gmail.com
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+0.10 2026-10-19 Initial version.
+0.11 2026-10-19 Added the bounded evaluation (evaluations stopped early).
+0.11 2026-10-19 Added the noisy evaluation (re-evaluations of the uncertain comparisons).
+0.11 2026-10-19 The noisy evaluations set the resample flag, the evaluation caches are bypassed.
+0.11 2026-10-19 The multi-fidelity evaluation also promotes the particles near the global best.
+'''
+
+"""
+
+:mod:`Evaluators` -- the evaluation updaters module
+==============================================================
+
+    This module contains the *evaluation updater* functions of the expensive
+    objectives, which are set in the evaluation updater slot of the topology: ::
+
+        topology.evaluation_updater.set(Evaluators.MultiFidelityEvaluation)
+
+    They evaluate the moved particles with the evaluator slot of the particles,
+    like :func:`GlobalTopology.updateParticlesEvaluation`, but spend the expensive
+    evaluations only where they can change the own bests. Their params are read
+    from the PSO Engine (see :meth:`Pso.SimplePSO.setParams`) and their counters
+    are kept in the *evaluationCounters* engine param, a dict. The objectives
+    which are sums of many terms can stop early with :func:`boundedSum`, see
+    :func:`BoundedEvaluation`. The stochastic objectives are averaged by
+    :func:`NoisyEvaluation`.
+
+    The particles constraints are not supported by these updaters.
+
+"""
+
+import Consts
+
+
+class PartialFitness(float):
+	""" PartialFitness Class - The fitness of an evaluation stopped early, it is
+	a bound of the fitness (lower bound when minimizing, upper bound when
+	maximizing) which is already worse than the threshold of the evaluation.
+	The particles evaluated with a partial fitness have the *partial* flag set.
+
+	Example:
+		>>> fitness = Evaluators.PartialFitness(12.5)
+		>>> fitness.partial
+		True
+
+	"""
+	partial = True
+
+	def __repr__(self):
+		""" Returns the string representation of the bound """
+		return "PartialFitness(%s)" % (float.__repr__(self),)
+
+
+def boundedSum(terms, threshold=None, maximize=False):
+	""" Sums the terms, stopping as soon as the partial sum is worse than the
+	threshold. The terms must all have the same sign (non negative when
+	minimizing, non positive when maximizing), so the partial sum is a bound of
+	the whole sum.
+
+	Example:
+		>>> def objective(particle, threshold=None):
+		>>>		blocks = (squaredErrors(particle.position, block) for block in dataset.blocks())
+		>>>		return Evaluators.boundedSum(blocks, threshold)
+
+	:param terms: the iterable of terms, they can be sums of blocks of records
+	:param threshold: the threshold, None sums all the terms
+	:param maximize: True when maximizing
+	:rtype: the sum, a :class:`PartialFitness` when the sum was stopped
+
+	"""
+	total = 0.0
+	if threshold is None:
+		for term in terms:
+			total += term
+		return total
+	if maximize:
+		for term in terms:
+			total += term
+			if total < threshold:
+				return PartialFitness(total)
+	else:
+		for term in terms:
+			total += term
+			if total > threshold:
+				return PartialFitness(total)
+	return total
+
+
+def getCounters(pso_engine):
+	""" Returns the *evaluationCounters* param of the engine, a dict of the
+	counters of the evaluation updaters, it is set when it does not exist
+
+	:param pso_engine: the PSO Engine
+	:rtype: the dict of counters
+
+	"""
+	counters = pso_engine.getParam("evaluationCounters")
+	if counters is None:
+		counters = {}
+		pso_engine.setParams(evaluationCounters=counters)
+	return counters
+
+
+def calibrateFidelity(pairs):
+	""" Returns the least squares line high = slope * low + intercept of the
+	(low, high) fitness pairs
+
+	:param pairs: the list of (low fidelity fitness, high fidelity fitness)
+	:rtype: the tuple (slope, intercept)
+
+	"""
+	count = float(len(pairs))
+	mean_low = sum([low for low, high in pairs]) / count
+	mean_high = sum([high for low, high in pairs]) / count
+	variance = sum([(low - mean_low) ** 2 for low, high in pairs])
+	if variance <= 0.0:
+		return 1.0, mean_high - mean_low
+	slope = sum([(low - mean_low) * (high - mean_high) for low, high in pairs]) / variance
+	return slope, mean_high - slope * mean_low
+
+
+def MultiFidelityEvaluation(pso_engine, **args):
+	""" Update Particle Evaluation function - multi-fidelity evaluation. All the
+	particles are evaluated at the low fidelity, then only the particles whose
+	estimated fitness is better than their own best or than the global best, or
+	worse than one of them by less than the *fidelityMargin* param (relative to
+	that best, default is Consts.CDefFidelityMargin), are promoted to the high fidelity.
+
+	The evaluator functions receive the *fidelity* argument, a level of
+	Consts.fidelityLevel, and must default to the high fidelity, which is used by
+	the initialization: ::
+
+		def objective(particle, fidelity=Consts.fidelityLevel["high"]):
+			if fidelity == Consts.fidelityLevel["low"]:
+				return coarse_model(particle.position)
+			return fine_model(particle.position)
+
+	The estimated fitness is the low fidelity fitness calibrated by a least squares
+	line fitted to the last *fidelityWindow* (default is Consts.CDefFidelityWindow)
+	pairs of low and high fidelity fitness of the promoted particles, all the
+	particles are promoted until two pairs are known. The own bests only keep high
+	fidelity fitness (see :func:`Communicators.P1DGlobalInfoCommunicator`), so the
+	low fidelity fitness of the particles which were not promoted never replaces
+	them. The evaluations of each level are counted in the *evaluationCounters* param.
+
+	:param pso_engine: the PSO Engine
+
+	"""
+	topology = pso_engine.topology
+	low = pso_engine.getParam("fidelityLow", Consts.fidelityLevel["low"])
+	high = pso_engine.getParam("fidelityHigh", Consts.fidelityLevel["high"])
+	margin = pso_engine.getParam("fidelityMargin", Consts.CDefFidelityMargin)
+	window = pso_engine.getParam("fidelityWindow", Consts.CDefFidelityWindow)
+	maximize = pso_engine.minimax == Consts.minimaxType["maximize"]
+	counters = getCounters(pso_engine)
+	pairs = counters.setdefault("fidelityPairs", [])
+	calibrated = len(pairs) >= 2
+	if calibrated:
+		slope, intercept = calibrateFidelity(pairs)
+		global_best = topology.getBestFitness()
+		if maximize:
+			global_threshold = global_best - margin * abs(global_best)
+		else:
+			global_threshold = global_best + margin * abs(global_best)
+
+	args["fidelity"] = low
+	evaluations = 0
+	promoted = []
+	for particle in topology.internalSwarm:
+		evaluations += particle.evaluate(**args)
+		particle.rejected = False
+		if not calibrated:
+			promoted.append(particle)
+			continue
+		estimate = slope * particle.fitness + intercept
+		best = particle.ownBestFitness
+		if maximize:
+			promote = estimate >= best - margin * abs(best) or estimate >= global_threshold
+		else:
+			promote = estimate <= best + margin * abs(best) or estimate <= global_threshold
+		if promote:
+			promoted.append(particle)
+	counters[low] = counters.get(low, 0) + evaluations
+
+	args["fidelity"] = high
+	high_evaluations = 0
+	for particle in promoted:
+		low_fitness = particle.fitness
+		high_evaluations += particle.evaluate(**args)
+		pairs.append((low_fitness, particle.fitness))
+	del pairs[:-window]
+	counters[high] = counters.get(high, 0) + high_evaluations
+
+	topology.evaluations += evaluations + high_evaluations
+	topology.clear_flags()
+
+
+def BoundedEvaluation(pso_engine, **args):
+	""" Update Particle Evaluation function - bounded evaluation. The own best
+	fitness of each particle is passed to the evaluator functions as the
+	*threshold* argument, so they can stop as soon as the particle can not
+	improve its own best and return a :class:`PartialFitness` (see
+	:func:`boundedSum`). The partial fitness never updates the own best (see
+	:func:`Communicators.P1DGlobalInfoCommunicator`) and the stopped evaluations
+	are counted in the *partial* counter of the *evaluationCounters* param.
+
+	Example:
+		>>> particle.evaluator.set(objective)
+		>>> topology.evaluation_updater.set(Evaluators.BoundedEvaluation)
+
+	:param pso_engine: the PSO Engine
+
+	"""
+	topology = pso_engine.topology
+	counters = getCounters(pso_engine)
+	evaluations = 0
+	partial = 0
+	for particle in topology.internalSwarm:
+		args["threshold"] = particle.ownBestFitness
+		evaluations += particle.evaluate(**args)
+		particle.rejected = False
+		if particle.partial:
+			partial += 1
+	counters["partial"] = counters.get("partial", 0) + partial
+	topology.evaluations += evaluations
+	topology.clear_flags()
+
+
+def addSample(samples, value):
+	""" Returns the sample statistics with a new sample (Welford's update)
+
+	:param samples: the tuple (count, mean, m2), m2 is the sum of the squared deviations
+	:param value: the new sample
+	:rtype: the new tuple (count, mean, m2)
+
+	"""
+	count, mean, m2 = samples
+	count += 1
+	delta = value - mean
+	mean += delta / count
+	return count, mean, m2 + delta * (value - mean)
+
+
+def pooledVariance(statistics):
+	""" Returns the pooled variance of the sample statistics, None when no
+	statistics has two samples
+
+	:param statistics: the list of (count, mean, m2) tuples
+	:rtype: the variance or None
+
+	"""
+	m2 = 0.0
+	degrees = 0
+	for count, mean, deviations in statistics:
+		m2 += deviations
+		degrees += count - 1
+	if degrees == 0:
+		return None
+	return m2 / degrees
+
+
+def evaluateOwnBest(particle, **args):
+	""" Evaluates the own best position of the particle, the current position
+	and fitness of the particle are kept
+
+	:param particle: the particle
+	:param args: these parameters will be passed to the evaluator
+	:rtype: the fitness of the own best position
+
+	"""
+	position = particle.position
+	fitness = particle.fitness
+	particle.position = particle.ownBestPosition
+	try:
+		particle.evaluate(**args)
+		return particle.fitness
+	finally:
+		particle.position = position
+		particle.fitness = fitness
+
+
+def NoisyEvaluation(pso_engine, **args):
+	""" Update Particle Evaluation function - noisy evaluation. The moved particles
+	are evaluated once, then the re-evaluations are allocated one by one to the
+	least separated comparison, the smallest difference of the means in standard
+	errors (pooled variance of the samples of the swarm), like the OCBA allocation.
+	The comparisons are the current fitness of each particle against its own best
+	fitness (the own best update) and the own best fitness of each particle against
+	the best own best fitness (the global best). The side of the comparison with
+	fewer samples is re-evaluated, the own best position (see :func:`evaluateOwnBest`)
+	when they are even, so a lucky sample does not lock the own best. The best own
+	best is first re-evaluated up to the OCBA ratio, sqrt(sum(N_i^2)) samples for the
+	N_i samples of the other own bests.
+
+	The re-evaluations stop when all the comparisons are separated by more than
+	*noiseConfidence* standard errors (default is Consts.CDefNoiseConfidence) or
+	when *noiseBudget* times the swarm size re-evaluations were done in the step
+	(default is Consts.CDefNoiseBudget). The fitness and the own best fitness are
+	the means of their samples, the sample statistics are kept in the *samples*
+	and *ownBestSamples* attributes of the particles and the re-evaluations are
+	counted in the *resamples* counter of the *evaluationCounters* param. The
+	evaluations are done with the *resample* argument set, so the evaluation
+	caches (see :class:`ParticleMixed.ParticleMixed`) do not return a previous
+	sample.
+
+	Example:
+		>>> topology.evaluation_updater.set(Evaluators.NoisyEvaluation)
+		>>> pso_engine.setParams(noiseBudget=0.5)
+
+	:param pso_engine: the PSO Engine
+
+	"""
+	topology = pso_engine.topology
+	swarm = topology.internalSwarm
+	budget = int(round(pso_engine.getParam("noiseBudget", Consts.CDefNoiseBudget) * len(swarm)))
+	confidence = pso_engine.getParam("noiseConfidence", Consts.CDefNoiseConfidence)
+	maximize = pso_engine.minimax == Consts.minimaxType["maximize"]
+	counters = getCounters(pso_engine)
+	args["resample"] = True
+
+	evaluations = 0
+	current = []
+	incumbent = []
+	for particle in swarm:
+		incumbent.append(particle.ownBestSamples or (1, particle.ownBestFitness, 0.0))
+		evaluations += particle.evaluate(**args)
+		particle.rejected = False
+		current.append((1, particle.fitness, 0.0))
+
+	resamples = 0
+	while resamples < budget:
+		variance = pooledVariance(current + incumbent)
+		if variance is not None and variance <= 0.0:
+			break
+		means = [stats[1] for stats in incumbent]
+		if maximize:
+			best = max(xrange(len(means)), key=means.__getitem__)
+		else:
+			best = min(xrange(len(means)), key=means.__getitem__)
+		#OCBA: the best is sampled sqrt(sum(N_i^2)) times for the equal variances
+		target = sum([stats[0] ** 2 for stats in incumbent]) - incumbent[best][0] ** 2
+		if incumbent[best][0] ** 2 < target:
+			incumbent[best] = addSample(incumbent[best], evaluateOwnBest(swarm[best], **args))
+			resamples += 1
+			continue
+		chosen = None
+		separation = confidence
+		for i in xrange(len(swarm)):
+			for a, b in ((current[i], incumbent[i]), (incumbent[i], incumbent[best])):
+				if a is b:
+					continue
+				if variance is None:
+					z = 0.0
+				else:
+					z = abs(a[1] - b[1]) / (variance * (1.0 / a[0] + 1.0 / b[0])) ** 0.5
+				if z < separation:
+					chosen, separation = (i, a, b), z
+		if chosen is None:
+			break
+		i, a, b = chosen
+		if a is current[i] and a[0] < b[0]:
+			particle = swarm[i]
+			particle.evaluate(**args)
+			current[i] = addSample(current[i], particle.fitness)
+		else:
+			if a is not current[i] and b[0] < a[0]:
+				i = best
+			incumbent[i] = addSample(incumbent[i], evaluateOwnBest(swarm[i], **args))
+		resamples += 1
+
+	for i in xrange(len(swarm)):
+		particle = swarm[i]
+		particle.samples = current[i]
+		particle.fitness = current[i][1]
+		particle.ownBestSamples = incumbent[i]
+		particle.ownBestFitness = incumbent[i][1]
+	counters["resamples"] = counters.get("resamples", 0) + resamples
+	topology.evaluations += evaluations + resamples
+	topology.clear_flags()
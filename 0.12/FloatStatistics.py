@@ -18,13 +18,15 @@ limitations under the License.
 
 0.10 2009-04-16 Initial version.
 0.23 2009-09-15 Added the class Swarm Statistics and changed the name to Float Statistics. New API and redesign.
+0.24 2026-10-19 Added the class Diversity Statistics.
+0.24 2026-10-19 Added the class Archive Statistics.
 '''
 
 """
 :mod:`FloatStatistics` -- the  Real Representation (Float numbers) statistics.
 ================================================================
 
-	This module have the Topology Statistics and Swarm Statistics Class. 
+	This module have the Topology Statistics, Swarm Statistics and Diversity Statistics Class. 
 	The Topology Statistics Class is responsable to keep
 	the information about the best particle of the topology at each timeStep
 	during the evolution proccess. 
@@ -138,3 +140,107 @@ class SwarmStatistics(Statistics.Statistics):
 		return strBuff
 
 
+class DiversityStatistics(Statistics.Statistics):
+	""" Diversity Statistics Class - A class bean-like to store the swarm diversity statistics
+
+	The statistics hold by this class are:
+
+	**centroidDist, radius**
+      The mean and the maximum distance of the particles to the swarm centroid
+
+	**diameter**
+      The diagonal of the bounding box of the particles positions
+
+	**spreadAvg, spreadMin, spreadMax**
+      Average, minimum and maximum of the per-dimension standard deviation of the positions
+
+	**velocityAvg, velocityMax**
+      Average and maximum magnitude of the particles velocities
+
+	The per-dimension spread is kept in the *dimSpread* list.
+
+	All the statistics are computed in O(n.d) passes over the swarm, the diversity
+	statistics are optional and they are only computed when set in the topology.
+
+	Example:
+		>>> topology.setDiversityStatistics(FloatStatistics.DiversityStatistics())
+		(...)
+		>>> stats = topology.getDiversityStatistics()
+		>>> stats["diameter"]
+		10.2
+	"""
+
+	def __init__(self):
+		""" The Diversity Statistics Class Creator """
+		#Call the superclass constructor
+		super(DiversityStatistics,self).__init__()
+		self.internalDict = {   "centroidDist" : 0.0,
+                                "radius"       : 0.0,
+                                "diameter"     : 0.0,
+                                "spreadAvg"    : 0.0,
+                                "spreadMin"    : 0.0,
+                                "spreadMax"    : 0.0,
+                                "velocityAvg"  : 0.0,
+                                "velocityMax"  : 0.0
+                             }
+
+		self.descriptions = {   "centroidDist" : "Mean distance to the centroid",
+                                "radius"       : "Maximum distance to the centroid",
+                                "diameter"     : "Swarm diameter (bounding box)",
+                                "spreadAvg"    : "Average spread per dimension",
+                                "spreadMin"    : "Minimum spread per dimension",
+                                "spreadMax"    : "Maximum spread per dimension",
+                                "velocityAvg"  : "Average velocity magnitude",
+                                "velocityMax"  : "Maximum velocity magnitude"
+                            }
+		self.dimSpread = []
+
+	def getDimSpread(self):
+		""" Returns the list of the standard deviation of the positions, per dimension """
+		return self.dimSpread
+
+
+class ArchiveStatistics(Statistics.Statistics):
+	""" Archive Statistics Class - A class bean-like to store the Pareto archive statistics
+
+	The statistics hold by this class are:
+
+	**size**
+      Number of non-dominated solutions in the archive
+
+	**insertions, pruned**
+      Number of solutions inserted and pruned on the last step
+
+	**idealPoint, nadirPoint**
+      Best and worst value of every objective in the archive
+
+	Example:
+		>>> stats = topology.getArchiveStatistics()
+		>>> stats["size"]
+		100
+	"""
+
+	def __init__(self):
+		""" The Archive Statistics Class Creator """
+		#Call the superclass constructor
+		super(ArchiveStatistics,self).__init__()
+		self.internalDict = {   "size"       : 0,
+                                "insertions" : 0,
+                                "pruned"     : 0,
+                                "idealPoint" : (),
+                                "nadirPoint" : ()
+                             }
+
+		self.descriptions = {   "size"       : "Archive size",
+                                "insertions" : "Solutions inserted on the last step",
+                                "pruned"     : "Solutions pruned on the last step",
+                                "idealPoint" : "Ideal point of the archive",
+                                "nadirPoint" : "Nadir point of the archive"
+                            }
+
+	def __repr__(self):
+		""" Return a string representation of the statistics """
+		strBuff = "- Pareto Archive Statistics\n"
+		for k,v in self.internalDict.items():
+			strBuff += "\t%-45s = %s\n" % (self.descriptions.get(k,k), v)
+		return strBuff
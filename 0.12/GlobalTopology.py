@@ -18,6 +18,9 @@ limitations under the License.
 
 0.10 2009-04-18 Initial version.
 0.23 2009-09-10 Added support for new API and Docs.
+0.24 2026-10-19 The particles evaluation is now a separated slot (evaluation_updater).
+0.24 2026-10-19 The global best is updated once per step by the topology (updateBestParticle).
+0.24 2026-10-19 The evaluation updater uses the topology evaluation (constraint handling).
 '''
 
 """
@@ -35,10 +38,12 @@ def updateParticlesInformation(pso_engine, **args):
 	""" Update Particle Information function of Global Topology
 	
 	"""
+	pso_engine.topology.improvements = 0
 	for particle in pso_engine.topology.internalSwarm:
 		args["pso_engine"] = pso_engine
 		for it in particle.information_communicator.applyFunctions(particle,**args):
 			pass
+	pso_engine.topology.updateBestParticle()
 	pso_engine.topology.clear_flags()
 
 
@@ -49,7 +54,13 @@ def updateParticlesPosition(pso_engine, **args):
 		args["pso_engine"] = pso_engine
 		for it in particle.position_communicator.applyFunctions(particle,**args):
 			pass
-		particle.evaluate()
+
+
+def updateParticlesEvaluation(pso_engine, **args):
+	""" Update Particle Evaluation function of Global Topology, evaluates
+	all the particles moved by the position updater
+	"""
+	pso_engine.topology.evaluate(**args)
 
 class GlobalTopology(TopologyBase):
 	
@@ -91,6 +102,12 @@ class GlobalTopology(TopologyBase):
 	
 	topology.position_updater.set(GlobalTopology.GlobalPositionUpdater)
 	
+	"""
+	evaluation_updater = None
+	""" This is the evaluation topology function slot, you can change the default
+	updater using the slot *set* function: ::
+	
+	topology.evaluation_updater.set(GlobalTopology.updateParticlesEvaluation)
 	"""
 	information_updater = None
 	""" This is the information update topology function slot, you can change the default
@@ -104,6 +121,7 @@ class GlobalTopology(TopologyBase):
 		TopologyBase.__init__(self,particle)
 		
 		self.position_updater.set(updateParticlesPosition)
+		self.evaluation_updater.set(updateParticlesEvaluation)
 		self.information_updater.set(updateParticlesInformation)
 		
 
@@ -0,0 +1,115 @@
+'''
+Particle Swarm Optimization - PyPSO
+
+Copyright (c) 2009 Marcel Pinheiro Caraciolo
+caraciol@gmail.com
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+0.10 2026-10-19 Initial version.
+'''
+
+"""
+
+:mod:`Inertia` -- inertia weight schedules module
+==============================================================
+
+    This module contains the *inertia schedule* functions used by the INERTIA
+    PSO type. The schedule is called once per step by the PSO Engine, which keeps
+    the value in the *inertiaFactor* attribute read by the communicators.
+
+    The schedules read the *inertiaMax* and *inertiaMin* engine params (defaults
+    are Consts.CDefInertiaRange), set with :meth:`Pso.SimplePSO.setParams`: ::
+
+        pso_engine.setParams(inertiaMax=0.9, inertiaMin=0.4)
+        pso_engine.inertiaSchedule.set(Inertia.InertiaChaotic)
+
+"""
+
+import Consts
+import random
+import math
+
+
+def getInertiaRange(pso_engine):
+	""" Returns the (inertiaMax, inertiaMin) params of the engine
+
+	:param pso_engine: the PSO Engine
+	:rtype: the tuple (maximum, minimum)
+
+	"""
+	w_max, w_min = Consts.CDefInertiaRange
+	return (pso_engine.getParam("inertiaMax", w_max), pso_engine.getParam("inertiaMin", w_min))
+
+
+def InertiaConstant(pso_engine):
+	""" Constant inertia weight, given by the *inertia* param (default is Consts.CDefInertia)
+
+	:param pso_engine: the PSO Engine
+
+	"""
+	return pso_engine.getParam("inertia", Consts.CDefInertia)
+
+
+def InertiaLinearDecay(pso_engine):
+	""" Linear decreasing inertia weight, from *inertiaMax* at the first step
+	to *inertiaMin* at the last step (Shi and Eberhart)
+
+	:param pso_engine: the PSO Engine
+
+	"""
+	w_max, w_min = getInertiaRange(pso_engine)
+	return w_max - (w_max - w_min) * pso_engine.currentStep / float(pso_engine.timeSteps)
+
+
+def InertiaExponentialDecay(pso_engine):
+	""" Exponential decreasing inertia weight, from *inertiaMax* towards *inertiaMin*
+	with the decay rate given by the *inertiaDecay* param (default is Consts.CDefInertiaDecay)
+
+	:param pso_engine: the PSO Engine
+
+	"""
+	w_max, w_min = getInertiaRange(pso_engine)
+	decay = pso_engine.getParam("inertiaDecay", Consts.CDefInertiaDecay)
+	return w_min + (w_max - w_min) * math.exp(-decay * pso_engine.currentStep / float(pso_engine.timeSteps))
+
+
+def InertiaChaotic(pso_engine):
+	""" Chaotic decreasing inertia weight, the linear decay is modulated by the
+	logistic map z = 4z(1 - z), whose state is kept in the engine *inertiaState*
+
+	:param pso_engine: the PSO Engine
+
+	"""
+	w_max, w_min = getInertiaRange(pso_engine)
+	z = pso_engine.inertiaState
+	if z is None:
+		#The logistic map is not chaotic for the fixed points 0, 0.25, 0.5, 0.75 and 1
+		z = random.uniform(0.01, 0.24)
+	z = 4.0 * z * (1.0 - z)
+	pso_engine.inertiaState = z
+	remaining = (pso_engine.timeSteps - pso_engine.currentStep) / float(pso_engine.timeSteps)
+	return (w_max - w_min) * remaining + w_min * z
+
+
+def InertiaAdaptive(pso_engine):
+	""" Adaptive inertia weight based on the success rate of the swarm, the rate of
+	particles which improved its own best fitness on the last step (AIWPSO)
+
+	:param pso_engine: the PSO Engine
+
+	"""
+	w_max, w_min = getInertiaRange(pso_engine)
+	topology = pso_engine.getTopology()
+	success_rate = topology.improvements / float(len(topology))
+	return w_min + (w_max - w_min) * success_rate
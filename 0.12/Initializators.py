@@ -17,6 +17,10 @@ See the License for the specific language governing permissions and
 limitations under the License.
 
 0.10 2009-09-30 Initial version.
+0.11 2026-10-19 Added the binary and categorical initializators, the range defaults are in Consts.
+0.11 2026-10-19 Added the mixed-variable initializators, fixed the 1D List initializators.
+0.11 2026-10-19 Added the categorical velocity initializator.
+0.11 2026-10-19 The real velocity initializator reads the limits from the particle.
 '''
 
 """
@@ -32,16 +36,29 @@ choosing random data.
 
 from random import randint as rand_randint, uniform as rand_uniform, choice as rand_choice
 import Util
+import Consts
 
 #############################
 ##     1D Binary String    ##
 #############################
 
 def P1DBinaryStringInitializator(vector, **args):
-   """ 1D Binary String initializator """
-   vector.clearString()
-   for i in xrange(len(vector)):
-      vector.append(rand_choice((0,1)))
+   """ 1D Binary String initializator of the :class:`ParticleBinary.ParticleBinary`,
+   the own best position is the initial position """
+   vector.setBits(vector.getRandomState().randint(0, 2, len(vector)))
+   vector.setOwnBestPosition(vector.getPosition())
+
+def P1DBinaryVelInitializator(vector, **args):
+   """ Velocity initializator of the :class:`ParticleBinary.ParticleBinary`
+
+   This initializator accepts the *rangeVelmin* and *rangeVelmax* vector parameters
+   (defaults are Consts.CDefBinaryVelocityRange).
+
+   """
+   vel_min, vel_max = Consts.CDefBinaryVelocityRange
+   vel_min = vector.getParam("rangeVelmin", vel_min)
+   vel_max = vector.getParam("rangeVelmax", vel_max)
+   vector.getVelocity()[:] = vector.getRandomState().uniform(vel_min, vel_max, len(vector))
 
 ####################
 ##     1D List    ##
@@ -59,11 +76,47 @@ def P1DListInitializatorDimmension(vector, **args):
    if dimmension is None:
       Util.raiseException("to use the P1DListInitializatorDimmension, you must specify the 'dimmension' parameter")
 
-   vector.clearList()
+   vector.clearList("position")
    
-   for i in xrange(vector.listSize):
+   for i in xrange(vector.dimmensionsSize):
       random_dimmension = dimmension[i].getRandomDimmension()
-      vector.append(random_dimmension)
+      vector.append("position", random_dimmension)
+
+def P1DListInitializatorCategorical(vector, **args):
+   """ Categorical position initialization function of Particle1D, the position is
+   a random option index of each dimmension, see :func:`Communicators.P1DCategoricalPosCommunicator`
+   and :func:`P1DVelListInitializatorCategorical`
+
+   To use this initializator, you must specify the *dimmension* particle parameter with the
+   :class:`PsoDimmension.PsoDimmensions` instance of :class:`PsoDimmension.DimmensionList`.
+
+   """
+   dimmension = vector.getParam("dimmension", None)
+   if dimmension is None:
+      Util.raiseException("to use the P1DListInitializatorCategorical, you must specify the 'dimmension' parameter")
+
+   vector.clearList("position")
+   for i in xrange(vector.dimmensionsSize):
+      vector.append('position', rand_randint(0, len(dimmension[i]) - 1))
+
+def P1DVelListInitializatorCategorical(vector, **args):
+   """ Categorical velocity initialization function of Particle1D, see
+   :func:`Communicators.P1DCategoricalPosCommunicator`
+
+   The velocity of each dimmension is drawn from the *rangeVelmin* and *rangeVelmax*
+   vector parameters, the default limits are -/+ the number of options of the
+   dimmension times the *velocityFraction* parameter (default is
+   Consts.CDefVelocityFraction).
+
+   """
+   dimmension = vector.getParam("dimmension", None)
+   if dimmension is None:
+      Util.raiseException("to use the P1DVelListInitializatorCategorical, you must specify the 'dimmension' parameter")
+
+   vector.clearList("velocity")
+   for i in xrange(vector.dimmensionsSize):
+      vel_min, vel_max = Util.velocityRange(vector, len(dimmension[i]))
+      vector.append('velocity', rand_uniform(vel_min, vel_max))
 
 def P1DListInitializatorInteger(vector, **args):
    """ Integer initialization function of Particle1D
@@ -71,37 +124,67 @@ def P1DListInitializatorInteger(vector, **args):
    This initializator accepts the *rangemin* and *rangemax* particle parameters.
 
    """
-   vector.clearList()
+   vector.clearList("position")
    
-   for i in xrange(vector.listSize):
+   for i in xrange(vector.dimmensionsSize):
       randomInteger = rand_randint(vector.getParam("rangemin", 0),
                                    vector.getParam("rangemax", 100))
-      vector.append(randomInteger)
+      vector.append("position", randomInteger)
 
 
 def P1DPosListInitializatorReal(vector, **args):
    """ Real  position initialization function of Particle1D
 
-   This initializator accepts the *rangemin* and *rangemax* vector parameters.
+   This initializator accepts the *rangePosmin* and *rangePosmax* vector parameters
+   (defaults are Consts.CDefRangePosition).
 
    """
    vector.clearList("position")
+   pos_min, pos_max = Consts.CDefRangePosition
+   pos_min = vector.getParam("rangePosmin", pos_min)
+   pos_max = vector.getParam("rangePosmax", pos_max)
 
    for i in xrange(vector.dimmensionsSize):
-      randomReal = rand_uniform(vector.getParam("rangePosmin", -100),
-                                vector.getParam("rangePosmax", 100))
+      randomReal = rand_uniform(pos_min, pos_max)
       vector.append('position',randomReal)
 
 
 def P1DVelListInitializatorReal(vector, **args):
    """ Real  velocity initialization function of Particle1D
 
-   This initializator accepts the *rangemin* and *rangemax* vector parameters.
+   This initializator accepts the *rangeVelmin* and *rangeVelmax* vector parameters
+   (defaults are given by :meth:`Particle1D.Particle1D.getVelocityRange`).
 
    """
    vector.clearList("velocity")
+   vel_min, vel_max = vector.getVelocityRange()
 
    for i in xrange(vector.dimmensionsSize):
-      randomReal = rand_uniform(vector.getParam("rangeVelmin", 0),
-                                vector.getParam("rangeVelMax", 100))
+      randomReal = rand_uniform(vel_min, vel_max)
       vector.append('velocity',randomReal)
+
+#############################
+##     Mixed variables     ##
+#############################
+
+def P1DMixedInitializator(vector, **args):
+   """ Position initialization function of the :class:`ParticleMixed.ParticleMixed`,
+   every block is drawn uniformly from its ranges (the categorical block from its
+   options), the own best position is the initial position """
+   rand = vector.getRandomState()
+   real, integer, categorical = vector.getPosition()
+   real[:] = rand.uniform(vector.realMin, vector.realMax)
+   integer[:] = [rand.randint(low, high + 1) for low, high in zip(vector.intMin, vector.intMax)]
+   categorical[:] = (rand.random_sample(len(categorical)) * vector.catSize).astype(categorical.dtype)
+   vector.setOwnBestPosition(vector.getPosition())
+
+def P1DMixedVelInitializator(vector, **args):
+   """ Velocity initialization function of the :class:`ParticleMixed.ParticleMixed`,
+   the velocity of the real and integer blocks is drawn uniformly from
+   [-width/2, width/2] of the range """
+   rand = vector.getRandomState()
+   realVel, intVel = vector.getVelocity()
+   realSpan = (vector.realMax - vector.realMin) * 0.5
+   intSpan = (vector.intMax - vector.intMin) * 0.5
+   realVel[:] = rand.uniform(-realSpan, realSpan)
+   intVel[:] = rand.uniform(-intSpan, intSpan)
@@ -17,6 +17,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 
 0.10 2009-04-29 Initial version.
+0.24 2026-10-19 Matplotlib and Numpy are imported only when a plot is used.
 '''
 
 """
@@ -31,23 +32,14 @@ and exposes to you in the name space called "it".
 To use this mode, the parameter *interactiveMode* must be enabled in the
 :class:`Pso.SimplePSO`.
 
+Matplotlib and Numpy are only imported when the first plot is created.
+
 """
 import Util
 
-try:
-   print "Loading module pylab (matplotlib)...",
-   import pylab
-   print " done!"
-except:
-   print "\nWarning: cannot import Matplotlib ! Plots will not be available !"
-
-try:
-   print "Loading module numpy...",
-   import numpy
-   print " done!"
-except:
-   print "\nWarning: cannot import Numpy ! Some functions will not be available !"
-   
+pylab = Util.LazyModule("pylab", "cannot import Matplotlib ! Plots will not be available !")
+numpy = Util.LazyModule("numpy", "cannot import Numpy ! Some functions will not be available !")
+
 
 def getSwarmFitness(topology, bestFitness=False):
     """ Returns a list of swarm fitness scores
@@ -0,0 +1,189 @@
+'''
+Particle Swarm Optimization - PyPSO
+
+Copyright (c) 2009 Marcel Pinheiro Caraciolo
+caraciol@gmail.com
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+0.10 2026-10-19 Initial version.
+0.11 2026-10-19 The SIGUSR1 handler is installed without a terminal too (batch jobs).
+'''
+
+"""
+:mod:`InteractiveListener` -- the interactive mode listener
+================================================================
+
+This module contains the :class:`InteractiveListener.InteractiveListener` class,
+which watches the terminal for the ESC key in a background thread and raises a
+flag that the :class:`Pso.SimplePSO` main loop checks with a single attribute test.
+On POSIX systems the *SIGUSR1* signal raises the same flag.
+
+When the standard input is not a terminal (batch jobs, schedulers, pipes) no
+thread is started and the terminal is never touched, only the *SIGUSR1* handler
+is installed, so a batch run can still be inspected with ``kill -USR1 <pid>``.
+The handler is only installed by the main thread.
+
+"""
+
+import sys
+import threading
+from time import sleep
+import Consts
+
+try:
+	import signal
+except ImportError:
+	signal = None
+
+
+class InteractiveListener(object):
+	""" InteractiveListener Class - Requests the Interactive Mode of the PSO Engine
+
+	Example:
+		>>> listener = InteractiveListener(poll_time=0.2)
+		>>> listener.start()
+		>>> if listener.requested:
+		>>>		listener.pause()
+		>>>		(...)
+		>>>		listener.resume()
+		>>> listener.stop()
+
+	:param poll_time: the key polling interval of the listener thread, in seconds
+
+	"""
+
+	def __init__(self, poll_time=Consts.CDefInteractivePollTime):
+		""" The InteractiveListener Class Creator """
+		self.pollTime = poll_time
+		self.requested = False
+		self.listening = False
+		self.paused = False
+		self.thread = None
+		self.termSettings = None
+		self.oldHandler = None
+		self.handlerInstalled = False
+
+	def __repr__(self):
+		""" Returns the string representation of the listener """
+		return "Interactive Listener [Listening: %s, Poll Time: %.2fs]" % (self.listening, self.pollTime)
+
+	def isTerminal(self):
+		""" Returns True if the standard input is an interactive terminal """
+		try:
+			return sys.stdin.isatty()
+		except (AttributeError, ValueError):
+			return False
+
+	def start(self):
+		""" Starts to listen the SIGUSR1 signal and, if the standard input is a
+		terminal, the ESC key. Does nothing without a terminal nor a signal handler """
+		self.requested = False
+		if self.listening:
+			return
+
+		if signal is not None and hasattr(signal, "SIGUSR1"):
+			try:
+				self.oldHandler = signal.signal(signal.SIGUSR1, self.__signalHandler)
+				self.handlerInstalled = True
+			except ValueError:
+				#Signal handlers can only be set by the main thread
+				self.oldHandler = None
+
+		terminal = self.isTerminal()
+		if not terminal and not self.handlerInstalled:
+			return
+		self.listening = True
+		self.paused = False
+		if not terminal:
+			return
+		self.__setTerminal()
+		self.thread = threading.Thread(target=self.__listen, name="PyPSO Interactive Listener")
+		self.thread.setDaemon(True)
+		self.thread.start()
+
+	def stop(self):
+		""" Stops the listener thread and restores the terminal and the signal handler """
+		if not self.listening:
+			return
+		self.listening = False
+		if self.thread is not None:
+			self.thread.join(self.pollTime * 2)
+			self.thread = None
+		self.__restoreTerminal()
+		if self.handlerInstalled:
+			#None when the previous handler was not installed from Python
+			if self.oldHandler is not None:
+				signal.signal(signal.SIGUSR1, self.oldHandler)
+			self.oldHandler = None
+			self.handlerInstalled = False
+
+	def pause(self):
+		""" Stops reading the keys and restores the terminal, must be called
+		before opening the interactive session """
+		self.paused = True
+		self.__restoreTerminal()
+
+	def resume(self):
+		""" Clears the request and resumes the key reading """
+		self.requested = False
+		if self.thread is not None:
+			self.__setTerminal()
+		self.paused = False
+
+	def __signalHandler(self, signum, frame):
+		""" The SIGUSR1 handler, only raises the flag """
+		self.requested = True
+
+	def __setTerminal(self):
+		""" Puts the POSIX terminal in cbreak mode, the keys are read without <Enter> """
+		if sys.platform[:3] == "win":
+			return
+		import termios, tty
+		fd = sys.stdin.fileno()
+		if self.termSettings is None:
+			self.termSettings = termios.tcgetattr(fd)
+		tty.setcbreak(fd)
+
+	def __restoreTerminal(self):
+		""" Restores the original POSIX terminal mode """
+		if self.termSettings is None:
+			return
+		import termios
+		termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, self.termSettings)
+		self.termSettings = None
+
+	def __readKey(self):
+		""" Waits at most pollTime seconds for a key, returns the key or None """
+		if sys.platform[:3] == "win":
+			import msvcrt
+			if msvcrt.kbhit():
+				return msvcrt.getch()
+			sleep(self.pollTime)
+			return None
+
+		import select
+		ready = select.select([sys.stdin], [], [], self.pollTime)[0]
+		if ready and not self.paused:
+			return sys.stdin.read(1)
+		return None
+
+	def __listen(self):
+		""" The listener thread loop """
+		while self.listening:
+			if self.paused:
+				sleep(self.pollTime)
+				continue
+			key = self.__readKey()
+			if key and ord(key) == Consts.CDefESCKey:
+				self.requested = True
@@ -0,0 +1,243 @@
+'''
+Particle Swarm Optimization - PyPSO
+
+Copyright (c) 2009 Marcel Pinheiro Caraciolo
+caraciol@gmail.com
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+0.10 2026-10-19 Initial version.
+0.11 2026-10-19 The archive is filled by initializeBests() (ask/tell).
+0.11 2026-10-19 The statistics read the positions with getCoordinates() (binary particles).
+0.11 2026-10-19 Added getStatisticsSources(), the snapshots read the archive statistics.
+0.11 2026-10-19 The archive and the compromise particle compare the constraint violations first.
+'''
+
+"""
+:mod:`MultiObjectiveTopology` -- the Multi-Objective Topology (MOPSO)
+================================================================
+
+    This is the multi-objective topology, the evaluator of the particles returns
+    a tuple with one fitness per objective (all the objectives share the minimax
+    type of the engine). The non-dominated solutions found are kept in a bounded
+    :class:`Archive.ParetoArchive` and each particle follows a leader selected
+    from the archive.
+    This topology class extends the :class:`TopologyBase.TopologyBase` class.
+
+"""
+
+from TopologyBase import *
+from Archive import ParetoArchive
+from FloatStatistics import ArchiveStatistics
+import GlobalTopology
+import Communicators
+
+
+def updateParticlesPosition(pso_engine, **args):
+	""" Update Particle Position function of the Multi-Objective Topology, a leader
+	is selected from the archive for each particle
+	"""
+	topology = pso_engine.topology
+	archive = topology.archive
+	for particle in topology.internalSwarm:
+		args["pso_engine"] = pso_engine
+		topology.leaderPosition = archive.selectLeader()
+		for it in particle.position_communicator.applyFunctions(particle,**args):
+			pass
+	topology.leaderPosition = None
+
+
+def updateParticlesInformation(pso_engine, **args):
+	""" Update Particle Information function of the Multi-Objective Topology, updates
+	the own bests of the particles and inserts the new solutions in the archive
+	"""
+	topology = pso_engine.topology
+	topology.improvements = 0
+	for particle in topology.internalSwarm:
+		args["pso_engine"] = pso_engine
+		for it in particle.information_communicator.applyFunctions(particle,**args):
+			pass
+	topology.updateArchive()
+	topology.updateBestParticle()
+	topology.clear_flags()
+
+
+class MultiObjectiveTopology(TopologyBase):
+	""" Multi-Objective Topology Class - The container for the swarm and the Pareto archive
+
+	**Examples**
+		>>> particle.evaluator.set(lambda p: (f1(p.position), f2(p.position)))
+		>>> topology = MultiObjectiveTopology(particle, archive_size=100)
+		>>> pso_engine = Pso.SimplePSO(topology)
+		>>> pso_engine.execute()
+		>>> for fitness, position in topology.getArchive():
+		>>>		print fitness
+		(...)
+
+	The information communicator of the particle is set to
+	:func:`Communicators.P1DParetoInfoCommunicator`.
+
+	The best particle of the topology is the compromise particle, whose own best is
+	the nearest to the ideal point of the archive in the normalized objective space.
+	With constraints, the solutions are compared by the feasibility rules (see
+	:func:`Archive.constrainedDominates`), use the *feasibility* constraint handling.
+	The swarm statistics are not computed (the fitness is a vector), the archive
+	statistics are in :meth:`getArchiveStatistics`.
+
+	:param particle: the :term: `Sample particle``
+	:param archive_size: the maximum size of the archive, default is Consts.CDefArchiveSize
+
+	"""
+
+	multiObjective = True
+
+	def __init__(self, particle, archive_size=Consts.CDefArchiveSize):
+		""" The Multi-Objective Topology Class Creator, particle representation must be specified."""
+		TopologyBase.__init__(self,particle)
+		self.archive = ParetoArchive(archive_size)
+		self.archiveStats = ArchiveStatistics()
+		#Leader of the particle being moved by the position updater
+		self.leaderPosition = None
+
+		particle.information_communicator.set(Communicators.P1DParetoInfoCommunicator)
+		self.position_updater.set(updateParticlesPosition)
+		self.evaluation_updater.set(GlobalTopology.updateParticlesEvaluation)
+		self.information_updater.set(updateParticlesInformation)
+
+	def __repr__(self):
+		""""Return a string representation of the Multi-Objective Topology """
+		ret = TopologyBase.__repr__(self)
+		ret += "-Multi-Objective Topology\n"
+		ret += self.archive.__repr__()
+		return ret
+
+	def getArchive(self):
+		""" Return the Pareto archive of the topology
+
+		:rtype: the :class:`Archive.ParetoArchive` instance
+
+		"""
+		return self.archive
+
+	def getArchiveStatistics(self):
+		""" Return the archive statistics
+
+		:rtype: the :class:`FloatStatistics.ArchiveStatistics` instance
+
+		"""
+		self.statistics()
+		return self.archiveStats
+
+	def getStatisticsSources(self):
+		""" Returns the statistics instances computed by :meth:`statistics`, the
+		archive statistics replace the swarm statistics
+
+		:rtype: the list of statistics instances
+
+		"""
+		sources = [self.archiveStats, self.topologyStats]
+		if self.diversityStats is not None:
+			sources.append(self.diversityStats)
+		return sources
+
+	def getBestPosition(self):
+		""" Return the leader of the particle being moved, or the own best
+		position of the compromise particle out of the position update
+
+		:rtype: the position
+
+		"""
+		if self.leaderPosition is not None:
+			return self.leaderPosition
+		return self.bestPosition
+
+	def create(self, **args):
+		""" Clone the example particle fo fill the swarm and clears the archive """
+		TopologyBase.create(self, **args)
+		self.archive.setMinimax(self.minimax)
+
+	def initializeParticles(self):
+		""" Initialize all particles of swarm and clears the archive """
+		self.archive.clear()
+		TopologyBase.initializeParticles(self)
+	
+	def initializeBests(self):
+		""" Sets the own bests of the initial particles and fills the archive """
+		TopologyBase.initializeBests(self)
+		self.updateArchive()
+		self.bestIndex = None
+		self.updateBestParticle()
+
+	def updateArchive(self):
+		""" Inserts the current solutions of the particles in the archive and prunes it """
+		archive = self.archive
+		archive.beginStep()
+		for particle in self.internalSwarm:
+			if not particle.rejected:
+				archive.insert(particle.fitness, particle.position, particle.violation)
+		archive.prune()
+
+	def updateBestParticle(self):
+		""" Find the compromise particle, whose own best is the nearest to the ideal
+		point of the archive in the normalized objective space, among the particles
+		whose own best has the lowest violation. """
+		archive = self.archive
+		if len(archive) == 0:
+			return
+		ideal, nadir = archive.getIdealPoint(), archive.getNadirPoint()
+		spans = [abs(worst - best) or 1.0 for best, worst in zip(ideal, nadir)]
+		distances = []
+		for particle in self.internalSwarm:
+			distance = 0.0
+			for value, best, span in zip(particle.ownBestFitness, ideal, spans):
+				delta = (value - best) / span
+				distance += delta * delta
+			distances.append((particle.ownBestViolation, distance))
+		index = min(xrange(len(distances)), key=distances.__getitem__)
+
+		particle = self.internalSwarm[index]
+		self.bestParticle = particle
+		self.bestViolation = particle.ownBestViolation
+		if index != self.bestIndex or particle.ownBestFitness != self.bestFitness:
+			self.bestIndex = index
+			self.bestFitness = particle.ownBestFitness
+			self.swapBestPosition(particle)
+
+	def statistics(self):
+		""" Do the statistical analysis of the archive and set 'statted' to True """
+		if self.statted: return
+		archive = self.archive
+		self.archiveStats["size"] = len(archive)
+		self.archiveStats["insertions"] = archive.insertions
+		self.archiveStats["pruned"] = archive.pruned
+		self.archiveStats["idealPoint"] = archive.getIdealPoint()
+		self.archiveStats["nadirPoint"] = archive.getNadirPoint()
+
+		self.topologyStats["bestFitness"] = self.bestFitness
+		best_position = self.bestParticle.getCoordinates(self.bestPosition)
+		self.topologyStats["bestPosition"][:] = best_position
+		self.topologyStats["bestPosDim"] = best_position[0]
+		self.topologyStats["position"][:] = self.bestParticle.getCoordinates()
+		self.topologyStats["fitness"] = self.bestParticle.fitness
+
+		if self.diversityStats is not None:
+			self.diversity()
+
+		self.statted = True
+
+	def printStats(self):
+		""" Print statistics of the archive """
+		message = "[Archive] - size/insertions/ideal point [%s/%s/%s]" % (len(self.archive),
+					self.archive.insertions, self.archive.getIdealPoint())
+		print message
+		return message
@@ -17,6 +17,8 @@ See the License for the specific language governing permissions and
 limitations under the License.
 
 0.10 2009-09-02 Initial version.
+0.11 2026-10-19 The best position is updated in place (no new list per improvement).
+0.11 2026-10-19 Added getVelocityRange(), the default velocity limits are symmetric.
 '''
 
 
@@ -31,6 +33,7 @@ limitations under the License.
 
 from ParticleBase import ParticleBase
 import Consts
+import Util
 
 class Particle1D(ParticleBase):
 	""" Particle1D Class - The 1D List particle representation
@@ -121,15 +124,43 @@ class Particle1D(ParticleBase):
 	def getOwnBestPosition(self):
 		""""Return the current best position of the particle """
 		return self.ownBestPosition
+	
+	def getVelocityRange(self):
+		""" Returns the velocity limits, the tuple (rangeVelmin, rangeVelmax) params, the
+		default limits are -/+ the width of the search space (rangePosmin and rangePosmax
+		params, default is Consts.CDefRangePosition) times the *velocityFraction* param
+		(default is Consts.CDefVelocityFraction), see :func:`Util.velocityRange`
+		
+		:rtype: the tuple (minimum, maximum)
+		
+		"""
+		pos_min, pos_max = Consts.CDefRangePosition
+		pos_min = self.getParam("rangePosmin", pos_min)
+		pos_max = self.getParam("rangePosmax", pos_max)
+		return Util.velocityRange(self, pos_max - pos_min)
 		
 	
 	def setOwnBestPosition(self,position):
-		""" Set the best position of the particle 
+		""" Set the best position of the particle, the values are copied into the
+		current best position list (the list is not reallocated)
 			
 			:param position: the best position of the particle
 		"""
 			
-		self.ownBestPosition = position[:]
+		self.ownBestPosition[:] = position
+	
+	def copyOwnBestPosition(self, buffer):
+		""" Copies the best position of the particle into the buffer, in place
+		
+		Example:
+			>>> particle.copyOwnBestPosition(topology.bestPosition)
+		
+		:param buffer: the destination list
+		:rtype: the buffer
+		
+		"""
+		buffer[:] = self.ownBestPosition
+		return buffer
 
 		
 	def __len__(self):
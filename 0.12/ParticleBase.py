@@ -19,6 +19,18 @@ limitations under the License.
 0.10 2009-04-16 Initial version.
 0.20 2009-05-21 Added support for Local Communicator (ownLocalBestPosition and ownLocalBestFitness)
 0.23 2009-08-29 Changed all code for support a better generalization. Particle is now BaseParticle.py
+0.24 2026-10-19 Added copyOwnBestPosition() to copy the best position into a preallocated buffer.
+0.24 2026-10-19 Added the constraints and repairer slots (constraint violation of the particle).
+0.24 2026-10-19 The evaluator can return a tuple (one fitness per objective).
+0.24 2026-10-19 Added the continuous flag of the representations.
+0.24 2026-10-19 Added the numpy random generator of the particle and evaluate() returns the evaluations count.
+0.24 2026-10-19 Added the predicted flag (surrogate models).
+0.24 2026-10-19 Added the fidelity level of the fitness and of the own best fitness.
+0.24 2026-10-19 Added the partial flag (evaluations stopped early, Evaluators.PartialFitness).
+0.24 2026-10-19 Added the sample statistics of the averaged fitness (noisy evaluation).
+0.24 2026-10-19 Added getCoordinates() for the statistics of the encoded positions.
+0.24 2026-10-19 Added getVelocityCoordinates() for the statistics of the velocity blocks.
+0.24 2026-10-19 The resample argument of evaluate() is not passed to the evaluator.
 '''
 
 
@@ -32,6 +44,11 @@ limitations under the License.
 """
 
 from FunctionSlot import FunctionSlot
+import Consts
+import Util
+import random
+
+numpy = Util.LazyModule("numpy")
 
 class ParticleBase(object):
 	"""ParticleBase Class - the base of all particle representation """
@@ -79,7 +96,23 @@ class ParticleBase(object):
 	particle.information_communicator.set(Communicators.P1DGlobalInfoCommunicator)
 	"""
 	
+	continuous = True
+	""" False for the representations whose position is not a list of real values,
+	they are skipped by the boundary handlers (:mod:`Boundaries`) """
+	
+	constraints = None
+	""" This is the constraints function slot, each function returns the violation
+	of the particle (0.0 when satisfied), see the :mod:`Constraints` module: ::
+	
+		particle.constraints.add(Constraints.Inequality(g1))
+	"""
+	
+	repairer = None
+	""" This is the repair function slot, the functions are applied to the
+	infeasible particles before the evaluation: ::
 	
+		particle.repairer.set(Constraints.RepairBisection)
+	"""
 
 	def __init__(self):
 		""" Particle Constructor """
@@ -88,13 +121,33 @@ class ParticleBase(object):
 		self.velocity_initializator = FunctionSlot(" Velocity Initializator")
 		self.position_communicator = FunctionSlot("Position Communicator")
 		self.information_communicator = FunctionSlot("Information Communicator")
+		self.constraints = FunctionSlot("Constraints")
+		self.repairer = FunctionSlot("Repairer")
 		
 		self.allSlots = [self.evaluator, self.position_initializator,
-					self.velocity_initializator, self.position_communicator, self.information_communicator]
+					self.velocity_initializator, self.position_communicator, self.information_communicator,
+					self.constraints, self.repairer]
 		
 		self.internalParams = {}
 		self.fitness = 0.0
 		self.ownBestFitness = 0.0
+		#Constraint violation of the current and of the best position
+		self.violation = 0.0
+		self.ownBestViolation = 0.0
+		#True when the evaluation was skipped by the feasibility rules
+		self.rejected = False
+		#True when the fitness was predicted by a surrogate model
+		self.predicted = False
+		#True when the evaluation was stopped early (the fitness is a bound)
+		self.partial = False
+		#Fidelity level of the current fitness and of the own best fitness
+		self.fidelity = Consts.CDefFidelity
+		self.ownBestFidelity = Consts.CDefFidelity
+		#Sample statistics (count, mean, m2) of the averaged fitness, None for a single sample
+		self.samples = None
+		self.ownBestSamples = None
+		#numpy random generator of the array based representations
+		self.randomState = None
 		
 	def getFitness(self):
 		""" Get the Fitness Score of the particle"
@@ -117,6 +170,7 @@ class ParticleBase(object):
 		ret = "- ParticleBase\n"
 		ret += "\tFitness:\t\t\t %.6f\n" %(self.fitness,)
 		ret += "\tOwnBestFitness:\t\t\t %.6f\n" %(self.ownBestFitness,)
+		ret += "\tViolation:\t\t\t %.6f\n" %(self.violation,)
 		ret += "\tInit Params:\t\t %s\n\n" %(self.internalParams,)
 		for slot in self.allSlots:
 			ret += "\t"+ slot.__repr__()
@@ -158,18 +212,130 @@ class ParticleBase(object):
 		return self.internalParams.get(key,nvl)	
 
 
+	def getRandomState(self):
+		""" Return the numpy random generator of the particle, used by the array
+		based representations. It is seeded from the random module on the first
+		call, so the seed of the PSO Engine is honoured.
+		
+		:rtype: the numpy.random.RandomState instance
+		
+		"""
+		if self.randomState is None:
+			self.randomState = numpy.random.RandomState(random.getrandbits(32))
+		return self.randomState
+	
+	def getViolation(self):
+		""" Get the constraint violation of the particle
+		
+		:rtype: the violation, 0.0 if the particle is feasible
+		
+		"""
+		return self.violation
+	
+	def isFeasible(self):
+		""" Returns True if the particle does not violate its constraints """
+		return self.violation == 0.0
+	
+	def evaluateConstraints(self, **args):
+		""" Called to evaluate the constraints of the particle, the violation is
+		the sum of the results of the constraints slot
+		
+		:param args: these parameters will be passed to the constraint functions
+		:rtype: the violation
+		
+		"""
+		violation = 0.0
+		for it in self.constraints.applyFunctions(self, **args):
+			violation += it
+		self.violation = violation
+		return violation
+	
+	def repair(self, **args):
+		""" Called to repair an infeasible particle, applies the repairer slot
+		
+		:param args: these parameters will be passed to the repair functions
+		
+		"""
+		for it in self.repairer.applyFunctions(self, **args):
+			pass
+	
+	def penalize(self, minimax):
+		""" Penalizes the fitness of the particle with *penaltyFactor* * violation
+		(default penaltyFactor is Consts.CDefPenaltyFactor)
+		
+		:param minimax: the Consts.minimaxType of the optimization
+		
+		"""
+		if self.violation == 0.0: return
+		penalty = self.getParam("penaltyFactor", Consts.CDefPenaltyFactor) * self.violation
+		if minimax == Consts.minimaxType["maximize"]:
+			self.fitness -= penalty
+		else:
+			self.fitness += penalty
+	
+	def copyOwnBestPosition(self, buffer):
+		""" Copies the best position of the particle into the buffer, in place.
+		Must be implemented by the representations.
+		
+		:param buffer: the destination buffer
+		:rtype: the buffer
+		
+		"""
+		Util.raiseException("copyOwnBestPosition is not implemented by %s" % (self.__class__.__name__,), NotImplementedError)
+
+	def getCoordinates(self, position=None):
+		""" Returns a position of the particle as a sequence of numbers, one per
+		dimmension, used by the statistics. The representations which store the
+		position encoded override it.
+		
+		:param position: a position of the particle (default is the current position)
+		:rtype: the sequence of numbers
+		
+		"""
+		if position is None:
+			position = self.position
+		return position
+
+	def getVelocityCoordinates(self):
+		""" Returns the velocity of the particle as a sequence of numbers, used by the
+		statistics. The representations which store the velocity in blocks override it.
+		
+		:rtype: the sequence of numbers
+		
+		"""
+		return self.velocity
+
 	def resetStats(self):
 		"""Clear fitness of the particle """
 		self.fitness = 0.0
 	
 	def evaluate(self, **args):
-		""" Called to evaluate the particle
+		""" Called to evaluate the particle, the results of the evaluator functions are
+		summed. When the evaluator returns a tuple (multi-objective), the fitness is the
+		tuple and the results of several functions are summed per objective.
 		
-		:param args: these parameters will be passed to the evaluator
+		:param args: these parameters will be passed to the evaluator, the *fidelity*
+		             argument (default is Consts.CDefFidelity) is kept in the *fidelity* attribute,
+		             the *resample* flag (a new sample of a noisy fitness, the evaluation caches
+		             are bypassed) is not passed
+		:rtype: the number of evaluations done, 1
 		"""
+		args.pop("resample", None)
 		self.resetStats()
+		self.fidelity = args.get("fidelity", Consts.CDefFidelity)
+		self.partial = False
+		self.samples = None
 		for it in self.evaluator.applyFunctions(self, **args):
-			self.fitness += it
+			if getattr(it, "partial", False):
+				self.partial = True
+			if isinstance(it, (tuple, list)):
+				if isinstance(self.fitness, tuple):
+					self.fitness = tuple([a + b for a, b in zip(self.fitness, it)])
+				else:
+					self.fitness = tuple(it)
+			else:
+				self.fitness += it
+		return 1
 		
 	def initializePosition(self, **args):
 		"""Called to initialize the particle position
@@ -198,11 +364,22 @@ class ParticleBase(object):
 		"""
 		other.fitness = self.fitness
 		other.ownBestFitness = self.ownBestFitness
+		other.violation = self.violation
+		other.ownBestViolation = self.ownBestViolation
+		other.rejected = self.rejected
+		other.predicted = self.predicted
+		other.partial = self.partial
+		other.fidelity = self.fidelity
+		other.ownBestFidelity = self.ownBestFidelity
+		other.samples = self.samples
+		other.ownBestSamples = self.ownBestSamples
 		other.evaluator = self.evaluator
 		other.position_initializator = self.position_initializator
 		other.velocity_initializator = self.velocity_initializator
 		other.position_communicator = self.position_communicator
 		other.information_communicator = self.information_communicator
+		other.constraints = self.constraints
+		other.repairer = self.repairer
 		other.allSlots = self.allSlots[:]
 		other.internalParams = self.internalParams.copy()
 		
@@ -0,0 +1,193 @@
+'''
+Particle Swarm Optimization - PyPSO
+
+Copyright (c) 2009 Marcel Pinheiro Caraciolo
+caraciol@gmail.com
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+0.10 2026-10-19 Initial version.
+0.11 2026-10-19 The numpy random generator moved to ParticleBase.
+0.11 2026-10-19 Added getCoordinates(), the statistics read the unpacked bits.
+'''
+
+
+"""
+:mod:`ParticleBinary` -- the binary particle
+================================================================
+
+    This is the binary representation (Kennedy and Eberhart binary PSO), the
+    position is a bit string stored packed, 8 bits per byte, in a numpy *uint8*
+    array, and the velocity is a numpy array of real values. The bit *i* is set
+    with probability sigmoid(velocity[i]) by the
+    :func:`Communicators.P1DBinaryPosCommunicator`.
+    This particle class extends the :class:`ParticleBase.ParticleBase` class.
+
+    The numpy module is required and it is imported when the first particle is created.
+
+"""
+
+from ParticleBase import ParticleBase
+import Consts
+import Util
+
+numpy = Util.LazyModule("numpy", "the ParticleBinary requires the numpy module !")
+
+
+class ParticleBinary(ParticleBase):
+	""" ParticleBinary Class - The bit-packed binary particle representation
+
+	**Example**
+
+		The instantiation
+			>>> particle = ParticleBinary(50000)
+			>>> particle.evaluator.set(lambda p: p.getBits().sum())
+
+		The evaluator reads the unpacked bits with :meth:`getBits` (a numpy array
+		of 0 and 1), :meth:`getPosition` returns the packed bytes.
+
+	:param size: the number of bits
+
+	"""
+
+	continuous = False
+
+	def __init__(self, size):
+		""" The initializator of ParticleBinary representation,
+		size parameter must be specified """
+		ParticleBase.__init__(self)
+		self.dimmensionsSize = size
+		packed_size = (size + 7) // 8
+		self.position = numpy.zeros(packed_size, dtype=numpy.uint8)
+		self.ownBestPosition = numpy.zeros(packed_size, dtype=numpy.uint8)
+		self.velocity = numpy.zeros(size, dtype=numpy.float64)
+		self.position_initializator.set(Consts.CDefBinaryPosInit)
+		self.velocity_initializator.set(Consts.CDefBinaryVelInit)
+		self.position_communicator.set(Consts.CDefBinaryPosCommunicator)
+		self.information_communicator.set(Consts.P1DInfoCommunicator)
+
+	def __eq__(self, other):
+		""""Compares one particle with another """
+		return self.dimmensionsSize == other.dimmensionsSize and \
+				numpy.array_equal(self.position, other.position) and \
+				numpy.array_equal(self.ownBestPosition, other.ownBestPosition) and \
+				numpy.array_equal(self.velocity, other.velocity)
+
+	def __len__(self):
+		""""Return the number of bits of the particle """
+		return self.dimmensionsSize
+
+	def __getitem__(self, index):
+		""" Return the bit at index of the position """
+		return (int(self.position[index >> 3]) >> (7 - (index & 7))) & 1
+
+	def __repr__(self):
+		""""Return a string representation of the Particle """
+		ret = ParticleBase.__repr__(self)
+		ret += "-ParticleBinary\n"
+		ret += "\tBits:\t\t\t %s\n" % (self.dimmensionsSize,)
+		ret += "\tBits set:\t\t %s\n\n" % (int(self.getBits().sum()),)
+		return ret
+
+	def getVelocity(self):
+		""" Return the current velocity of the particle """
+		return self.velocity
+
+	def getPosition(self):
+		""" Return the current position of the particle, packed """
+		return self.position
+
+	def getOwnBestPosition(self):
+		""""Return the current best position of the particle, packed """
+		return self.ownBestPosition
+
+	def getBits(self):
+		""" Return the current position of the particle, unpacked
+
+		:rtype: numpy uint8 array of 0 and 1
+
+		"""
+		return unpackBits(self.position, self.dimmensionsSize)
+
+	def getCoordinates(self, position=None):
+		""" Return a position of the particle unpacked as real values, used by the
+		statistics
+
+		:param position: a packed position (default is the current position)
+		:rtype: numpy float64 array of 0.0 and 1.0
+
+		"""
+		if position is None:
+			position = self.position
+		return unpackBits(position, self.dimmensionsSize).astype(numpy.float64)
+
+	def setBits(self, bits):
+		""" Set the current position of the particle from unpacked bits
+
+		:param bits: sequence of 0 and 1 (or booleans)
+
+		"""
+		self.position[:] = numpy.packbits(numpy.asarray(bits, dtype=numpy.uint8))
+
+	def setOwnBestPosition(self, position):
+		""" Set the best position of the particle, copied in place
+
+			:param position: the packed best position of the particle
+		"""
+		self.ownBestPosition[:] = position
+
+	def copyOwnBestPosition(self, buffer):
+		""" Copies the best position of the particle into the buffer, in place. A new
+		array is returned when the buffer is not an array of the particle size.
+
+		:param buffer: the destination array
+		:rtype: the buffer
+
+		"""
+		if not isinstance(buffer, numpy.ndarray) or buffer.shape != self.ownBestPosition.shape:
+			return self.ownBestPosition.copy()
+		buffer[:] = self.ownBestPosition
+		return buffer
+
+	def copy(self, g):
+		"""Copy particle to 'g''
+
+		:param g: the destination ParticleBinary instance
+
+		"""
+		ParticleBase.copy(self,g)
+		g.dimmensionsSize = self.dimmensionsSize
+		g.position = self.position.copy()
+		g.ownBestPosition = self.ownBestPosition.copy()
+		g.velocity = self.velocity.copy()
+
+	def clone(self):
+		""" Return a new instance copy of the particle
+
+		:rtype: The ParticleBinary clone instance
+
+		"""
+		newcopy = ParticleBinary(self.dimmensionsSize)
+		self.copy(newcopy)
+		return newcopy
+
+
+def unpackBits(packed, size):
+	""" Unpacks a bit-packed position
+
+	:param packed: the numpy uint8 array
+	:param size: the number of bits
+	:rtype: the numpy uint8 array of 0 and 1
+
+	"""
+	return numpy.unpackbits(numpy.asarray(packed, dtype=numpy.uint8))[:size]
@@ -0,0 +1,303 @@
+'''
+Particle Swarm Optimization - PyPSO
+
+Copyright (c) 2009 Marcel Pinheiro Caraciolo
+caraciol@gmail.com
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+0.10 2026-10-19 Initial version.
+0.11 2026-10-19 The evaluation cache is keyed by the fidelity too.
+0.11 2026-10-19 The partial fitness (evaluations stopped early) is not cached.
+0.11 2026-10-19 Added getCoordinates() and getVelocityCoordinates() for the statistics.
+0.11 2026-10-19 The resampled evaluations (noisy evaluation) bypass the cache.
+'''
+
+
+"""
+:mod:`ParticleMixed` -- the mixed-variable particle
+================================================================
+
+    This is the mixed-variable representation, built from a
+    :class:`PsoDimmension.PsoDimmensions` spec: the real
+    :class:`PsoDimmension.DimmensionRange` dimmensions, the integer ones and the
+    :class:`PsoDimmension.DimmensionList` (categorical) ones are stored in three
+    separate numpy arrays (*blocks*), each one with its own update rule in
+    :func:`Communicators.P1DMixedPosCommunicator`. A range dimmension with several
+    ranges uses the interval from the lowest begin to the highest end.
+
+    The evaluations are cached by position and fidelity in a cache shared by all
+    the particles of the swarm, so the discrete positions visited again are not
+    evaluated twice.
+    The evaluation function must be deterministic, except with the
+    :func:`Evaluators.NoisyEvaluation`, its evaluations bypass the cache.
+    This particle class extends the :class:`ParticleBase.ParticleBase` class.
+
+    The numpy module is required and it is imported when the first particle is created.
+
+"""
+
+from ParticleBase import ParticleBase
+from PsoDimmension import DimmensionList
+import Consts
+import Util
+
+numpy = Util.LazyModule("numpy", "the ParticleMixed requires the numpy module !")
+
+
+class ParticleMixed(ParticleBase):
+	""" ParticleMixed Class - The mixed-variable particle representation
+
+	**Example**
+
+		The instantiation
+			>>> dimmensions = PsoDimmension.PsoDimmensions()
+			>>> dimmensions.add(PsoDimmension.DimmensionRange(1e-4, 1e-1, real=True))
+			>>> dimmensions.add(PsoDimmension.DimmensionRange(16, 512))
+			>>> dimmensions.add(PsoDimmension.DimmensionList(["relu", "tanh"]))
+			>>> particle = ParticleMixed(dimmensions)
+			>>> particle.evaluator.set(lambda p: train(*p.getValues()))
+
+		The position is the tuple of the (real, integer, categorical) blocks, the
+		categorical block holds the option indexes. :meth:`getValues` returns the
+		values in the order of the spec.
+
+	The size of the evaluation cache is the *cacheSize* param (default is
+	Consts.CDefMixedCacheSize), 0 disables the cache.
+
+	:param dimmensions: the :class:`PsoDimmension.PsoDimmensions` spec
+	:param size: the number of dimmensions, required when the spec is homogeneous
+
+	"""
+
+	continuous = False
+
+	def __init__(self, dimmensions, size=None):
+		""" The initializator of ParticleMixed representation,
+		the dimmensions spec must be specified """
+		ParticleBase.__init__(self)
+		if size is None:
+			if dimmensions.homogeneous:
+				Util.raiseException("the size of the ParticleMixed must be specified for a homogeneous spec")
+			size = len(dimmensions)
+		self.dimmensions = dimmensions
+		self.dimmensionsSize = size
+
+		#Index of every dimmension in the spec, per block
+		realIndex, intIndex, catIndex = [], [], []
+		realBounds, intBounds, catSize = [], [], []
+		for i in xrange(size):
+			dimmension = dimmensions[i]
+			if isinstance(dimmension, DimmensionList):
+				catIndex.append(i)
+				catSize.append(len(dimmension))
+				continue
+			begin = min([begin for begin, end in dimmension.beginEnd])
+			end = max([end for begin, end in dimmension.beginEnd])
+			if dimmension.getReal():
+				realIndex.append(i)
+				realBounds.append((begin, end))
+			else:
+				intIndex.append(i)
+				intBounds.append((begin, end))
+
+		self.blockIndex = (realIndex, intIndex, catIndex)
+		self.realMin = numpy.array([begin for begin, end in realBounds], dtype=numpy.float64)
+		self.realMax = numpy.array([end for begin, end in realBounds], dtype=numpy.float64)
+		self.intMin = numpy.array([begin for begin, end in intBounds], dtype=numpy.int64)
+		self.intMax = numpy.array([end for begin, end in intBounds], dtype=numpy.int64)
+		self.catSize = numpy.array(catSize, dtype=numpy.int64)
+
+		self.position = self.newBlocks()
+		self.ownBestPosition = self.newBlocks()
+		self.velocity = (numpy.zeros(len(realIndex)), numpy.zeros(len(intIndex)))
+		#Evaluation cache shared by the clones: position key -> fitness
+		self.cache = {}
+
+		self.position_initializator.set(Consts.CDefMixedPosInit)
+		self.velocity_initializator.set(Consts.CDefMixedVelInit)
+		self.position_communicator.set(Consts.CDefMixedPosCommunicator)
+		self.information_communicator.set(Consts.P1DInfoCommunicator)
+
+	def newBlocks(self):
+		""" Returns a new tuple of zeroed (real, integer, categorical) blocks """
+		realIndex, intIndex, catIndex = self.blockIndex
+		return (numpy.zeros(len(realIndex), dtype=numpy.float64),
+				numpy.zeros(len(intIndex), dtype=numpy.int64),
+				numpy.zeros(len(catIndex), dtype=numpy.int64))
+
+	def __eq__(self, other):
+		""""Compares one particle with another """
+		for block, other_block in zip(self.position + self.ownBestPosition,
+									other.position + other.ownBestPosition):
+			if not numpy.array_equal(block, other_block):
+				return False
+		return self.dimmensionsSize == other.dimmensionsSize
+
+	def __len__(self):
+		""""Return the number of dimmensions of the particle """
+		return self.dimmensionsSize
+
+	def __repr__(self):
+		""""Return a string representation of the Particle """
+		ret = ParticleBase.__repr__(self)
+		ret += "-ParticleMixed\n"
+		ret += "\tReal/Integer/Categorical:\t %d/%d/%d\n" % tuple([len(index) for index in self.blockIndex])
+		ret += "\tValues:\t\t\t %s\n" % (self.getValues(),)
+		ret += "\tCache size:\t\t %d\n\n" % (len(self.cache),)
+		return ret
+
+	def getVelocity(self):
+		""" Return the (real, integer) velocity blocks """
+		return self.velocity
+
+	def getPosition(self):
+		""" Return the (real, integer, categorical) position blocks """
+		return self.position
+
+	def getOwnBestPosition(self):
+		""" Return the (real, integer, categorical) own best position blocks """
+		return self.ownBestPosition
+
+	def setOwnBestPosition(self, position):
+		""" Set the best position of the particle, the blocks are copied in place
+
+			:param position: the (real, integer, categorical) blocks
+		"""
+		for block, value in zip(self.ownBestPosition, position):
+			block[:] = value
+
+	def decode(self, blocks):
+		""" Returns the values of the position blocks, in the order of the spec,
+		the categorical indexes are replaced by the options
+
+		:param blocks: the (real, integer, categorical) blocks
+		:rtype: the list of values
+
+		"""
+		values = [None] * self.dimmensionsSize
+		realIndex, intIndex, catIndex = self.blockIndex
+		real, integer, categorical = blocks
+		for k, i in enumerate(realIndex):
+			values[i] = float(real[k])
+		for k, i in enumerate(intIndex):
+			values[i] = int(integer[k])
+		for k, i in enumerate(catIndex):
+			values[i] = self.dimmensions[i][int(categorical[k])]
+		return values
+
+	def getValues(self):
+		""" Returns the values of the current position, in the order of the spec """
+		return self.decode(self.position)
+
+	def getCoordinates(self, position=None):
+		""" Returns a position of the particle as real values, one per dimmension in
+		the order of the spec, the categorical dimmensions are their option index.
+		Used by the statistics.
+
+		:param position: the (real, integer, categorical) blocks or the list of values
+		                 written by :meth:`copyOwnBestPosition` (default is the current position)
+		:rtype: numpy float64 array
+
+		"""
+		if position is None:
+			position = self.position
+		coordinates = numpy.empty(self.dimmensionsSize, dtype=numpy.float64)
+		if isinstance(position, tuple):
+			for index, block in zip(self.blockIndex, position):
+				coordinates[index] = block
+			return coordinates
+		catIndex = self.blockIndex[2]
+		coordinates[:] = [0.0 if i in catIndex else value for i, value in enumerate(position)]
+		for i in catIndex:
+			coordinates[i] = self.dimmensions[i].options.index(position[i])
+		return coordinates
+
+	def getVelocityCoordinates(self):
+		""" Returns the velocity of the real and integer dimmensions, the categorical
+		dimmensions have no velocity
+
+		:rtype: numpy float64 array
+
+		"""
+		return numpy.concatenate(self.velocity)
+
+	def copyOwnBestPosition(self, buffer):
+		""" Copies the values of the best position into the buffer list, in place
+
+		:param buffer: the destination list
+		:rtype: the buffer
+
+		"""
+		buffer[:] = self.decode(self.ownBestPosition)
+		return buffer
+
+	def evaluate(self, **args):
+		""" Called to evaluate the particle, the fitness of a position already
+		evaluated is read from the evaluation cache. The partial fitness (see
+		:class:`Evaluators.PartialFitness`) is not cached, it is only a bound for
+		the threshold of its evaluation. The cache is bypassed when the *resample*
+		argument is set, each evaluation of a noisy fitness is a new sample.
+
+		:param args: these parameters will be passed to the evaluator
+		:rtype: the number of evaluations done, 0 or 1
+
+		"""
+		cache_size = self.getParam("cacheSize", Consts.CDefMixedCacheSize)
+		if cache_size <= 0 or args.get("resample"):
+			return ParticleBase.evaluate(self, **args)
+
+		fidelity = args.get("fidelity", Consts.CDefFidelity)
+		key = str(fidelity) + ":" + "".join([block.tostring() for block in self.position])
+		fitness = self.cache.get(key)
+		if fitness is not None:
+			self.fitness = fitness
+			self.fidelity = fidelity
+			self.partial = False
+			self.samples = None
+			return 0
+		evaluations = ParticleBase.evaluate(self, **args)
+		if self.partial:
+			return evaluations
+		if len(self.cache) >= cache_size:
+			self.cache.clear()
+		self.cache[key] = self.fitness
+		return evaluations
+
+	def copy(self, g):
+		"""Copy particle to 'g'', the evaluation cache is shared
+
+		:param g: the destination ParticleMixed instance
+
+		"""
+		ParticleBase.copy(self,g)
+		g.dimmensions = self.dimmensions
+		g.dimmensionsSize = self.dimmensionsSize
+		g.blockIndex = self.blockIndex
+		g.realMin, g.realMax = self.realMin, self.realMax
+		g.intMin, g.intMax = self.intMin, self.intMax
+		g.catSize = self.catSize
+		g.position = tuple([block.copy() for block in self.position])
+		g.ownBestPosition = tuple([block.copy() for block in self.ownBestPosition])
+		g.velocity = tuple([block.copy() for block in self.velocity])
+		g.cache = self.cache
+
+	def clone(self):
+		""" Return a new instance copy of the particle
+
+		:rtype: The ParticleMixed clone instance
+
+		"""
+		newcopy = ParticleMixed(self.dimmensions, self.dimmensionsSize)
+		self.copy(newcopy)
+		return newcopy
@@ -0,0 +1,184 @@
+'''
+Particle Swarm Optimization - PyPSO
+
+Copyright (c) 2009 Marcel Pinheiro Caraciolo
+caraciol@gmail.com
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+0.10 2026-10-19 Initial version.
+'''
+
+"""
+:mod:`Profiler` -- the step profiler module
+================================================================
+
+This module contains the :class:`Profiler.StepProfiler` class, which records
+how much time the :class:`Pso.SimplePSO` engine spends in each phase of a
+step (position update, evaluation, information update, statistics, report dump,
+callbacks and the interactive mode check).
+
+The profiler is disabled by default, when it is not set the engine pays only
+one attribute test per phase.
+
+.. seealso::
+
+   Method :meth:`Pso.SimplePSO.setProfiler`
+      The profiler is set in the SimplePSO Class.
+
+"""
+
+from time import time
+import Consts
+
+
+class StepProfiler(object):
+	""" StepProfiler Class - The per-phase timing counters of the PSO Engine
+
+	Example:
+		>>> profiler = Profiler.StepProfiler()
+		>>> pso_engine.setProfiler(profiler)
+		>>> pso_engine.execute()
+		>>> profiler.getTotal("evaluation")
+		12.4
+		>>> print profiler
+		(...)
+
+	Every phase is timed by a *mark*: the time elapsed since the previous mark is
+	charged to the phase, so each phase costs a single clock read.
+
+	:param report: if True, the timings of every step are dumped to the report adapter of the engine
+	:param phases: the phase names, default is Consts.CDefProfilerPhases
+
+	"""
+
+	def __init__(self, report=False, phases=Consts.CDefProfilerPhases):
+		""" The StepProfiler Class Creator """
+		self.phases = tuple(phases)
+		self.report = report
+		self.clock = time
+		self.reset()
+
+	def reset(self):
+		""" Clear all the counters of the profiler """
+		#Timings of the step in progress
+		self.current = dict.fromkeys(self.phases, 0.0)
+		#Timings of the last complete step
+		self.last = dict.fromkeys(self.phases, 0.0)
+		self.total = dict.fromkeys(self.phases, 0.0)
+		self.peak = dict.fromkeys(self.phases, 0.0)
+		self.steps = 0
+		self.running = False
+		self.lastMark = 0.0
+
+	def begin(self):
+		""" Starts the timing of a new step, the step in progress (if any) is closed """
+		if self.running:
+			self.end()
+		self.running = True
+		self.lastMark = self.clock()
+
+	def mark(self, phase):
+		""" Charges the time elapsed since the last mark to the phase
+
+		:param phase: the phase name
+
+		"""
+		now = self.clock()
+		self.current[phase] += now - self.lastMark
+		self.lastMark = now
+
+	def skip(self):
+		""" Discards the time elapsed since the last mark """
+		self.lastMark = self.clock()
+
+	def end(self):
+		""" Closes the step in progress and accumulates its timings """
+		if not self.running: return
+		current, total, peak = self.current, self.total, self.peak
+		for phase in self.phases:
+			elapsed = current[phase]
+			total[phase] += elapsed
+			if elapsed > peak[phase]:
+				peak[phase] = elapsed
+		self.last, self.current = current, self.last
+		for phase in self.phases:
+			self.current[phase] = 0.0
+		self.steps += 1
+		self.running = False
+
+	def getSteps(self):
+		""" Returns the number of complete steps timed
+
+		:rtype: the number of steps
+
+		"""
+		return self.steps
+
+	def getLast(self, phase):
+		""" Returns the time spent on the phase during the last complete step
+
+		:param phase: the phase name
+		:rtype: the time in seconds
+
+		"""
+		return self.last[phase]
+
+	def getTotal(self, phase=None):
+		""" Returns the total time spent on the phase
+
+		:param phase: the phase name, if None, the sum of all phases is returned
+		:rtype: the time in seconds
+
+		"""
+		if phase is None:
+			return sum(self.total.values())
+		return self.total[phase]
+
+	def getAverage(self, phase):
+		""" Returns the average time per step spent on the phase
+
+		:param phase: the phase name
+		:rtype: the time in seconds
+
+		"""
+		if self.steps == 0: return 0.0
+		return self.total[phase] / float(self.steps)
+
+	def getPeak(self, phase):
+		""" Returns the longest time a single step spent on the phase
+
+		:param phase: the phase name
+		:rtype: the time in seconds
+
+		"""
+		return self.peak[phase]
+
+	def asTuple(self):
+		""" Returns the timings of the last complete step, in the phases order """
+		return tuple([self.last[phase] for phase in self.phases])
+
+	def items(self):
+		""" Returns a list of (phase, last, total) for all the phases """
+		return [(phase, self.last[phase], self.total[phase]) for phase in self.phases]
+
+	def __repr__(self):
+		""" Returns a string representation of the profiler """
+		grand_total = self.getTotal()
+		strBuff = "- Step Profiler (%d steps, %.3f seconds)\n" % (self.steps, grand_total)
+		strBuff += "\t%-15s %12s %12s %12s %8s\n" % ("Phase", "Avg (ms)", "Peak (ms)", "Total (s)", "Share")
+		for phase in self.phases:
+			share = (self.total[phase] * 100.0 / grand_total) if grand_total > 0 else 0.0
+			strBuff += "\t%-15s %12.4f %12.4f %12.4f %7.2f%%\n" % (phase, self.getAverage(phase) * 1000.0,
+					self.peak[phase] * 1000.0, self.total[phase], share)
+		return strBuff
@@ -22,6 +22,19 @@ limitations under the License.
 0.22 2009-05-25 Added support for report files generation (Uses ReportAdapters).
 0.22 2009-06-08 Fixed some bugs related to the INERTIA factor.
 0.23 2009-09-09 Redesigned all the class for support new API and Docs.
+0.24 2026-10-19 Added support for the Step Profiler (setProfiler).
+0.24 2026-10-19 Interactive Mode requested by a listener thread, no terminal setup at import.
+0.24 2026-10-19 Added the Stagnation, Tolerance, Diameter, Time and Evaluation budget criteria.
+0.24 2026-10-19 Added the restart criteria slot (IPOP-like restarts with growing swarm size).
+0.24 2026-10-19 The swarm size grown by the restarts is restored when a new run starts.
+0.24 2026-10-19 Added the inertia schedule slot, the INERTIA type works again.
+0.24 2026-10-19 The velocity coefficients are computed once per step by a CoefficientSchedule.
+0.24 2026-10-19 Added the ask/tell interface (ask() and tell()).
+0.24 2026-10-19 Added the step iterator (iterate() and StepSnapshot).
+0.24 2026-10-19 The profile rows are dumped when the step is closed (dumpProfileReport).
+0.24 2026-10-19 StepSnapshot is a tuple subclass, collections.namedtuple needs Python 2.6.
+0.24 2026-10-19 The asked positions are the coordinates of the particles (binary and mixed particles).
+0.24 2026-10-19 The InteractiveListener module (and threading) is imported when the listener is started.
 '''
 
 """    
@@ -35,19 +48,17 @@ the topology base class used to do the particle communication.
 
 """
 import random
+import math
 import Consts
-import code
+import Util
 from time import time
+from operator import itemgetter
 from FunctionSlot import FunctionSlot
+from Coefficients import CoefficientSchedule
 from sys import platform as sys_platform
 
-
-if sys_platform[:3] == "win":
-   import msvcrt
-elif sys_platform[:5] == "linux":
-    import atexit
-    atexit.register(Util.set_normal_term)
-    Util.set_curses_term()
+numpy = Util.LazyModule("numpy", "the ask/tell interface of the PSO Engine requires the numpy module !")
+InteractiveListener = Util.LazyModule("InteractiveListener", context=globals())
 
 
 def FitnessScoreCriteria(pso_engine):
@@ -81,6 +92,115 @@ def FitnessScoreCriteria(pso_engine):
 	return flag
 
 
+def StagnationCriteria(pso_engine):
+	""" Terminate the evolution when the global best fitness was not improved
+	for *stagnationSteps* steps (engine parameter, default is Consts.CDefStagnationSteps)
+	
+	Example:
+		>>> pso_engine.setParams(stagnationSteps=50)
+		>>> pso_engine.terminationCriteria.add(Pso.StagnationCriteria)
+	
+	"""
+	steps = pso_engine.getParam("stagnationSteps", Consts.CDefStagnationSteps)
+	return (pso_engine.currentStep - pso_engine.lastImprovementStep) >= steps
+
+
+def ToleranceCriteria(pso_engine):
+	""" Terminate the evolution when the global best fitness was not improved by more
+	than *toleranceAbs* + *toleranceRel* * abs(best fitness) for *toleranceSteps* steps
+	(engine parameters, defaults are Consts.CDefToleranceAbs, Consts.CDefToleranceRel
+	and Consts.CDefToleranceSteps)
+	
+	Example:
+		>>> pso_engine.setParams(toleranceRel=1e-4, toleranceSteps=30)
+		>>> pso_engine.terminationCriteria.add(Pso.ToleranceCriteria)
+	
+	"""
+	steps = pso_engine.getParam("toleranceSteps", Consts.CDefToleranceSteps)
+	return (pso_engine.currentStep - pso_engine.lastToleranceStep) >= steps
+
+
+def DiameterCriteria(pso_engine):
+	""" Terminate the evolution when the swarm diameter collapses below
+	*diameterMin* (engine parameter, default is Consts.CDefDiameterMin)
+	
+	Example:
+		>>> pso_engine.setParams(diameterMin=1e-4)
+		>>> pso_engine.terminationCriteria.add(Pso.DiameterCriteria)
+	
+	.. seealso:: :meth:`TopologyBase.TopologyBase.getSwarmDiameter`
+	
+	"""
+	diameter_min = pso_engine.getParam("diameterMin", Consts.CDefDiameterMin)
+	return pso_engine.getTopology().getSwarmDiameter() <= diameter_min
+
+
+def TimeBudgetCriteria(pso_engine):
+	""" Terminate the evolution when the wall-clock time since the beginning of
+	the execution reaches *timeBudget* seconds (engine parameter)
+	
+	Example:
+		>>> pso_engine.setParams(timeBudget=3600)
+		>>> pso_engine.terminationCriteria.add(Pso.TimeBudgetCriteria)
+	
+	"""
+	budget = pso_engine.getParam("timeBudget")
+	if budget is None:
+		Util.raiseException("You must specify the timeBudget parameter", ValueError)
+	return (time() - pso_engine.time_init) >= budget
+
+
+def EvaluationBudgetCriteria(pso_engine):
+	""" Terminate the evolution when the number of evaluations of the objective
+	function reaches *evaluationBudget* (engine parameter)
+	
+	Example:
+		>>> pso_engine.setParams(evaluationBudget=30000)
+		>>> pso_engine.terminationCriteria.add(Pso.EvaluationBudgetCriteria)
+	
+	"""
+	budget = pso_engine.getParam("evaluationBudget")
+	if budget is None:
+		Util.raiseException("You must specify the evaluationBudget parameter", ValueError)
+	return pso_engine.getEvaluations() >= budget
+
+
+class StepSnapshot(tuple):
+	""" StepSnapshot Class - The immutable state of one step, yielded by :meth:`SimplePSO.iterate`
+	
+	The fields are the *step*, the global *bestFitness* and *bestPosition* (a tuple,
+	the same instance is shared by the snapshots while the global best does not
+	change), the number of *evaluations*, the number of particles which improved
+	their own best on the step (*improvements*) and the *stats*, the tuple of the
+	(name, value) of the statistics selected in :meth:`SimplePSO.iterate`.
+	
+	The fields are read as attributes or by index, in this order: ::
+		
+		step, bestFitness = snapshot[:2]
+	
+	"""
+	__slots__ = ()
+	
+	fields = ("step", "bestFitness", "bestPosition", "evaluations", "improvements", "stats")
+	
+	def __new__(cls, step, bestFitness, bestPosition, evaluations, improvements, stats):
+		""" The StepSnapshot Class Creator """
+		return tuple.__new__(cls, (step, bestFitness, bestPosition, evaluations, improvements, stats))
+	
+	def __getnewargs__(self):
+		""" Returns the arguments of __new__, used by pickle """
+		return tuple(self)
+	
+	def __repr__(self):
+		""" The String representation of the snapshot """
+		return "StepSnapshot(%s)" % (", ".join(["%s=%r" % item for item in zip(self.fields, self)]),)
+	
+	step = property(itemgetter(0))
+	bestFitness = property(itemgetter(1))
+	bestPosition = property(itemgetter(2))
+	evaluations = property(itemgetter(3))
+	improvements = property(itemgetter(4))
+	stats = property(itemgetter(5))
 
 
 class SimplePSO(object):
@@ -97,6 +217,11 @@ class SimplePSO(object):
 	
 	.. note:: if you see the same random seed, all the runs of the algorithm will be the same.
 	
+	.. note:: the Interactive Mode is requested by pressing ESC (or sending SIGUSR1 on POSIX),
+	          the keys are watched by a :class:`InteractiveListener.InteractiveListener` thread,
+	          which is only started when the standard input is a terminal, the signal
+	          works in the batch jobs too.
+	
 	"""
 	
 	stepCallBack = None
@@ -114,6 +239,33 @@ class SimplePSO(object):
 	a warning, if is False, the evolution continues.
 	"""
 	
+	inertiaSchedule = None
+	""" This is the inertia schedule slot, used by the INERTIA PSO type. The
+	schedule is called once per step and its value is kept in the *inertiaFactor*
+	attribute, which is read by the communicators: ::
+		
+		pso_engine.setPsoType(Consts.psoType["INERTIA"])
+		pso_engine.inertiaSchedule.set(Inertia.InertiaAdaptive)
+	
+	The default schedule is Consts.CDefInertiaSchedule, see the :mod:`Inertia` module.
+	
+	"""
+	
+	restartCriteria = None
+	""" This is the restart criteria slot, it accepts the same functions of the
+	termination criteria slot: ::
+		
+		pso_engine.setParams(stagnationSteps=30, restartPopInc=2.0)
+		pso_engine.restartCriteria.set(Pso.StagnationCriteria)
+	
+	When this function returns True, the best particle is archived and the swarm
+	is created and initialized again, inside the same execution and step budget.
+	The swarm size is multiplied by the *restartPopInc* param (default is
+	Consts.CDefRestartPopInc) up to the *restartMaxSwarmSize* param, and no more
+	than *restartMax* restarts are done (both are unlimited by default).
+	
+	"""
+	
 	terminationCriteria  = None
 	""" This is the termination criteria slot, if you want to set one 
 	termination criteria, you mus do this: ::
@@ -131,7 +283,14 @@ class SimplePSO(object):
 		
 	When this function returns True, the Pso Engine will stop the evolution and show
 	a warning. If is False, the evolution  continues, this function is called every
-	step.
+	step. When more than one function is added, the evolution stops when any of them
+	returns True.
+	
+	The criteria which are built in the :mod:`Pso` module read their parameters
+	from the engine params (see :meth:`SimplePSO.setParams`) and the incremental
+	state kept by the engine (*lastImprovementStep*, *lastToleranceStep* and the
+	evaluations counter), so no criteria needs to scan the swarm, except
+	:func:`DiameterCriteria`.
 	
 	"""
 	
@@ -147,28 +306,63 @@ class SimplePSO(object):
 		self.setSwarmSize(Consts.CDefSwarmSize)
 		#Cognitive and Social Coefficients
 		self.C1,self.C2 = Consts.CDefCoefficients
+		#Coefficients of the current step (C1, C2, chi and inertia)
+		self.coefficients = CoefficientSchedule()
         #Time steps
 		self.timeSteps = Consts.CDefSteps
 		#Interactive Mode (True or False)
 		self.interactiveMode = interactiveMode
+		#Step frequency the interactive mode request is checked
+		self.interactiveFreq = Consts.CDefInteractiveFreq
+		#Key polling interval of the interactive mode listener
+		self.interactivePollTime = Consts.CDefInteractivePollTime
+		#Interactive mode listener, only alive during execute()
+		self.listener = None
 		#Current step
 		self.currentStep = 0
-		#Inertia Factor Minus
-		self.inertiaFactorMinus = None
-		#Inertia coefficient
+		#Inertia coefficient of the current step
 		self.inertiaFactor = None
+		#Internal state of the inertia schedule
+		self.inertiaState = None
 		#Time initial
 		self.time_init = None
+		#Internal params used by the criteria functions
+		self.internalParams = {}
+		#Incremental convergence state
+		self.convergenceBest = None
+		self.lastImprovementStep = 0
+		self.toleranceReference = None
+		self.lastToleranceStep = 0
 	    #Optimization type
 		self.minimax = Consts.minimaxType["minimize"]
 		#Report file adapter 
 		self.reportAdapter = None
+		#Step profiler
+		self.profiler = None
 		#Step Callback
 		self.stepCallback = FunctionSlot("Step Callback")
 		#Termination Criteria
 		self.terminationCriteria = FunctionSlot("Termination Criteria")
+		#Restart Criteria
+		self.restartCriteria = FunctionSlot("Restart Criteria")
+		#Inertia Schedule
+		self.inertiaSchedule = FunctionSlot("Inertia Schedule")
+		self.inertiaSchedule.set(Consts.CDefInertiaSchedule)
 		#All slots
-		self.allSlots = [self.stepCallback, self.terminationCriteria]
+		self.allSlots = [self.stepCallback, self.terminationCriteria, self.restartCriteria, self.inertiaSchedule]
+		#Number of restarts and the best particle of the previous swarms
+		self.restarts = 0
+		self.restartBest = None
+		#Swarm size configured for the run, restored when a new run starts
+		self.runSwarmSize = None
+		#Ask/tell state: None (no run), "initial" or "step" when positions were
+		#asked and wait for their fitness, "told" when the fitness was told
+		self.askState = None
+		self.askPositions = None
+		#Last global best position copied by snapshot()
+		self.snapshotBuffer = None
+		self.snapshotFitness = None
+		self.snapshotPosition = None
 		
 		print "A PSO Engine was created, timeSteps=% d" % ( self.timeSteps, )
 
@@ -196,6 +390,45 @@ class SimplePSO(object):
 		"""
 		self.reportAdapter = repadapter
 		
+	def setProfiler(self,profiler):
+		""" Sets the Step Profiler of the PSO Engine, the time spent on each phase
+		of the steps will be recorded by it.
+		
+		Example:
+			>>> profiler = Profiler.StepProfiler()
+			>>> pso_engine.setProfiler(profiler)
+		
+		:param profiler: the :class:`Profiler.StepProfiler` instance, None disables the profiling
+		
+		"""
+		self.profiler = profiler
+		
+	def getProfiler(self):
+		""" Gets the Step Profiler of the PSO Engine
+		
+		:rtype: the :class:`Profiler.StepProfiler` instance or None
+		
+		"""
+		return self.profiler
+		
+	
+	def setInteractiveMode(self, flag=True, freq=Consts.CDefInteractiveFreq,
+							poll_time=Consts.CDefInteractivePollTime):
+		""" Enables or disables the Interactive Mode
+		
+		Example:
+			>>> pso_engine.setInteractiveMode(True, freq=10, poll_time=0.5)
+		
+		:param flag: True or False
+		:param freq: the request is checked by the engine every *freq* steps
+		:param poll_time: the key polling interval of the listener thread, in seconds
+		
+		"""
+		if freq < 1:
+			Util.raiseException("Interactive mode frequency must be >= 1", ValueError)
+		self.interactiveMode = flag
+		self.interactiveFreq = freq
+		self.interactivePollTime = poll_time
 	
 	def setSwarmSize(self, size):
 		""" Sets the swarm size, calls setSwarmSize()  of Topology
@@ -208,6 +441,7 @@ class SimplePSO(object):
 		if size < 2:
 			Util.raiseException("swarm size must be >= 2", ValueError)
 		self.topology.setSwarmSize(size)
+		self.runSwarmSize = None
 	
 
 
@@ -224,6 +458,56 @@ class SimplePSO(object):
 			Util.raiseException("PsoType must be implemented !",TypeError)
 		self.psoType = psoType
 
+	def setCoefficients(self, c1, c2):
+		""" Sets the cognitive (C1) and social (C2) coefficients, when the
+		coefficient schedule is time-varying these are the initial values
+		
+		Example:
+			>>> pso_engine.setCoefficients(2.05, 2.05)
+		
+		:param c1: the cognitive coefficient
+		:param c2: the social coefficient
+		
+		"""
+		if c1 < 0 or c2 < 0:
+			Util.raiseException("The coefficients must be >= 0", ValueError)
+		self.C1, self.C2 = c1, c2
+	
+	def setCoefficientSchedule(self, schedule):
+		""" Sets the coefficient schedule, which computes the velocity coefficients
+		once per step
+		
+		Example:
+			>>> pso_engine.setCoefficientSchedule(Coefficients.CoefficientSchedule(0.5, 2.5))
+		
+		:param schedule: the :class:`Coefficients.CoefficientSchedule` instance
+		
+		"""
+		self.coefficients = schedule
+	
+	def getCoefficientSchedule(self):
+		""" Returns the coefficient schedule, its attributes are the coefficients
+		of the current step
+		
+		:rtype: the :class:`Coefficients.CoefficientSchedule` instance
+		
+		"""
+		return self.coefficients
+	
+	def getInertiaFactor(self):
+		""" Returns the inertia weight of the current step
+		
+		:rtype: the inertia factor
+		
+		"""
+		return self.inertiaFactor
+	
+	def updateInertiaFactor(self):
+		""" Computes the inertia weight of the current step with the inertia schedule slot,
+		this is called once per step by the coefficient schedule for the INERTIA PSO type """
+		for it in self.inertiaSchedule.applyFunctions(self):
+			self.inertiaFactor = it
+	
 	def getPsoType(self):
 		""" Return the Pso Type
 		
@@ -283,6 +567,76 @@ class SimplePSO(object):
 		"""
 		return self.currentStep
 
+	def setParams(self, **args):
+		""" Sets the internal params of the PSO Engine, they are used by the
+		termination criteria and other engine functions
+		
+		Example:
+			>>> pso_engine.setParams(stagnationSteps=50, evaluationBudget=30000)
+		
+		:param args: the params
+		
+		"""
+		self.internalParams.update(args)
+	
+	def getParam(self, key, nvl=None):
+		""" Gets an internal param of the PSO Engine
+		
+		Example:
+			>>> pso_engine.getParam("stagnationSteps")
+			50
+		
+		:param key: the key of the param
+		:param nvl: if the key doesn't exist, the nvl will be returned
+		
+		"""
+		return self.internalParams.get(key, nvl)
+	
+	def getEvaluations(self):
+		""" Gets the number of evaluations of the objective function done by the swarm
+		
+		:rtype: the number of evaluations
+		
+		"""
+		return self.topology.evaluations
+	
+	def updateConvergence(self):
+		""" Updates the incremental convergence state of the engine, this is
+		called once per step, after the information update.
+		
+		The *lastImprovementStep* is the last step the global best fitness was
+		improved and the *lastToleranceStep* is the last step it was improved by
+		more than the tolerance (*toleranceAbs* and *toleranceRel* params). With a
+		multi-objective topology, both are the last step the archive was improved.
+		
+		"""
+		if self.topology.multiObjective:
+			#The front improved when a solution was inserted in the archive
+			if self.convergenceBest is None or self.topology.archive.insertions > 0:
+				self.convergenceBest = self.topology.getBestFitness()
+				self.lastImprovementStep = self.lastToleranceStep = self.currentStep
+			return
+		
+		best = self.topology.getBestFitness()
+		maximize = (self.minimax == Consts.minimaxType["maximize"])
+		
+		reference = self.convergenceBest
+		if reference is None or (best > reference if maximize else best < reference):
+			self.convergenceBest = best
+			self.lastImprovementStep = self.currentStep
+		
+		reference = self.toleranceReference
+		if reference is None:
+			improved = True
+		else:
+			tolerance = self.getParam("toleranceAbs", Consts.CDefToleranceAbs) + \
+						self.getParam("toleranceRel", Consts.CDefToleranceRel) * abs(reference)
+			if maximize: improved = (best - reference) > tolerance
+			else: improved = (reference - best) > tolerance
+		if improved:
+			self.toleranceReference = best
+			self.lastToleranceStep = self.currentStep
+
 	def getReportAdapter(self):
 		""" Gets the Report Adapter of the PSO Engine
 		
@@ -297,8 +651,56 @@ class SimplePSO(object):
 		
 		:rtype: the best particle
 		
+		.. note:: after a restart, the best particle can be the archived best of a previous swarm.
+		
+		"""
+		best = self.topology.getBestParticle()
+		archived = self.restartBest
+		if archived is None:
+			return best
+		if self.minimax == Consts.minimaxType["maximize"]:
+			improved = archived.ownBestFitness > best.ownBestFitness
+		else:
+			improved = archived.ownBestFitness < best.ownBestFitness
+		return archived if improved else best
+	
+	def getRestarts(self):
+		""" Gets the number of restarts done in the current execution
+		
+		:rtype: the number of restarts
+		
 		"""
-		return self.topology.getBestParticle()
+		return self.restarts
+	
+	def restart(self, verbose=True):
+		""" Archives the best particle and restarts the swarm, the swarm size is
+		multiplied by the *restartPopInc* param, limited by the *restartMaxSwarmSize* param.
+		The current step and the evaluations counter are kept, the swarm size
+		configured for the run is restored when the next run starts.
+		
+		:param verbose: if True, the restart is printed
+		
+		"""
+		self.restartBest = self.bestParticle().clone()
+		
+		size = self.topology.swarmSize
+		size = int(math.ceil(size * self.getParam("restartPopInc", Consts.CDefRestartPopInc)))
+		max_size = self.getParam("restartMaxSwarmSize")
+		if max_size is not None:
+			size = min(size, max_size)
+		self.topology.setSwarmSize(size)
+		
+		evaluations = self.topology.evaluations
+		self.topology.create(minimax=self.minimax)
+		self.topology.evaluations = evaluations
+		self.topology.initialize()
+		
+		self.restarts += 1
+		self.convergenceBest = None
+		self.toleranceReference = None
+		self.updateConvergence()
+		if verbose:
+			print "Swarm restarted at step %d (restart %d, swarm size %d)." % (self.currentStep, self.restarts, size)
 		
 	def getTopology(self):
 		"""Return the internal topology of Pso Engine
@@ -321,6 +723,13 @@ class SimplePSO(object):
 		""" Dumps the current statistics to the  report adapter """
 		self.topology.statistics()
 		self.reportAdapter.insert(self.getStatistics(),self.topology,self.currentStep)
+	
+	def dumpProfileReport(self):
+		""" Dumps the timings of the last complete step to the report adapter, it is
+		called when the step is closed, so the timings are of the current step """
+		if not self.profiler.report: return
+		if self.currentStep % self.reportAdapter.statsGenFreq == 0:
+			self.reportAdapter.insertProfile(self.profiler,self.currentStep)
 		
 		
 	def printStats(self):
@@ -332,35 +741,284 @@ class SimplePSO(object):
 		self.topology.printStats()
 
 	
+	def interact(self):
+		""" Opens the Interactive Mode session, the evolution is resumed when
+		the session is closed """
+		if self.listener: self.listener.pause()
+		print "Loading modules for Interactive mode...",
+		import code
+		import pypso.Interaction
+		print "done!\n"
+		if sys_platform[:3] == "win": quit_key = "CTRL-Z"
+		else: quit_key = "CTRL-D"
+		interact_banner = "## PyPSO v.%s - Interactive Mode ##\nPress %s to quit interactive mode." % (pypso.__version__, quit_key)
+		session_locals = {  "pso_engine"  : self,
+							"topology" : self.getTopology(),
+							"swarm_statistics": self.getTopology().swarmStats,
+							"topology_statistics": self.getTopology().topologyStats,
+							"pypso"   : pypso ,
+							"it"         : pypso.Interaction}
+		print
+		try:
+			code.interact(interact_banner, local=session_locals)
+		finally:
+			if self.listener: self.listener.resume()
+	
 	def printTimeElapsed(self):
 		""" Shows the time elapsed since the beginning of the solution construction """
 		print "Total time elapsed: %.3f seconds." % (time()-self.time_init)
     	
 	
+	def applyCriteria(self, restart=True, verbose=True):
+		""" Applies the step callback and the termination criteria slots and, when no
+		termination criteria is satisfied, the restart criteria slot
+		
+		:param restart: if False, the restart criteria are not applied
+		:param verbose: if True, the restarts are printed
+		:rtype: the tuple (stopped by the step callback, stopped by the termination criteria)
+		
+		"""
+		stopFlagCallback = False
+		stopFlagTerminationCriteria = False
+		
+		if not self.stepCallback.isEmpty():
+			for it in self.stepCallback.applyFunctions(self):
+				if it: stopFlagCallback = True
+			
+		if not self.terminationCriteria.isEmpty():
+			for it in self.terminationCriteria.applyFunctions(self):
+				if it: stopFlagTerminationCriteria = True
+		
+		if restart and not self.restartCriteria.isEmpty() and not stopFlagTerminationCriteria:
+			max_restarts = self.getParam("restartMax")
+			if max_restarts is None or self.restarts < max_restarts:
+				for it in self.restartCriteria.applyFunctions(self):
+					if it:
+						self.restart(verbose)
+						break
+		return stopFlagCallback, stopFlagTerminationCriteria
+	
+	def restoreSwarmSize(self):
+		""" Restores the swarm size configured for the run, which is changed by
+		the restarts, and keeps it for the next run. Called before the swarm is
+		created """
+		if self.runSwarmSize is None:
+			self.runSwarmSize = self.topology.swarmSize
+		elif self.topology.swarmSize != self.runSwarmSize:
+			self.topology.setSwarmSize(self.runSwarmSize)
+	
 	def initialize(self):
 		""" Initializes the PSO Engine. Create and initialize the swarm """
+		self.initializeSwarm()
+		print "The PSO Engine was initialized !"
+	
+	def initializeSwarm(self):
+		""" Creates and initializes the swarm and resets the state of the engine,
+		nothing is printed """
+		self.restoreSwarmSize()
 		self.topology.create(minimax=self.minimax)
 		self.topology.initialize()
-		print "The PSO Engine was initialized !"
+		self.initializeState()
+	
+	def initializeState(self):
+		""" Resets the current step, the restarts and the convergence state of the
+		engine, called after the initialization of the swarm """
+		self.currentStep = 0
+		self.askState = None
+		self.restarts = 0
+		self.restartBest = None
+		self.inertiaState = None
+		self.convergenceBest = None
+		self.toleranceReference = None
+		self.updateConvergence()
+	
+	def ask(self):
+		""" Returns the positions of the swarm to be evaluated by the caller, the
+		fitness of every position must be given back to :meth:`tell`. The first call
+		creates and initializes the swarm, the next ones move the particles (position
+		updater and boundary handler of the topology). Asking again before telling
+		returns the same positions.
+		
+		Example:
+			>>> while True:
+			>>>		positions = pso_engine.ask()
+			>>>		fitness = scheduler.map(objective, positions)
+			>>>		if pso_engine.tell(fitness): break
+		
+		:rtype: the numpy array of the positions, one row per particle and one column
+		        per dimmension, read with :meth:`ParticleBase.ParticleBase.getCoordinates`
+		
+		.. note:: the *evaluator* slot of the particles is not used. The rows of the
+		          encoded particles are their coordinates: the bits of the binary
+		          particles, and the option index of the categorical dimmensions of
+		          the mixed-variable particles (the options are in the
+		          :class:`PsoDimmension.DimmensionList` dimmensions of the spec).
+		
+		"""
+		if self.askState == "initial" or self.askState == "step":
+			return self.askPositions
+		
+		if self.askState is None:
+			self.time_init = time()
+			self.currentStep = 0
+			self.restoreSwarmSize()
+			self.topology.create(minimax=self.minimax)
+			self.topology.initializeParticles()
+			self.askState = "initial"
+		else:
+			self.coefficients.update(self)
+			for it in self.topology.position_updater.applyFunctions(self):
+				pass
+			for it in self.topology.boundary_handler.applyFunctions(self):
+				pass
+			self.askState = "step"
+		
+		self.askPositions = numpy.array([particle.getCoordinates() for particle in self.topology.internalSwarm])
+		return self.askPositions
+	
+	def tell(self, fitness):
+		""" Ingests the fitness of the positions returned by :meth:`ask` and
+		advances the step: the own bests and the global best are updated by the
+		information updater of the topology, then the step callback and the
+		termination criteria are checked.
+		
+		:param fitness: the sequence of fitness, in the order of the asked
+		                positions, a fitness is a sequence with a multi-objective topology
+		:rtype: True if the run must stop (time steps, step callback or
+		        termination criteria)
+		
+		.. note:: the restart criteria are not applied by the ask/tell interface.
+		
+		"""
+		if self.askState == "initial":
+			self.topology.setFitness(fitness)
+			self.topology.initializeBests()
+			self.initializeState()
+			self.askState = "told"
+			return False
+		if self.askState != "step":
+			Util.raiseException("The positions must be asked before telling their fitness", ValueError)
+		
+		self.topology.setFitness(fitness)
+		for it in self.topology.information_updater.applyFunctions(self):
+			pass
+		self.currentStep += 1
+		self.updateConvergence()
+		self.askState = "told"
+		
+		stopFlagCallback, stopFlagTerminationCriteria = self.applyCriteria(restart=False)
+		return stopFlagCallback or stopFlagTerminationCriteria or self.currentStep >= self.timeSteps
 	
 	
 	def constructSolution(self):
 		""" Just do one step in execution, one step."""
+		profiler = self.profiler
+		if profiler: profiler.begin()
+		
+		self.coefficients.update(self)
+		
 		for it in self.topology.position_updater.applyFunctions(self):
 			pass
+		for it in self.topology.boundary_handler.applyFunctions(self):
+			pass
+		if profiler: profiler.mark("position")
+
+		for it in self.topology.evaluation_updater.applyFunctions(self):
+			pass
+		if profiler: profiler.mark("evaluation")
 
 		for it in self.topology.information_updater.applyFunctions(self):
 			pass
 		
-		if self.psoType == Consts.psoType["INERTIA"]:
-			self.updateInertiaFactor()
-		
 		self.currentStep += 1
+		self.updateConvergence()
+		if profiler: profiler.mark("information")
 		
-		return (self.currentStep == self.timeSteps)
+		return (self.currentStep >= self.timeSteps)
 
 
 	
+	def snapshot(self, stats=()):
+		""" Returns the immutable snapshot of the current step, the position of the
+		global best is only copied when it changes
+		
+		:param stats: the names of the statistics to be read, the statistics computed by
+		              the topology (:meth:`TopologyBase.TopologyBase.getStatisticsSources`)
+		:rtype: the :class:`StepSnapshot` instance
+		
+		"""
+		best = self.bestParticle()
+		topology = self.topology
+		if best is topology.getBestParticle():
+			fitness = topology.getBestFitness()
+			position = topology.getBestPosition()
+		else:
+			fitness = best.ownBestFitness
+			position = best.getOwnBestPosition()
+		if position is not self.snapshotBuffer or fitness != self.snapshotFitness:
+			self.snapshotBuffer = position
+			self.snapshotFitness = fitness
+			self.snapshotPosition = tuple(position)
+		
+		values = ()
+		if stats:
+			topology.statistics()
+			sources = topology.getStatisticsSources()
+			values = []
+			for name in stats:
+				for source in sources:
+					if name in source.internalDict:
+						values.append((name, source[name]))
+						break
+				else:
+					names = sorted([key for source in sources for key in source.internalDict])
+					Util.raiseException("The statistic %s is not computed by the %s, the statistics are: %s" %
+										(name, topology.__class__.__name__, ", ".join(names)), KeyError)
+			values = tuple(values)
+		
+		return StepSnapshot(self.currentStep, fitness, self.snapshotPosition,
+							topology.evaluations, topology.improvements, values)
+	
+	def iterate(self, stats=()):
+		""" Generator of the steps of the execution, the engine is initialized and
+		one :class:`StepSnapshot` is yielded after each step, until the time steps,
+		the step callback or the termination criteria stop the execution. The caller
+		can stop it by breaking the loop. Unlike :meth:`execute`, nothing is
+		printed, and the report adapter and the Interactive Mode are not used.
+		
+		Example:
+			>>> for snapshot in pso_engine.iterate(stats=("bestFitAvg",)):
+			>>>		queue.put(snapshot)
+			>>>		if snapshot.bestFitness < 1e-6: break
+		
+		:param stats: the names of the statistics to be read on every step, the
+		              statistics are only computed when some name is given
+		
+		"""
+		self.time_init = time()
+		self.initializeSwarm()
+		self.snapshotBuffer = None
+		self.snapshotFitness = None
+		
+		profiler = self.profiler
+		if profiler: profiler.reset()
+		try:
+			while True:
+				#Like execute(), the criteria (and the restarts) are not applied after the last step
+				if self.constructSolution():
+					stop, stopFlagCallback, stopFlagTerminationCriteria = True, False, False
+				else:
+					stop = False
+					stopFlagCallback, stopFlagTerminationCriteria = self.applyCriteria(verbose=False)
+				if profiler: profiler.mark("callbacks")
+				snapshot = self.snapshot(stats)
+				if profiler: profiler.mark("statistics")
+				yield snapshot
+				if stop or stopFlagCallback or stopFlagTerminationCriteria:
+					break
+		finally:
+			if profiler: profiler.end()
+	
 	def execute(self, freq_stats=0):
 		""" Do all the steps until the termination criteria or time Steps achieved,
 		accepts the freq_stats (default is 0) to dump statistics at n-step
@@ -385,26 +1043,28 @@ class SimplePSO(object):
 
 		print "Starting loop over evolutionary algorithm."
 		
+		profiler = self.profiler
+		if profiler: profiler.reset()
+		
+		if self.interactiveMode:
+			self.listener = InteractiveListener.InteractiveListener(self.interactivePollTime)
+			self.listener.start()
+		listener = self.listener
+		
 		try:
 			while not self.constructSolution():
-				stopFlagCallback = False
-				stopFlagTerminationCriteria = False
-				
-				if not self.stepCallback.isEmpty():
-					for it in self.stepCallback.applyFunctions(self):
-						stopFlagCallback = it
-					
-				if not self.terminationCriteria.isEmpty():
-					for it in self.terminationCriteria.applyFunctions(self):
-						stopFlagTerminationCriteria = it
+				stopFlagCallback, stopFlagTerminationCriteria = self.applyCriteria()
+				if profiler: profiler.mark("callbacks")
 				
 				if freq_stats != 0:
 					if (self.currentStep % freq_stats == 0) or (self.currentStep == 1):
 						self.printStats()
+				if profiler: profiler.mark("statistics")
 					
 				if self.reportAdapter:
 					if self.currentStep % self.reportAdapter.statsGenFreq == 0:
 						self.dumpStatsReport()
+				if profiler: profiler.mark("report")
 				
 				if stopFlagTerminationCriteria:
 					print '\n\tExecution stopped by Termination Criteria function !\n'
@@ -414,41 +1074,25 @@ class SimplePSO(object):
 					print '\n\tExecution stopped by Step Callback function!\n'
 					break
 
-			  
-				if self.interactiveMode:
-					if sys_platform[:3] == "win":
-						if msvcrt.kbhit():
-							if ord(msvcrt.getch()) == Consts.CDefESCKey:
-								print "Loading modules for Interactive mode...",
-								import pypso.Interaction
-								print "done!\n"
-								interact_banner = "## PyPSO v.%s - Interactive Mode ##\nPress CTRL-Z to quit interactive mode." % (pypso.__version__,)
-								session_locals = {  "pso_engine"  : self,
-													"topology" : self.getTopology(),
-													"swarm_statistics": self.getTopology().swarmStats,
-													"topology_statistics": self.getTopology().topologyStats,
-													"pypso"   : pypso ,
-													"it"         : pypso.Interaction}
-								print
-								code.interact(interact_banner, local=session_locals)
-					elif sys_platform[:5] == "linux":
-						if Util.kbhit():
-							if ord(Util.getch()) == Consts.CDefESCKey:
-								print "Loading modules for Interactive mode...",
-								import pypso.Interaction
-								print "done!\n"
-								interact_banner = "## PyPSO v.%s - Interactive Mode ##\nPress CTRL-D to quit interactive mode." % (pypso.__version__,)
-								session_locals = {  "pso_engine"  : self,
-													"topology" : self.getTopology(),
-													"swarm_statistics": self.getTopology().swarmStats,
-													"topology_statistics": self.getTopology().topologyStats,
-													"pypso"   : pypso ,
-													"it"         : pypso.Interaction}
-								print
-								code.interact(interact_banner, local=session_locals)
+				if listener and listener.requested:
+					if self.currentStep % self.interactiveFreq == 0:
+						self.interact()
+				if profiler:
+					profiler.mark("interactive")
+					profiler.end()
+					if self.reportAdapter: self.dumpProfileReport()
                                     
 		except KeyboardInterrupt:
 			print "\n\tA break was detected, you have interrupted the evolution !\n"
+		finally:
+			if listener:
+				listener.stop()
+				self.listener = None
+
+		#The last step is still open when the loop was stopped
+		if profiler and profiler.running:
+			profiler.end()
+			if self.reportAdapter: self.dumpProfileReport()
 
 		if freq_stats != 0:
 			self.printStats()
@@ -17,6 +17,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 
 0.10 2009-09-30 Initial version.
+0.11 2026-10-19 Added decode() for the categorical particles, fixed the slices and iterators.
 '''
 
 
@@ -32,6 +33,7 @@ class that holds the dimmension types) to use with the supported particles.
 
 import random
 import Consts
+import Util
 
 class PsoDimmensions(object):
 	""" PsoDimmensions Class - the set of dimmensions
@@ -65,7 +67,7 @@ class PsoDimmensions(object):
 		
 	def __getslice__(self, a, b):
 		""" Returns the slice part of dimmensions list """
-		return self.dimmensions_list[a:b]
+		return self.dimmension_list[a:b]
 		
 	
 	def __getitem__(self,index):
@@ -98,6 +100,20 @@ class PsoDimmensions(object):
 		"""Returns the length of the dimmensions list """
 		if self.homogeneous: return 1
 		return len(self.dimmension_list)
+	
+	def decode(self, indexes):
+		""" Returns the options of the :class:`DimmensionList` dimmensions selected by
+		the indexes, used by the categorical particles
+		
+		Example:
+			>>> dimmensions.decode(particle.getPosition())
+			['relu', 64, 0.1]
+		
+		:param indexes: the list of option indexes, one per dimmension
+		:rtype: the list of options
+		
+		"""
+		return [self[i][index] for i, index in enumerate(indexes)]
 		
 	def __repr__(self):
 		""" Return a string representation of the dimmension """
@@ -166,7 +182,7 @@ class DimmensionList(object):
 
 	def __iter__(self):
 		"""Return the list iterator """
-		return iter(self.optionss)
+		return iter(self.options)
 
 	def __len__(self):
 		"""Returns the length of the options list 
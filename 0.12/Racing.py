@@ -0,0 +1,346 @@
+'''
+Particle Swarm Optimization - PyPSO
+
+Copyright (c) 2009 Marcel Pinheiro Caraciolo
+caraciol@gmail.com
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+0.10 2026-10-19 Initial version.
+0.11 2026-10-19 The failed runs are kept with their reason (getFailures).
+'''
+
+"""
+
+:mod:`Racing` -- the racing parameter tuning module
+==============================================================
+
+    This module contains the :class:`Racing.Race` class, the F-race (Birattari et
+    al.) tuning of the PSO parameters: the candidate configurations are executed on
+    the benchmark instances one instance at a time and, after each instance, the
+    Friedman test is done on the results. When the test rejects the hypothesis that
+    all the candidates are equivalent, the candidates whose rank sum is worse than
+    the rank sum of the best candidate by more than the critical difference of the
+    post-hoc test are discarded, so they are not executed on the next instances.
+
+    The runs are executed in the process pool of the :mod:`Sweep` module
+    (:func:`Sweep.executeRuns`), the builder function receives the configuration
+    and the instance: ::
+
+        def builder(config, instance):
+            function, seed = instance
+            (...)
+            return pso_engine
+
+    The quantiles of the tests are computed with approximations (Acklam for the
+    normal distribution, Wilson-Hilferty for the chi-square distribution and the
+    Cornish-Fisher expansion for the Student's t distribution), so no statistical
+    package is required.
+
+"""
+
+import Consts
+import Util
+import Sweep
+import math
+
+
+def normalQuantile(p):
+	""" Returns the quantile of the standard normal distribution (Acklam's
+	algorithm, relative error lower than 1.15e-9)
+
+	:param p: the probability, 0 < p < 1
+	:rtype: the quantile
+
+	"""
+	if p <= 0.0 or p >= 1.0:
+		Util.raiseException("The probability must be in (0, 1)", ValueError)
+	a = (-3.969683028665376e+01, 2.209460984245205e+02, -2.759285104469687e+02,
+		 1.383577518672690e+02, -3.066479806614716e+01, 2.506628277459239e+00)
+	b = (-5.447609879822406e+01, 1.615858368580409e+02, -1.556989798598866e+02,
+		 6.680131188771972e+01, -1.328068155288572e+01)
+	c = (-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e+00,
+		 -2.549732539343734e+00, 4.374664141464968e+00, 2.938163982698783e+00)
+	d = (7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e+00,
+		 3.754408661907416e+00)
+	if p < 0.02425:
+		q = math.sqrt(-2.0 * math.log(p))
+		return (((((c[0] * q + c[1]) * q + c[2]) * q + c[3]) * q + c[4]) * q + c[5]) / \
+			   ((((d[0] * q + d[1]) * q + d[2]) * q + d[3]) * q + 1.0)
+	if p > 1.0 - 0.02425:
+		return -normalQuantile(1.0 - p)
+	q = p - 0.5
+	r = q * q
+	return (((((a[0] * r + a[1]) * r + a[2]) * r + a[3]) * r + a[4]) * r + a[5]) * q / \
+		   (((((b[0] * r + b[1]) * r + b[2]) * r + b[3]) * r + b[4]) * r + 1.0)
+
+
+def chiSquareQuantile(p, df):
+	""" Returns the quantile of the chi-square distribution (Wilson-Hilferty approximation)
+
+	:param p: the probability, 0 < p < 1
+	:param df: the degrees of freedom
+	:rtype: the quantile
+
+	"""
+	z = normalQuantile(p)
+	h = 2.0 / (9.0 * df)
+	return max(0.0, df * (1.0 - h + z * math.sqrt(h)) ** 3)
+
+
+def studentQuantile(p, df):
+	""" Returns the quantile of the Student's t distribution (Cornish-Fisher
+	expansion, Abramowitz and Stegun 26.7.5)
+
+	:param p: the probability, 0 < p < 1
+	:param df: the degrees of freedom
+	:rtype: the quantile
+
+	"""
+	z = normalQuantile(p)
+	z2 = z * z
+	g1 = (z2 + 1.0) * z / 4.0
+	g2 = ((5.0 * z2 + 16.0) * z2 + 3.0) * z / 96.0
+	g3 = (((3.0 * z2 + 19.0) * z2 + 17.0) * z2 - 15.0) * z / 384.0
+	g4 = ((((79.0 * z2 + 776.0) * z2 + 1482.0) * z2 - 1920.0) * z2 - 945.0) * z / 92160.0
+	n = float(df)
+	return z + g1 / n + g2 / (n * n) + g3 / (n ** 3) + g4 / (n ** 4)
+
+
+def rankBlock(costs):
+	""" Returns the ranks of the costs of one block (instance), the lowest cost
+	has rank 1 and the ties have the average rank
+
+	:param costs: the list of costs
+	:rtype: the list of ranks
+
+	"""
+	order = sorted(xrange(len(costs)), key=costs.__getitem__)
+	ranks = [0.0] * len(costs)
+	start = 0
+	while start < len(order):
+		end = start + 1
+		while end < len(order) and costs[order[end]] == costs[order[start]]:
+			end += 1
+		rank = (start + end + 1) / 2.0
+		for position in xrange(start, end):
+			ranks[order[position]] = rank
+		start = end
+	return ranks
+
+
+def friedmanTest(blocks, alpha):
+	""" Friedman test of the blocks and post-hoc comparisons with the best candidate
+
+	:param blocks: the list of the blocks (one list of costs per instance), all
+	               the blocks have one cost per candidate
+	:param alpha: the significance level
+	:rtype: the tuple (rank sums, list of the candidates indexes which are
+	        significantly worse than the best one)
+
+	"""
+	k = len(blocks)
+	m = len(blocks[0])
+	ranks = [rankBlock(block) for block in blocks]
+	sums = [sum([row[j] for row in ranks]) for j in xrange(m)]
+	best = min(sums)
+	if m < 2 or k < 2:
+		return sums, []
+
+	sum_squares = sum([r * r for row in ranks for r in row])
+	correction = k * m * (m + 1) ** 2 / 4.0
+	dispersion = sum_squares - correction
+	if dispersion <= 0.0:
+		#All the candidates are tied on every instance
+		return sums, []
+	statistic = (m - 1) * sum([(s - k * (m + 1) / 2.0) ** 2 for s in sums]) / dispersion
+	if statistic <= chiSquareQuantile(1.0 - alpha, m - 1):
+		return sums, []
+
+	agreement = 1.0 - statistic / (k * (m - 1))
+	if agreement <= 0.0:
+		#Same ranking on every instance, all the worse candidates are discarded
+		return sums, [j for j in xrange(m) if sums[j] > best]
+	critical = studentQuantile(1.0 - alpha / 2.0, (k - 1) * (m - 1)) * \
+			   math.sqrt(2.0 * k * agreement * dispersion / ((k - 1) * (m - 1)))
+	return sums, [j for j in xrange(m) if sums[j] - best > critical]
+
+
+class Race(object):
+	""" Race Class - The F-race tuning of the PSO configurations
+
+	Example:
+		>>> candidates = Sweep.gridDesign({"C1": [1.0, 1.5, 2.05], "C2": [1.0, 1.5, 2.05],
+		>>>									"swarmSize": [10, 20, 40]})
+		>>> instances = [(name, seed) for seed in range(10) for name in ("sphere", "rastrigin")]
+		>>> race = Racing.Race(builder, candidates, instances, processes=8)
+		>>> race.execute()
+		>>> race.getBest()
+		{'C1': 1.5, 'C2': 2.05, 'swarmSize': 20}
+
+	The cost of a run is the best fitness found, the failed runs (errors and
+	timeouts) have the worst cost, they are kept by :meth:`getFailures`. The race stops when one candidate survives,
+	when all the instances were used or when the *max_runs* budget is exhausted.
+
+	:param builder: the builder function of the PSO Engine, builder(config, instance)
+	:param candidates: the list of configurations
+	:param instances: the list of instances, they must be picklable
+	:param minimax: the Consts.minimaxType of the fitness, default is minimize
+	:param alpha: the significance level of the tests, default is Consts.CDefRaceAlpha
+	:param first_test: the number of instances done before the first test,
+	                   default is Consts.CDefRaceFirstTest
+	:param max_runs: the maximum number of runs, None for no limit
+	:param processes: the number of worker processes, default is the number of CPUs
+	:param time_limit: the time limit of a run in seconds, None for no limit
+
+	"""
+
+	def __init__(self, builder, candidates, instances, minimax=None, alpha=Consts.CDefRaceAlpha,
+				 first_test=Consts.CDefRaceFirstTest, max_runs=None, processes=None, time_limit=None):
+		""" The Race Class Creator """
+		if len(candidates) < 1:
+			Util.raiseException("The race needs at least one candidate", ValueError)
+		self.builder = builder
+		self.candidates = list(candidates)
+		self.instances = list(instances)
+		self.minimax = Consts.minimaxType["minimize"] if minimax is None else minimax
+		self.alpha = alpha
+		self.firstTest = max(2, first_test)
+		self.maxRuns = max_runs
+		self.processes = processes
+		self.timeLimit = time_limit
+		self.clear()
+
+	def clear(self):
+		""" Clears the state of the race """
+		#The costs of every candidate, one per instance done
+		self.costs = [[] for candidate in self.candidates]
+		self.alive = range(len(self.candidates))
+		#The step (number of instances done) each candidate was discarded at
+		self.discarded = {}
+		self.rankSums = None
+		self.instancesDone = 0
+		self.runs = 0
+		#The (configuration, instance, result) of the failed runs
+		self.failures = []
+
+	def __repr__(self):
+		""" The string representation of the race """
+		ret = "- Race\n"
+		ret += "\tCandidates:\t %d (alive: %d)\n" % (len(self.candidates), len(self.alive))
+		ret += "\tInstances:\t %d (done: %d)\n" % (len(self.instances), self.instancesDone)
+		ret += "\tRuns:\t\t %d (full design: %d)\n" % (self.runs, len(self.candidates) * len(self.instances))
+		return ret
+
+	def getCost(self, result):
+		""" Returns the cost (to be minimized) of the result of a run
+
+		:param result: the result dict of :func:`Sweep.executeRun`
+		:rtype: the cost
+
+		"""
+		best = result["bestFitness"]
+		if result["status"] != "done" or best is None:
+			return float("inf")
+		if self.minimax == Consts.minimaxType["maximize"]:
+			return -best
+		return best
+
+	def raceInstance(self, instance):
+		""" Executes the alive candidates on the instance
+
+		:param instance: the instance
+
+		"""
+		keys = {}
+		for index in self.alive:
+			keys.setdefault(Sweep.configKey(self.candidates[index], instance), []).append(index)
+		runs = [(self.candidates[indexes[0]], instance) for indexes in keys.values()]
+		for config, seed, result in Sweep.executeRuns(self.builder, runs, self.processes,
+													  time_limit=self.timeLimit):
+			cost = self.getCost(result)
+			if result["status"] != "done":
+				self.failures.append((config, seed, result))
+			for index in keys[Sweep.configKey(config, seed)]:
+				self.costs[index].append(cost)
+		self.runs += len(runs)
+		self.instancesDone += 1
+
+	def eliminate(self):
+		""" Does the Friedman test on the alive candidates and discards the worse ones
+
+		:rtype: the list of the discarded candidates indexes
+
+		"""
+		alive = self.alive
+		blocks = [[self.costs[index][k] for index in alive] for k in xrange(self.instancesDone)]
+		sums, worse = friedmanTest(blocks, self.alpha)
+		self.rankSums = dict(zip(alive, sums))
+		discarded = [alive[j] for j in worse]
+		for index in discarded:
+			self.discarded[index] = self.instancesDone
+		self.alive = [index for index in alive if index not in self.discarded]
+		return discarded
+
+	def execute(self, verbose=True):
+		""" Executes the race
+
+		:param verbose: if True, the progress is printed
+		:rtype: the list of the surviving configurations, best first
+
+		"""
+		self.clear()
+		for instance in self.instances:
+			if len(self.alive) <= 1:
+				break
+			if self.maxRuns is not None and self.runs + len(self.alive) > self.maxRuns:
+				break
+			self.raceInstance(instance)
+			discarded = []
+			if self.instancesDone >= self.firstTest:
+				discarded = self.eliminate()
+			if verbose:
+				print "Race instance %d: %d runs, %d candidates discarded, %d alive." % (self.instancesDone,
+						self.runs, len(discarded), len(self.alive))
+		if self.instancesDone > 0 and len(self.alive) > 1:
+			blocks = [[self.costs[index][k] for index in self.alive] for k in xrange(self.instancesDone)]
+			self.rankSums = dict(zip(self.alive, friedmanTest(blocks, self.alpha)[0]))
+		return self.getSurvivors()
+
+	def getSurvivors(self):
+		""" Returns the surviving configurations, sorted by their rank sum (best first)
+
+		:rtype: the list of configurations
+
+		"""
+		alive = self.alive
+		if self.rankSums is not None and len(alive) > 1:
+			alive = sorted(alive, key=self.rankSums.get)
+		return [self.candidates[index] for index in alive]
+
+	def getBest(self):
+		""" Returns the best surviving configuration """
+		return self.getSurvivors()[0]
+
+	def getRuns(self):
+		""" Returns the number of runs done by the race """
+		return self.runs
+
+	def getFailures(self):
+		""" Returns the failed runs (errors and timeouts), the reason of the failure
+		is the *message* of the result
+
+		:rtype: the list of (configuration, instance, result) tuples
+
+		"""
+		return self.failures
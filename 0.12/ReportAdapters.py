@@ -19,6 +19,11 @@ limitations under the License.
 0.10 2009-05-25 Initial version.
 0.11 2009-05-28 Added support for database adapter (SQLite3 database)
 0.23 2009-09-19 Redesigned the Module for support new API and Docs.
+0.24 2026-10-19 Added support for the Step Profiler timings (insertProfile).
+0.24 2026-10-19 The csv and sqlite3 modules are imported only when an adapter is opened.
+0.24 2026-10-19 Added support for the diversity statistics.
+0.24 2026-10-19 The vector fitness (multi-objective) is stored as text by the ReportDB adapter.
+0.24 2026-10-19 ReportDB creates the diversity and profile tables missing in the older databases.
 '''
 
 """
@@ -40,11 +45,15 @@ You can use the report to plot convergence statistics graphs later.
 """
 
 
-import csv
 import Consts
 import types
-import sqlite3
+import datetime
+import os
 import FloatStatistics
+import Util
+
+csv = Util.LazyModule("csv")
+sqlite3 = Util.LazyModule("sqlite3")
 
 
 #DBSQLite Class - Adapter to dump data in SQLite3 database format
@@ -103,6 +112,8 @@ class ReportDB:
         
         if self.resetDB:
             self.resetStructure((FloatStatistics.SwarmStatistics(),FloatStatistics.TopologyStatistics()))
+        else:
+            self.createStepTables()
         
         if self.resetIdentify:
             self.resetTableIdentify()
@@ -162,6 +173,26 @@ class ReportDB:
         pstmt = """create table if not exists %s(identify text, iteration integer,
                 particle integer, fitness real, bestFitness real)""" % (Consts.CDefSQLiteDBPartTable)
         c.execute(pstmt)
+        self.createStepTables()
+
+    def createStepTables(self):
+        """ Create the diversity and the profile tables if they do not exist, they are
+        missing in the databases created by the older versions, which are opened
+        without the *resetDB* parameter
+        """
+        c = self.getCursor()
+
+        #Diversity statistics
+        pstmt = "create table if not exists %s(identify text, iteration integer, " % (Consts.CDefReportDBDivTable)
+        for k,v in FloatStatistics.DiversityStatistics().items():
+            pstmt += "%s %s, " % (k, self.typeDict[type(v)])
+        pstmt = pstmt[:-2] + ")"
+        c.execute(pstmt)
+
+        #Step profiler timings
+        pstmt = """create table if not exists %s(identify text, iteration integer,
+                phase text, elapsed real, total real)""" % (Consts.CDefReportDBProfTable)
+        c.execute(pstmt)
         self.commit()
     
     def resetTableIdentify(self):
@@ -170,11 +201,15 @@ class ReportDB:
         stmt = "delete from %s where identify  = ?" % (Consts.CDefReportDBSwarmTable)
         stmt2 = "delete from %s where identify = ?" % (Consts.CDefReportDBTopTable)
         stmt3 = "delete from %s where identify = ?" % (Consts.CDefSQLiteDBPartTable)
+        stmt4 = "delete from %s where identify = ?" % (Consts.CDefReportDBProfTable)
+        stmt5 = "delete from %s where identify = ?" % (Consts.CDefReportDBDivTable)
         
         try:
             c.execute(stmt, (self.identify,))
             c.execute(stmt2, (self.identify,))
             c.execute(stmt3, (self.identify,))
+            c.execute(stmt4, (self.identify,))
+            c.execute(stmt5, (self.identify,))
         except sqlite3.OperationalError, expt:
             if expt.message.find("no such table") >= 0:
                 print "\n ## The DB Adapter can't find the tables ! Consider enable the parameter resetDB ! ##\n"
@@ -191,9 +226,23 @@ class ReportDB:
         c.execute("drop table if exists %s" % (Consts.CDefReportDBSwarmTable,))
         c.execute("drop table if exists %s" % (Consts.CDefReportDBTopTable,))
         c.execute("drop table if exists %s" % (Consts.CDefSQLiteDBPartTable,))
+        c.execute("drop table if exists %s" % (Consts.CDefReportDBProfTable,))
+        c.execute("drop table if exists %s" % (Consts.CDefReportDBDivTable,))
         self.commit()
         self.createStructure(stats)
 
+    def dbValue(self,value):
+        """ Returns the value to be stored, the vector fitness of the multi-objective
+        topologies is stored as its text, like "(0.25, 1.5)"
+
+          :param value: the value
+          :rtype: the value or its text
+
+        """
+        if isinstance(value, (tuple, list)):
+            return str(tuple(value))
+        return value
+
     #Inserts the statistics into the database
     #@param stats: The statistics objects
     #@param topology: The swarm to insert stats (class: Topology.Topology)
@@ -215,17 +264,37 @@ class ReportDB:
 
         #Topology statistics
         pstmt = "insert into %s values(?, ?, ?, ?) " % (Consts.CDefReportDBTopTable)
-        c.execute(pstmt, (self.identify,iteration,stats[0]["bestFitness"],stats[0]["bestPosDim"]))
+        c.execute(pstmt, (self.identify,iteration,self.dbValue(stats[0]["bestFitness"]),stats[0]["bestPosDim"]))
+
+        #Diversity statistics, only when enabled in the topology
+        if len(stats) > 2:
+            pstmt = "insert into %s values (?, ?, " % (Consts.CDefReportDBDivTable)
+            pstmt += "?, " * len(stats[2])
+            pstmt = pstmt[:-2] + ")"
+            c.execute(pstmt, (self.identify,iteration) + stats[2].asTuple())
         
         #Particles statistics
         pstmt = "insert into %s values(?, ?, ?, ?, ?)" % (Consts.CDefSQLiteDBPartTable,)
         tups = []
         for i in xrange(len(topology)):
             particle = topology[i]
-            tups.append((self.identify,iteration,i, particle.fitness, particle.ownBestFitness))
+            tups.append((self.identify,iteration,i, self.dbValue(particle.fitness), self.dbValue(particle.ownBestFitness)))
         c.executemany(pstmt,tups)
         if (iteration % self.commitFreq == 0):
             self.commit()
+
+    def insertProfile(self,profiler,iteration):
+        """ Inserts the timings of the last complete step into the database
+
+          :param profiler: the step profiler (:class:`Profiler.StepProfiler`)
+          :param iteration: the iteration of the insert
+        """
+        c = self.getCursor()
+        pstmt = "insert into %s values(?, ?, ?, ?, ?)" % (Consts.CDefReportDBProfTable,)
+        tups = []
+        for phase, elapsed, total in profiler.items():
+            tups.append((self.identify, iteration, phase, elapsed, total))
+        c.executemany(pstmt,tups)
             
 
 class ReportFileCSV:
@@ -241,14 +310,16 @@ class ReportFileCSV:
       :param identify: the identify of the run
       :param frequency: the generational dump frequency
       :param reset: if is True, the file old data will be overwrite with the new
+      :param profile_filename: the CSV filename of the step profiler timings
 
    """
    
     def __init__(self, filename=Consts.CDefCSVFileName, identify=None,
-                 frequency = Consts.CDefCSVFileStatsGenFreq, reset= True):
+                 frequency = Consts.CDefCSVFileStatsGenFreq, reset= True,
+                 profile_filename=Consts.CDefCSVProfileFileName):
         """ The creator of ReportFileCSV Class """
         if identify is None:
-            self.identify = datetime.datetime.strftime(date.datetime.now(),"%d/%m/%y-%H:%M")
+            self.identify = datetime.datetime.strftime(datetime.datetime.now(),"%d/%m/%y-%H:%M")
         else:
             self.identify = identify
         
@@ -257,6 +328,9 @@ class ReportFileCSV:
         self.csvWriter = None
         self.fHandler = None
         self.reset = reset
+        self.profileFilename = profile_filename
+        self.profileWriter = None
+        self.profileHandler = None
      
      
     def __repr__(self):
@@ -273,9 +347,13 @@ class ReportFileCSV:
         self.csvWriter = csv.writer(self.fHandler,delimiter=";")
 
     def close(self):
-        """ Closes the CSV file handle """
+        """ Closes the CSV file handles """
         if self.fHandler:
             self.fHandler.close()
+        if self.profileHandler:
+            self.profileHandler.close()
+            self.profileHandler = None
+            self.profileWriter = None
     
 
     def saveAndClose(self):
@@ -299,5 +377,27 @@ class ReportFileCSV:
         line = [self.identify,iteration]
         line.extend(stats[0].asTuple())
         line.extend(stats[1].asTuple())
+        if len(stats) > 2:
+            line.extend(stats[2].asTuple())
         self.csvWriter.writerow(line)
 
+    def insertProfile(self,profiler,iteration):
+        """ Inserts the timings of the last complete step into the profile CSV file,
+        the file is only created when the first timings are dumped and the header
+        is written when the file is new or empty.
+
+          :param profiler: the step profiler (:class:`Profiler.StepProfiler`)
+          :param iteration: the iteration of the insert
+
+        """
+        if self.profileWriter is None:
+            if self.reset: open_mode = "w"
+            else: open_mode = "a"
+            header = self.reset or not os.path.exists(self.profileFilename) or os.path.getsize(self.profileFilename) == 0
+            self.profileHandler = open(self.profileFilename,open_mode)
+            self.profileWriter = csv.writer(self.profileHandler,delimiter=";")
+            if header:
+                self.profileWriter.writerow(["identify","iteration"] + list(profiler.phases))
+        line = [self.identify,iteration]
+        line.extend(profiler.asTuple())
+        self.profileWriter.writerow(line)
@@ -0,0 +1,295 @@
+'''
+Particle Swarm Optimization - PyPSO
+
+Copyright (c) 2009 Marcel Pinheiro Caraciolo
+caraciol@gmail.com
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+0.10 2026-10-19 Initial version.
+0.11 2026-10-19 The inverse of the kernel matrix is updated incrementally (bordered updates).
+'''
+
+"""
+
+:mod:`Surrogate` -- the surrogate-assisted evaluation module
+==============================================================
+
+    This module contains the :class:`Surrogate.RBFSurrogate` model and the
+    :func:`Surrogate.SurrogatePrescreening` evaluation updater, which only sends
+    the promising or uncertain particles to the evaluation function, for the
+    expensive objectives: ::
+
+        topology.evaluation_updater.set(Surrogate.SurrogatePrescreening)
+        pso_engine.setParams(surrogate=Surrogate.RBFSurrogate(), surrogateKappa=1.0)
+
+    The model is a Gaussian radial basis function interpolation (the mean of a
+    Gaussian process with a fixed length scale) of an archive of the evaluated
+    positions, which also gives the uncertainty of the prediction. A particle is
+    evaluated when the lower confidence bound of its predicted fitness,
+    mean - *surrogateKappa* * deviation, is better than its own best fitness. The
+    other particles get the predicted mean as fitness and their *predicted* flag
+    is set, so they never update their own best.
+
+    The prescreening supports the real positions (:class:`Particle1D.Particle1D`)
+    and the single objective topologies without constraints. The numpy module is
+    required and it is imported when the model is used.
+
+"""
+
+import Consts
+import Util
+
+numpy = Util.LazyModule("numpy", "the Surrogate module requires the numpy module !")
+
+
+class RBFSurrogate(object):
+	""" RBFSurrogate Class - The Gaussian RBF model of the evaluated positions
+
+	The archive keeps the last *size* evaluated positions. The inverse of the
+	regularized kernel matrix is updated incrementally in O(m^2): a new position
+	borders it with its kernel row (Schur complement update) and the removal of
+	the oldest position is the inverse downdate. The kernel matrix is only
+	factorized again (Cholesky) when the length scale is reset, or when an update
+	loses the positive definiteness. The length scale is the median distance between
+	the positions of the archive, it is only reset when it changes by a factor
+	larger than 2.
+
+	Example:
+		>>> model = Surrogate.RBFSurrogate(size=300)
+		>>> model.add(position, fitness)
+		>>> mean, deviation = model.predict(positions)
+
+	:param size: the size of the archive, default is Consts.CDefSurrogateArchiveSize
+	:param length_scale: the fixed length scale of the kernel, None to adapt it
+	:param nugget: the regularization of the kernel matrix, default is Consts.CDefSurrogateNugget
+
+	"""
+
+	def __init__(self, size=None, length_scale=None, nugget=None):
+		""" The RBFSurrogate Class Creator """
+		self.size = Consts.CDefSurrogateArchiveSize if size is None else size
+		self.fixedScale = length_scale
+		self.nugget = Consts.CDefSurrogateNugget if nugget is None else nugget
+		self.clear()
+
+	def clear(self):
+		""" Removes all the positions of the archive """
+		self.points = None
+		self.values = None
+		#The inverse of the regularized kernel matrix, None when it must be factorized
+		self.inverse = None
+		self.lengthScale = self.fixedScale
+		self.fitted = False
+		self.factorizations = 0
+		self.predictions = 0
+		self.evaluations = 0
+
+	def __len__(self):
+		""" Returns the number of positions in the archive """
+		return 0 if self.points is None else len(self.points)
+
+	def __repr__(self):
+		""" Returns the string representation of the model """
+		ret = "- RBF Surrogate\n"
+		ret += "\tArchive:\t %d (max: %d)\n" % (len(self), self.size)
+		ret += "\tLength scale:\t %s\n" % (self.lengthScale,)
+		ret += "\tPredictions:\t %d\n" % (self.predictions,)
+		ret += "\tEvaluations:\t %d\n" % (self.evaluations,)
+		return ret
+
+	def kernelOf(self, a, b):
+		""" Returns the Gaussian kernel matrix between the rows of a and b """
+		distances = (a * a).sum(axis=1)[:, numpy.newaxis] + (b * b).sum(axis=1)[numpy.newaxis, :] - 2.0 * a.dot(b.T)
+		numpy.maximum(distances, 0.0, out=distances)
+		return numpy.exp(-distances / (2.0 * self.lengthScale * self.lengthScale))
+
+	def medianDistance(self):
+		""" Returns the median distance between the positions of the archive """
+		points = self.points
+		distances = (points * points).sum(axis=1)[:, numpy.newaxis] + (points * points).sum(axis=1) - 2.0 * points.dot(points.T)
+		distances = numpy.sqrt(numpy.maximum(distances[numpy.triu_indices(len(points), 1)], 0.0))
+		median = float(numpy.median(distances)) if len(distances) else 0.0
+		return median if median > 0.0 else 1.0
+
+	def add(self, position, fitness):
+		""" Adds an evaluated position to the archive, the oldest position is
+		removed when the archive is full
+
+		:param position: the position
+		:param fitness: the fitness of the position
+
+		"""
+		point = numpy.asarray(position, dtype=numpy.float64)[numpy.newaxis, :]
+		if self.points is None:
+			self.points = point
+			self.values = numpy.array([fitness], dtype=numpy.float64)
+			self.inverse = None
+		else:
+			if len(self.points) >= self.size:
+				self.points = self.points[1:]
+				self.values = self.values[1:]
+				if self.inverse is not None:
+					self.inverse = self.downdate(self.inverse)
+			if self.inverse is not None:
+				self.inverse = self.border(self.inverse, self.kernelOf(point, self.points)[0])
+			self.points = numpy.vstack((self.points, point))
+			self.values = numpy.append(self.values, fitness)
+		self.fitted = False
+
+	def border(self, inverse, row):
+		""" Returns the inverse of the kernel matrix bordered by the kernel row of a
+		new position (Schur complement update), None when the update is not
+		positive definite and the matrix must be factorized again
+
+		:param inverse: the (m, m) inverse of the regularized kernel matrix
+		:param row: the (m,) kernel row of the new position
+		:rtype: the (m + 1, m + 1) inverse or None
+
+		"""
+		u = inverse.dot(row)
+		schur = 1.0 + self.nugget - row.dot(u)
+		if schur <= 0.5 * self.nugget:
+			return None
+		count = len(row)
+		bordered = numpy.empty((count + 1, count + 1))
+		bordered[:count, :count] = inverse + numpy.outer(u, u) / schur
+		bordered[count, :count] = bordered[:count, count] = -u / schur
+		bordered[count, count] = 1.0 / schur
+		return bordered
+
+	def downdate(self, inverse):
+		""" Returns the inverse of the kernel matrix without its first position
+
+		:param inverse: the (m, m) inverse of the regularized kernel matrix
+		:rtype: the (m - 1, m - 1) inverse
+
+		"""
+		column = inverse[1:, 0]
+		return inverse[1:, 1:] - numpy.outer(column, column) / inverse[0, 0]
+
+	def factorize(self):
+		""" Factorizes the regularized kernel matrix of the archive (Cholesky),
+		sets its inverse and returns the weights of the normalized values
+
+		:rtype: the weights
+
+		"""
+		count = len(self.points)
+		matrix = self.kernelOf(self.points, self.points) + self.nugget * numpy.eye(count)
+		lower = numpy.linalg.cholesky(matrix)
+		solved = numpy.linalg.solve(lower, numpy.eye(count))
+		self.inverse = solved.T.dot(solved)
+		self.factorizations += 1
+		values = (self.values - self.mean) / self.deviation
+		return numpy.linalg.solve(lower.T, numpy.linalg.solve(lower, values))
+
+	def fit(self):
+		""" Computes the weights of the model, called by :meth:`predict`. The kernel
+		matrix is only factorized when its inverse was not kept by the updates """
+		if self.fixedScale is None:
+			scale = self.medianDistance()
+			if self.lengthScale is None or not (0.5 < scale / self.lengthScale < 2.0):
+				self.lengthScale = scale
+				self.inverse = None
+
+		values = self.values
+		self.mean = float(values.mean())
+		self.deviation = float(values.std()) or 1.0
+		if self.inverse is None:
+			self.weights = self.factorize()
+		else:
+			self.weights = self.inverse.dot((values - self.mean) / self.deviation)
+		self.fitted = True
+
+	def predict(self, positions):
+		""" Predicts the fitness of the positions
+
+		:param positions: the (positions, dimmensions) array
+		:rtype: the tuple of the (positions,) arrays (mean, deviation)
+
+		"""
+		if len(self) == 0:
+			Util.raiseException("The surrogate model has no evaluated position", ValueError)
+		if not self.fitted:
+			self.fit()
+		positions = numpy.asarray(positions, dtype=numpy.float64)
+		kernel = self.kernelOf(positions, self.points)
+		mean = self.mean + self.deviation * kernel.dot(self.weights)
+		variance = 1.0 - (kernel.dot(self.inverse) * kernel).sum(axis=1)
+		deviation = self.deviation * numpy.sqrt(numpy.maximum(variance, 0.0))
+		return mean, deviation
+
+
+def getSurrogate(pso_engine):
+	""" Returns the *surrogate* param of the engine, a new :class:`RBFSurrogate`
+	is set when the param is not set
+
+	:param pso_engine: the PSO Engine
+	:rtype: the surrogate model
+
+	"""
+	model = pso_engine.getParam("surrogate")
+	if model is None:
+		model = RBFSurrogate()
+		pso_engine.setParams(surrogate=model)
+	return model
+
+
+def SurrogatePrescreening(pso_engine, **args):
+	""" Update Particle Evaluation function - prescreens the moved particles with the
+	surrogate model, only the particles whose lower confidence bound is better than
+	their own best are evaluated. All the particles are evaluated while the archive
+	has less than *surrogateMinPoints* positions (default is Consts.CDefSurrogateMinPoints).
+
+	The engine params are *surrogate* (the model), *surrogateKappa* (default is
+	Consts.CDefSurrogateKappa) and *surrogateMinPoints*.
+
+	:param pso_engine: the PSO Engine
+
+	"""
+	topology = pso_engine.topology
+	swarm = topology.internalSwarm
+	model = getSurrogate(pso_engine)
+	if len(model) == 0:
+		#The own bests are the evaluated initial positions
+		for particle in swarm:
+			model.add(particle.getOwnBestPosition(), particle.getOwnBestFitness())
+
+	min_points = pso_engine.getParam("surrogateMinPoints", Consts.CDefSurrogateMinPoints)
+	if len(model) < min_points:
+		promising = [True] * len(swarm)
+	else:
+		kappa = pso_engine.getParam("surrogateKappa", Consts.CDefSurrogateKappa)
+		mean, deviation = model.predict([particle.getPosition() for particle in swarm])
+		own_best = numpy.array([particle.getOwnBestFitness() for particle in swarm])
+		if pso_engine.minimax == Consts.minimaxType["maximize"]:
+			promising = (mean + kappa * deviation) > own_best
+		else:
+			promising = (mean - kappa * deviation) < own_best
+
+	evaluations = 0
+	for index in xrange(len(swarm)):
+		particle = swarm[index]
+		particle.rejected = False
+		if promising[index]:
+			evaluations += particle.evaluate(**args)
+			particle.predicted = False
+			model.add(particle.getPosition(), particle.getFitness())
+		else:
+			particle.fitness = float(mean[index])
+			particle.predicted = True
+			model.predictions += 1
+	model.evaluations += evaluations
+	topology.evaluations += evaluations
+	topology.clear_flags()
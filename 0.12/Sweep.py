@@ -0,0 +1,414 @@
+'''
+Particle Swarm Optimization - PyPSO
+
+Copyright (c) 2009 Marcel Pinheiro Caraciolo
+caraciol@gmail.com
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+0.10 2026-10-19 Initial version.
+0.11 2026-10-19 The reason of the failed runs is stored (message column).
+0.11 2026-10-19 The time limit is set with setitimer (fractional seconds), the numeric fitness is stored as float.
+0.11 2026-10-19 No json nor itertools.product (Python 2.5), the failed runs are executed again.
+'''
+
+"""
+
+:mod:`Sweep` -- the parameter sweep module
+==============================================================
+
+    This module contains the :class:`Sweep.Sweep` class, which executes the runs
+    of an experimental design (a list of configurations, see :func:`gridDesign`
+    and :func:`randomDesign`) in a process pool and stores the results in a
+    SQLite3 database. The runs already stored are skipped, so an interrupted
+    sweep is resumed by executing it again.
+
+    The runs are built by a *builder* function, which receives the configuration
+    (a dict) and the seed of the run and returns the configured PSO Engine: ::
+
+        def builder(config, seed):
+            particle = Particle1D.Particle1D(30)
+            particle.evaluator.set(sphere)
+            pso_engine = Pso.SimplePSO(GlobalTopology.GlobalTopology(particle), seed=seed,
+                                       interactiveMode=False)
+            pso_engine.setPsoType(Consts.psoType[config["psoType"]])
+            pso_engine.setCoefficients(config["C1"], config["C2"])
+            pso_engine.setSwarmSize(config["swarmSize"])
+            return pso_engine
+
+    The builder is sent to the worker processes, so it must be a function of
+    a module (not a lambda). The resource limits of the workers (memory and
+    run time) use the POSIX *resource* and *signal* modules, they are ignored
+    on the other platforms. On Python 2.5 the time limit is rounded up to whole
+    seconds and the *multiprocessing* backport is required.
+
+"""
+
+import Consts
+import Util
+import random
+import math
+import os
+import sys
+import signal
+import cPickle
+from time import time
+
+multiprocessing = Util.LazyModule("multiprocessing")
+sqlite3 = Util.LazyModule("sqlite3")
+
+
+def gridDesign(factors):
+	""" Returns the full factorial design of the factors
+
+	Example:
+		>>> Sweep.gridDesign({"psoType": ["CONSTRICTED", "INERTIA"], "swarmSize": [20, 40]})
+		[{'psoType': 'CONSTRICTED', 'swarmSize': 20}, {'psoType': 'CONSTRICTED', 'swarmSize': 40}, (...)]
+
+	:param factors: the dict of the factor name and its list of levels
+	:rtype: the list of configurations
+
+	"""
+	names = sorted(factors.keys())
+	return [dict(zip(names, levels)) for levels in product([factors[name] for name in names])]
+
+
+def product(lists):
+	""" Returns the cartesian product of the lists, like itertools.product
+	(which requires Python 2.6)
+
+	:param lists: the list of lists
+	:rtype: the list of the tuples of the product
+
+	"""
+	if not lists:
+		return [()]
+	rest = product(lists[1:])
+	return [(level,) + tail for level in lists[0] for tail in rest]
+
+
+def randomDesign(factors, samples, seed=None):
+	""" Returns a random design of the factors, the levels of a factor given as a
+	tuple (low, high) are sampled uniformly (integers when both are integers), the
+	levels given as a list are chosen at random
+
+	Example:
+		>>> Sweep.randomDesign({"C1": (1.0, 3.0), "swarmSize": (10, 60), "psoType": ["CONSTRICTED", "INERTIA"]}, 100)
+
+	:param factors: the dict of the factor name and its levels
+	:param samples: the number of configurations
+	:param seed: the random seed of the design
+	:rtype: the list of configurations
+
+	"""
+	generator = random.Random(seed)
+	names = sorted(factors.keys())
+	design = []
+	for i in xrange(samples):
+		config = {}
+		for name in names:
+			levels = factors[name]
+			if isinstance(levels, tuple):
+				low, high = levels
+				if isinstance(low, int) and isinstance(high, int):
+					config[name] = generator.randint(low, high)
+				else:
+					config[name] = generator.uniform(low, high)
+			else:
+				config[name] = generator.choice(levels)
+		design.append(config)
+	return design
+
+
+def configKey(config, seed):
+	""" Returns the key of the run of a configuration, the representation of
+	the sorted items of the configuration and the seed
+
+	:param config: the configuration
+	:param seed: the seed of the run
+	:rtype: the key string
+
+	"""
+	return repr((sorted(config.items()), seed))
+
+
+def encodeConfig(config):
+	""" Returns the configuration serialized as text, to be stored in the database
+
+	:param config: the configuration
+	:rtype: the text (pickle protocol 0)
+
+	"""
+	return cPickle.dumps(config, 0)
+
+
+def decodeConfig(text):
+	""" Returns the configuration serialized by :func:`encodeConfig`
+
+	:param text: the text
+	:rtype: the configuration
+
+	"""
+	return cPickle.loads(str(text))
+
+
+class RunTimeout(Exception):
+	""" Exception raised in the worker when a run exceeds its time limit """
+	pass
+
+
+def alarmHandler(signum, frame):
+	""" The SIGALRM handler of the workers, the alarm is set by the ITIMER_REAL timer """
+	raise RunTimeout()
+
+
+def initWorker(memory_limit, quiet):
+	""" Initializes a worker process of the pool, sets the memory limit and
+	discards the output of the engines
+
+	:param memory_limit: the address space limit in bytes, None for no limit
+	:param quiet: if True, the standard output is discarded
+
+	"""
+	if quiet:
+		sys.stdout = open(os.devnull, "w")
+	if memory_limit is not None:
+		try:
+			import resource
+			resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+		except (ImportError, ValueError):
+			pass
+
+
+def executeRun(task):
+	""" Executes one run in a worker process
+
+	:param task: the tuple (builder, config, seed, time_limit)
+	:rtype: the tuple (config, seed, result), the result is a dict with the
+	        *status* ("done", "timeout" or "error"), *bestFitness*, *evaluations*,
+	        *steps*, *elapsed* and *message* (the reason of the error) keys
+
+	"""
+	builder, config, seed, time_limit = task
+	result = {"status": "done", "bestFitness": None, "evaluations": None,
+			  "steps": None, "elapsed": None, "message": None}
+	alarm = time_limit is not None and hasattr(signal, "SIGALRM")
+	timer = hasattr(signal, "setitimer")
+	time_init = time()
+	try:
+		if alarm:
+			signal.signal(signal.SIGALRM, alarmHandler)
+			if timer:
+				signal.setitimer(signal.ITIMER_REAL, time_limit)
+			else:
+				#Python 2.5, whole seconds only
+				signal.alarm(max(1, int(math.ceil(time_limit))))
+		pso_engine = builder(config, seed)
+		pso_engine.execute()
+		try:
+			result["bestFitness"] = float(pso_engine.bestParticle().ownBestFitness)
+		except (TypeError, ValueError):
+			#A fitness vector (multi-objective) is not stored
+			result["bestFitness"] = None
+		result["evaluations"] = pso_engine.getEvaluations()
+		result["steps"] = pso_engine.getCurrentStep()
+	except RunTimeout:
+		result["status"] = "timeout"
+		result["message"] = "RunTimeout: the run exceeded %s seconds" % (time_limit,)
+	except MemoryError:
+		result["status"] = "error"
+		result["message"] = "MemoryError: the run exceeded the memory limit"
+	except Exception, expt:
+		result["status"] = "error"
+		result["message"] = "%s: %s" % (expt.__class__.__name__, expt)
+	finally:
+		if alarm:
+			if timer:
+				signal.setitimer(signal.ITIMER_REAL, 0)
+			else:
+				signal.alarm(0)
+	result["elapsed"] = time() - time_init
+	return config, seed, result
+
+
+def executeRuns(builder, runs, processes=None, memory_limit=None, time_limit=None,
+				max_tasks=Consts.CDefSweepTasksPerChild, quiet=True):
+	""" Generator of the results of the runs, executed in a process pool, the
+	results are yielded as the runs finish
+
+	:param builder: the builder function of the PSO Engine
+	:param runs: the list of (config, seed) runs
+	:param processes: the number of worker processes, default is the number of CPUs
+	:param memory_limit: the address space limit of the workers in bytes, None for no limit
+	:param time_limit: the time limit of a run in seconds, None for no limit
+	:param max_tasks: the number of runs done by a worker before it is replaced
+	:param quiet: if True, the output of the engines is discarded
+
+	"""
+	tasks = [(builder, config, seed, time_limit) for config, seed in runs]
+	if not tasks:
+		return
+	pool = multiprocessing.Pool(processes, initWorker, (memory_limit, quiet), max_tasks)
+	try:
+		for result in pool.imap_unordered(executeRun, tasks):
+			yield result
+		pool.close()
+	except:
+		pool.terminate()
+		raise
+	finally:
+		pool.join()
+
+
+class Sweep(object):
+	""" Sweep Class - The parameter sweep of a PSO configuration
+
+	Example:
+		>>> design = Sweep.gridDesign({"C1": [1.5, 2.05], "C2": [1.5, 2.05], "psoType": ["CONSTRICTED"]})
+		>>> sweep = Sweep.Sweep(builder, design, seeds=range(30), processes=8, time_limit=600)
+		>>> sweep.execute()
+		>>> for config, seed, result in sweep.getResults():
+		>>>		print config, result["bestFitness"]
+
+	Every configuration is executed once per seed. The results are stored as the
+	runs finish, the completed runs are skipped when the sweep is executed again.
+	A run which failed (error or timeout) is stored too and it is executed again,
+	unless *keep_failed* is True.
+
+	:param builder: the builder function of the PSO Engine
+	:param design: the list of configurations
+	:param seeds: the list of the seeds of the runs of every configuration
+	:param dbname: the SQLite3 database of the results, default is Consts.CDefSweepDBName
+	:param identify: the name of the sweep in the database, default is Consts.CDefSweepIdentify
+	:param processes: the number of worker processes, default is the number of CPUs
+	:param memory_limit: the address space limit of the workers in bytes, None for no limit
+	:param time_limit: the time limit of a run in seconds, None for no limit
+	:param keep_failed: if True, the failed runs are not executed again
+
+	"""
+
+	def __init__(self, builder, design, seeds=(None,), dbname=Consts.CDefSweepDBName,
+				 identify=Consts.CDefSweepIdentify, processes=None, memory_limit=None,
+				 time_limit=None, keep_failed=False):
+		""" The Sweep Class Creator """
+		self.builder = builder
+		self.design = list(design)
+		self.seeds = list(seeds)
+		self.dbName = dbname
+		self.identify = identify
+		self.processes = processes
+		self.memoryLimit = memory_limit
+		self.timeLimit = time_limit
+		self.keepFailed = keep_failed
+		self.maxTasks = Consts.CDefSweepTasksPerChild
+		self.connection = None
+
+	def __repr__(self):
+		""" The string representation of the sweep """
+		ret = "- Sweep [File='%s', identify='%s']\n" % (self.dbName, self.identify)
+		ret += "\tConfigurations:\t %d\n" % (len(self.design),)
+		ret += "\tSeeds:\t\t %d\n" % (len(self.seeds),)
+		ret += "\tProcesses:\t %s\n" % (self.processes,)
+		return ret
+
+	def open(self):
+		""" Opens the database connection and creates the results table """
+		if self.connection is not None: return
+		self.connection = sqlite3.connect(self.dbName)
+		self.connection.execute("""create table if not exists %s(identify text, key text,
+				config text, seed integer, status text, bestFitness real, evaluations integer,
+				steps integer, elapsed real, message text, primary key (identify, key))""" % (Consts.CDefSweepTable,))
+		#The tables created by the previous versions have no message column
+		columns = [row[1] for row in self.connection.execute("pragma table_info(%s)" % (Consts.CDefSweepTable,))]
+		if "message" not in columns:
+			self.connection.execute("alter table %s add column message text" % (Consts.CDefSweepTable,))
+		self.connection.commit()
+
+	def close(self):
+		""" Closes the database connection """
+		if self.connection is None: return
+		self.connection.close()
+		self.connection = None
+
+	def getRuns(self):
+		""" Returns all the (config, seed) runs of the sweep """
+		return [(config, seed) for config in self.design for seed in self.seeds]
+
+	def getCompleted(self):
+		""" Returns the set of keys of the completed runs stored in the database,
+		the failed runs are included when *keep_failed* is True """
+		self.open()
+		cursor = self.connection.execute("select key, status from %s where identify = ?" % (Consts.CDefSweepTable,),
+										 (self.identify,))
+		return set([key for key, status in cursor if status == "done" or self.keepFailed])
+
+	def getPending(self):
+		""" Returns the (config, seed) runs which are not completed """
+		completed = self.getCompleted()
+		return [(config, seed) for config, seed in self.getRuns() if configKey(config, seed) not in completed]
+
+	def store(self, config, seed, result):
+		""" Stores the result of a run
+
+		:param config: the configuration
+		:param seed: the seed of the run
+		:param result: the result dict of :func:`executeRun`
+
+		"""
+		self.open()
+		self.connection.execute("""insert or replace into %s(identify, key, config, seed, status, bestFitness,
+				evaluations, steps, elapsed, message) values (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""" % (Consts.CDefSweepTable,),
+				(self.identify, configKey(config, seed), encodeConfig(config), seed,
+				 result["status"], result["bestFitness"], result["evaluations"], result["steps"],
+				 result["elapsed"], result.get("message")))
+		self.connection.commit()
+
+	def getResults(self):
+		""" Returns the results stored in the database
+
+		:rtype: the list of (config, seed, result) tuples
+
+		"""
+		self.open()
+		cursor = self.connection.execute("""select config, seed, status, bestFitness, evaluations,
+				steps, elapsed, message from %s where identify = ?""" % (Consts.CDefSweepTable,), (self.identify,))
+		results = []
+		for config, seed, status, best, evaluations, steps, elapsed, message in cursor:
+			result = {"status": status, "bestFitness": best, "evaluations": evaluations,
+					  "steps": steps, "elapsed": elapsed, "message": message}
+			results.append((decodeConfig(config), seed, result))
+		return results
+
+	def execute(self, verbose=True):
+		""" Executes the pending runs of the sweep in the process pool
+
+		:param verbose: if True, the progress is printed
+		:rtype: the number of runs executed
+
+		"""
+		pending = self.getPending()
+		total = len(self.getRuns())
+		if verbose:
+			print "Sweep %s: %d runs, %d already completed." % (self.identify, total, total - len(pending))
+		done = 0
+		try:
+			for config, seed, result in executeRuns(self.builder, pending, self.processes,
+										self.memoryLimit, self.timeLimit, self.maxTasks):
+				self.store(config, seed, result)
+				done += 1
+				if verbose:
+					print "[%d/%d] %s seed=%s %s %s" % (done, len(pending), sorted(config.items()),
+													   seed, result["status"], result["message"] or result["bestFitness"])
+		finally:
+			self.close()
+		return done
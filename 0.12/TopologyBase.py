@@ -19,6 +19,21 @@ limitations under the License.
 0.10 2009-04-16 Initial version.
 0.11 2009-05-25 Added get method getStatistics() for support statitiscs reports.
 0.23 2009-09-06 Added support for new API. All redesigned.
+0.24 2026-10-19 Added the evaluation updater slot.
+0.24 2026-10-19 Added the evaluations counter and getSwarmDiameter().
+0.24 2026-10-19 Added the optional diversity statistics.
+0.24 2026-10-19 Added the improvements counter (success rate of the last step).
+0.24 2026-10-19 The global best is tracked as (index, fitness, position snapshot).
+0.24 2026-10-19 The global best snapshot is double-buffered and the statistics are copied in place.
+0.24 2026-10-19 Added the constrained evaluation (repair, feasibility rules and penalties).
+0.24 2026-10-19 Added the boundary_handler slot.
+0.24 2026-10-19 Added the multiObjective flag of the topologies.
+0.24 2026-10-19 The evaluations are counted by the particles (evaluation caches).
+0.24 2026-10-19 Split initialize() in initializeParticles() and initializeBests(), added setFitness() (ask/tell).
+0.24 2026-10-19 The statistics read the positions with getCoordinates() (binary particles).
+0.24 2026-10-19 Added getStatisticsSources(), the statistics computed by the topology.
+0.24 2026-10-19 The diversity statistics read the velocities with getVelocityCoordinates() (mixed particles).
+0.24 2026-10-19 The Constraints module is imported lazily.
 '''
 
 """
@@ -31,11 +46,15 @@ to stablish the information change between the particles.
 """
 
 import Consts
+import Util
 from FunctionSlot import FunctionSlot
 import math 
+from itertools import izip
 from FloatStatistics import TopologyStatistics
 from FloatStatistics import SwarmStatistics
 
+Constraints = Util.LazyModule("Constraints", context=globals())
+
 
 def key_fitness_score(particle):
 	""" A key function to return the fitness score
@@ -137,6 +156,12 @@ class TopologyBase(object):
 	
 	topology.position_updater.set(GlobalTopology.GlobalPositionUpdater)
 	
+	"""
+	evaluation_updater = None
+	""" This is the evaluation topology function slot, it evaluates the particles after
+	the position update. You can change the default updater using the slot *set* function: ::
+	
+	topology.evaluation_updater.set(GlobalTopology.updateParticlesEvaluation)
 	"""
 	information_updater = None
 	""" This is the information update topology function slot, you can change the default
@@ -144,6 +169,16 @@ class TopologyBase(object):
 	
 	topology.information_communicator.set(GlobalTopology.GlobalInformationUpdater)
 	"""
+	multiObjective = False
+	""" True for the topologies whose particles have a fitness vector, see
+	:class:`MultiObjectiveTopology.MultiObjectiveTopology` """
+	
+	boundary_handler = None
+	""" This is the boundary handling function slot, applied to the swarm after the position
+	update and before the evaluation (default is Consts.CDefBoundaryHandler): ::
+	
+	topology.boundary_handler.set(Boundaries.BoundaryReflect)
+	"""
 	
 	
 	def __init__(self,particle):
@@ -158,16 +193,36 @@ class TopologyBase(object):
 		
 		#Best particle inside topology
 		self.bestParticle = None
+		#Global best: index of the best particle, its own best fitness and a
+		#snapshot of its own best position. The snapshot is double-buffered, a new
+		#global best is written on the back buffer which is then swapped
+		self.bestIndex = None
+		self.bestFitness = None
+		self.bestViolation = 0.0
+		self.bestPosition = []
+		self.bestPositionBack = []
+		
+		#Number of evaluations of the objective function
+		self.evaluations = 0
+		#Number of particles which improved its own best on the last step
+		self.improvements = 0
 		
 		self.position_updater = FunctionSlot("Position Particles Updater")
+		self.evaluation_updater = FunctionSlot("Evaluation Particles Updater")
 		self.information_updater = FunctionSlot("Information Particles Updater")
+		self.boundary_handler = FunctionSlot("Boundary Handler")
+		self.boundary_handler.set(Consts.CDefBoundaryHandler)
 
-		self.allSlots = [self.position_updater, self.information_updater]
+		self.allSlots = [self.position_updater, self.boundary_handler, self.evaluation_updater,
+					self.information_updater]
 		
 		#Statistics
 		self.statted = False
 		self.topologyStats = TopologyStatistics()
 		self.swarmStats = SwarmStatistics()
+		#Optional diversity statistics, disabled when None
+		self.diversityStatted = False
+		self.diversityStats = None
 				
 	def setMinimax(self,minimax):
 		""" Sets the swarm minimax
@@ -218,6 +273,41 @@ class TopologyBase(object):
 		self.swarmStats = swarmStats
 	
 		
+	def setDiversityStatistics(self,diversityStats):
+		""" Sets the Diversity Statistics (Swarm diversity info), the diversity statistics
+		are only computed when they are set.
+
+			Example:
+				>>> topology.setDiversityStatistics(FloatStatistics.DiversityStatistics())
+
+			:param diversityStats: the statistics instance class or None to disable them
+
+		"""
+		self.diversityStats = diversityStats
+		self.diversityStatted = False
+	
+	def getStatisticsSources(self):
+		""" Returns the statistics instances computed by :meth:`statistics`, the
+		statistics are read by name from them
+		
+		:rtype: the list of statistics instances
+		
+		"""
+		sources = [self.swarmStats, self.topologyStats]
+		if self.diversityStats is not None:
+			sources.append(self.diversityStats)
+		return sources
+	
+	def getDiversityStatistics(self):
+		""" Returns the Diversity Statistics of the current step, computing them if needed
+		
+		:rtype: the :class:`FloatStatistics.DiversityStatistics` instance or None if disabled
+		
+		"""
+		if self.diversityStats is None: return None
+		self.diversity()
+		return self.diversityStats
+		
 	def __len__(self):
 		""" Return the length of the swarm """
 		return len(self.internalSwarm)
@@ -235,52 +325,166 @@ class TopologyBase(object):
 	def __setitem__(self,key,value):
 		""" Set the particle of swarm """
 		self.internalSwarm[key]  = value
-		self.__clear_flags()
+		self.clear_flags()
 		
 	def clear_flags(self):
 	    self.statted = False
+	    self.diversityStatted = False
         #self.statted = False
         
 	def statistics(self):
 		"""Do the statistical analysis of the swarm and set 'statted' to True """
 		if self.statted: return
-		fit_sum = 0.0
-		swarm_size = len(self.internalSwarm)
-		for index in xrange(swarm_size):
-			fit_sum += self.internalSwarm[index].fitness
-		self.swarmStats["fitMax"] = max(self.internalSwarm,key=key_fitness_score).fitness
-		self.swarmStats["fitMin"] = min(self.internalSwarm,key=key_fitness_score).fitness
-		self.swarmStats["fitAvg"] = fit_sum / float(swarm_size)
+		swarm_size = float(len(self.internalSwarm))
+		fitness = [particle.fitness for particle in self.internalSwarm]
+		self.swarmStats["fitMax"] = max(fitness)
+		self.swarmStats["fitMin"] = min(fitness)
+		self.swarmStats["fitAvg"] = sum(fitness) / swarm_size
         
-		bestFit_sum = 0
-		for index in xrange(swarm_size):
-			bestFit_sum += self.internalSwarm[index].ownBestFitness
-		self.swarmStats["bestFitMin"] = min(self.internalSwarm,key=key_best_fitness_score).ownBestFitness
-		self.swarmStats["bestFitMax"] = max(self.internalSwarm,key=key_best_fitness_score).ownBestFitness
-		self.swarmStats["bestFitAvg"] = bestFit_sum / float(swarm_size)
+		best_fitness = [particle.ownBestFitness for particle in self.internalSwarm]
+		best_avg = sum(best_fitness) / swarm_size
+		self.swarmStats["bestFitMin"] = min(best_fitness)
+		self.swarmStats["bestFitMax"] = max(best_fitness)
+		self.swarmStats["bestFitAvg"] = best_avg
         
-		tmpvar = 0.0
-		for index in xrange(swarm_size):
-			s = self.internalSwarm[index].ownBestFitness - self.swarmStats["bestFitAvg"]
-			s*=s
-			tmpvar += s
-		tmpvar /= float((len(self.internalSwarm)-1))
+		tmpvar = sum([(s - best_avg) * (s - best_avg) for s in best_fitness])
+		tmpvar /= (swarm_size - 1)
 		self.swarmStats["bestFitVar"] = tmpvar
 		self.swarmStats["bestFitDev"] = math.sqrt(tmpvar)
-		self.topologyStats["bestFitness"] = self.bestParticle.ownBestFitness
-		self.topologyStats["bestPosition"] = self.bestParticle.ownBestPosition[:]
-		self.topologyStats["bestPosDim"] = self.bestParticle.ownBestPosition[0]
-		self.topologyStats["position"] = self.bestParticle.position[:]
+		self.topologyStats["bestFitness"] = self.bestFitness
+		best_position = self.bestParticle.getCoordinates(self.bestPosition)
+		self.topologyStats["bestPosition"][:] = best_position
+		self.topologyStats["bestPosDim"] = best_position[0]
+		self.topologyStats["position"][:] = self.bestParticle.getCoordinates()
 		self.topologyStats["fitness"] = self.bestParticle.fitness
+		
+		if self.diversityStats is not None:
+			self.diversity()
         
 		self.statted = True	
 		
+	def diversity(self):
+		""" Do the diversity analysis of the swarm, the positions and velocities are
+		scanned once per dimension (O(n.d)), never pairwise. """
+		if self.diversityStatted: return
+		stats = self.diversityStats
+		swarm_size = float(len(self.internalSwarm))
+		positions = [particle.getCoordinates() for particle in self.internalSwarm]
+		
+		centroid = []
+		spread = []
+		box = 0.0
+		for column in izip(*positions):
+			mean = sum(column) / swarm_size
+			centroid.append(mean)
+			spread.append(math.sqrt(sum([(x - mean) * (x - mean) for x in column]) / swarm_size))
+			extent = max(column) - min(column)
+			box += extent * extent
+		
+		distances = [math.sqrt(sum([(x - c) * (x - c) for x, c in izip(position, centroid)])) for position in positions]
+		speeds = [math.sqrt(sum([v * v for v in particle.getVelocityCoordinates()])) for particle in self.internalSwarm]
+		
+		stats["centroidDist"] = sum(distances) / swarm_size
+		stats["radius"] = max(distances)
+		stats["diameter"] = math.sqrt(box)
+		stats["spreadAvg"] = sum(spread) / len(spread)
+		stats["spreadMin"] = min(spread)
+		stats["spreadMax"] = max(spread)
+		stats["velocityAvg"] = sum(speeds) / swarm_size
+		stats["velocityMax"] = max(speeds)
+		stats.dimSpread = spread
+		
+		self.diversityStatted = True
+		
+	def getSwarmDiameter(self):
+		""" Returns the swarm diameter, measured as the diagonal of the bounding box
+		of the particles positions, which is computed in one O(n.d) pass
+		
+		:rtype: the swarm diameter
+		
+		.. note:: when the diversity statistics are enabled, the diameter is taken from them.
+		
+		"""
+		if self.diversityStats is not None:
+			return self.getDiversityStatistics()["diameter"]
+		total = 0.0
+		for column in izip(*[particle.getCoordinates() for particle in self.internalSwarm]):
+			extent = max(column) - min(column)
+			total += extent * extent
+		return math.sqrt(total)
+	
 	def getBestParticle(self):
 		""" Return the best particle of the swarm
 		:rtype: the particle
 		
+		.. note:: the particle keeps moving, use :meth:`getBestPosition` to read the
+		          global best position.
+		
 		"""
 		return self.bestParticle
+	
+	def getBestIndex(self):
+		""" Return the index of the best particle in the swarm
+		
+		:rtype: the index
+		
+		"""
+		return self.bestIndex
+	
+	def getBestFitness(self):
+		""" Return the global best fitness (own best fitness of the best particle)
+		
+		:rtype: the fitness
+		
+		"""
+		return self.bestFitness
+	
+	def getBestPosition(self):
+		""" Return the snapshot of the global best position, it is only changed
+		when the global best changes
+		
+		:rtype: the position
+		
+		"""
+		return self.bestPosition
+	
+	def updateBestParticle(self):
+		""" Find the best particle of the swarm with a single reduction over the
+		particles own best fitness, the global best position snapshot is only
+		copied when the global best changes. Called once per step by the
+		information updater.
+		"""
+		best_fitness = [particle.ownBestFitness for particle in self.internalSwarm]
+		maximize = self.minimax == Consts.minimaxType["maximize"]
+		if self.isConstrained() and Constraints.isFeasibilityHandling(self.oneSelfParticle):
+			#Feasibility rules: the lowest violation first, then the fitness
+			sign = -1.0 if maximize else 1.0
+			keys = [(particle.ownBestViolation, sign * particle.ownBestFitness) for particle in self.internalSwarm]
+			index = min(xrange(len(keys)), key=keys.__getitem__)
+		elif maximize:
+			index = max(xrange(len(best_fitness)), key=best_fitness.__getitem__)
+		else:
+			index = min(xrange(len(best_fitness)), key=best_fitness.__getitem__)
+		
+		particle = self.internalSwarm[index]
+		self.bestParticle = particle
+		self.bestViolation = particle.ownBestViolation
+		if index != self.bestIndex or best_fitness[index] != self.bestFitness:
+			self.bestIndex = index
+			self.bestFitness = best_fitness[index]
+			self.swapBestPosition(particle)
+	
+	def swapBestPosition(self, particle):
+		""" Copies the best position of the particle on the back buffer of the
+		global best snapshot and swaps the buffers, the previous snapshot is kept
+		untouched until the next change
+		
+		:param particle: the new best particle
+		
+		"""
+		back = particle.copyOwnBestPosition(self.bestPositionBack)
+		self.bestPositionBack = self.bestPosition
+		self.bestPosition = back
 
 
 	def sort(self):
@@ -291,6 +495,8 @@ class TopologyBase(object):
 		if self.sortType == Consts.sortType["fitness"]:
 			self.internalSwarm.sort(cmp=cmp_particle_fitness, reverse=rev)
 
+		self.bestIndex = None
+		self.updateBestParticle()
 		self.sorted = True
 		
 		
@@ -321,6 +527,13 @@ class TopologyBase(object):
 		:param particle: the best particle to set
 		"""
 		self.bestParticle = particle
+		for index in xrange(len(self.internalSwarm)):
+			if self.internalSwarm[index] is particle:
+				self.bestIndex = index
+				break
+		self.bestFitness = particle.ownBestFitness
+		self.bestViolation = particle.ownBestViolation
+		self.swapBestPosition(particle)
 
 
 	def create(self, **args):
@@ -329,6 +542,7 @@ class TopologyBase(object):
 		self.minimax  = args["minimax"]
 		for i in xrange(self.swarmSize):
 			self.internalSwarm.append(self.oneSelfParticle.clone())
+		self.evaluations = 0
 		self.clear_flags()
 	
 	def initialize(self):
@@ -337,24 +551,114 @@ class TopologyBase(object):
 		
 		PS: You can OVERRIDE this method for custom initialization.
 		 """
+		self.initializeParticles()
+		self.evaluations += self.evaluateParticles(rejection=False)
+		self.initializeBests()
+	
+	def initializeParticles(self):
+		""" Initializes the position and the velocity of all particles of the swarm,
+		the particles are not evaluated """
 		for particle in self.internalSwarm:
 			particle.initializePosition()
 			particle.initializeVelocity()
-			particle.evaluate()
+	
+	def initializeBests(self):
+		""" Sets the own bests of the evaluated initial particles and finds the best
+		particle of the swarm """
+		for particle in self.internalSwarm:
 			particle.ownBestFitness = particle.fitness
-			
-		self.bestParticle = self.internalSwarm[0]
+			particle.ownBestViolation = particle.violation
+			particle.ownBestFidelity = particle.fidelity
+			particle.ownBestSamples = particle.samples
+		self.improvements = len(self.internalSwarm)
+		
+		self.bestIndex = None
+		self.updateBestParticle()
 		self.clear_flags()
 	
 	
-	def evaluate(self,*args):
+	def evaluate(self,**args):
 		""" Evaluate all particles in swarm, calls the evaluate() method of particles
 		
 		:param args: this param are passed to the evaluation function
 		
 		"""
-		for particle in self.internalSwarm:
-			particle.evaluate(**args)
+		self.evaluations += self.evaluateParticles(**args)
+		self.clear_flags()
+	
+	def isConstrained(self):
+		""" Returns True if the particles of the swarm have constraints """
+		return not self.oneSelfParticle.constraints.isEmpty()
+	
+	def evaluateParticles(self, rejection=True, **args):
+		""" Evaluates all the particles of the swarm and returns the number of
+		calls of the evaluation function.
+		
+		When the particles have constraints, the constraints of all the particles
+		are evaluated first, the infeasible particles are repaired (if the particles
+		have a repairer) and then the objective is evaluated. With the feasibility
+		rules, an infeasible particle whose violation is not lower than the violation
+		of its own best can not improve, so it is rejected (*rejected* attribute)
+		without calling the evaluation function and keeps its previous fitness. With
+		the penalty handling, the fitness is penalized by the violation.
+		
+		:param rejection: if False, all the particles are evaluated
+		:param args: this param are passed to the evaluation function
+		:rtype: the number of evaluations
+		
+		"""
+		swarm = self.internalSwarm
+		evaluations = 0
+		if not self.isConstrained():
+			for particle in swarm:
+				evaluations += particle.evaluate(**args)
+			return evaluations
+		
+		repair = not self.oneSelfParticle.repairer.isEmpty()
+		for particle in swarm:
+			if particle.evaluateConstraints(**args) > 0.0 and repair:
+				particle.repair(**args)
+				particle.evaluateConstraints(**args)
+		
+		feasibility = Constraints.isFeasibilityHandling(self.oneSelfParticle)
+		rejection = rejection and feasibility
+		for particle in swarm:
+			violation = particle.violation
+			if rejection and violation > 0.0 and violation >= particle.ownBestViolation:
+				particle.rejected = True
+				continue
+			particle.rejected = False
+			evaluations += particle.evaluate(**args)
+			if not feasibility:
+				particle.penalize(self.minimax)
+		return evaluations
+	
+	def setFitness(self, fitness):
+		""" Sets the fitness of the particles of the swarm computed outside of the
+		PSO Engine (see :meth:`Pso.SimplePSO.tell`), the evaluations counter is
+		updated. The constraints of the particles are evaluated, but no particle is
+		rejected since all of them were evaluated.
+		
+		:param fitness: the sequence of fitness, in the order of the swarm, a
+		                fitness can be a sequence (one value per objective)
+		
+		"""
+		swarm = self.internalSwarm
+		if len(fitness) != len(swarm):
+			Util.raiseException("%d fitness values were told for a swarm of %d particles" % (len(fitness), len(swarm)), ValueError)
+		constrained = self.isConstrained()
+		feasibility = constrained and Constraints.isFeasibilityHandling(self.oneSelfParticle)
+		for particle, value in izip(swarm, fitness):
+			if hasattr(value, "__len__"):
+				particle.fitness = tuple([float(x) for x in value])
+			else:
+				particle.fitness = float(value)
+			particle.rejected = False
+			if constrained:
+				particle.evaluateConstraints()
+				if not feasibility:
+					particle.penalize(self.minimax)
+		self.evaluations += len(swarm)
 		self.clear_flags()
 		
 
@@ -376,10 +680,13 @@ class TopologyBase(object):
 	def getStatistics(self):
 		""" Return a Statistics classes for statistics
         
-        :rtype: the  subclasses of :class: `Statistics.Statistics`  (topology,swarm) instances 
+        :rtype: the  subclasses of :class: `Statistics.Statistics`  (topology,swarm) instances,
+                (topology,swarm,diversity) when the diversity statistics are enabled
         
 		"""
 		self.statistics()	
 		self.clear_flags()
+		if self.diversityStats is not None:
+			return (self.topologyStats, self.swarmStats, self.diversityStats)
 		return (self.topologyStats, self.swarmStats)     
     
\ No newline at end of file
@@ -18,6 +18,9 @@ limitations under the License.
 
 0.10 2009-04-16 Initial version.
 0.23 2009-09-30 Changed for support generic pso and docs.
+0.24 2026-10-19 Added the LazyModule class for the optional dependencies.
+0.24 2026-10-19 LazyModule imports the modules of the package relative to the importing module.
+0.24 2026-10-19 Added velocityRange(), the default velocity limits of all the engines.
 '''
 
 """
@@ -30,6 +33,8 @@ use, like list item swap, random utilities and etc.
 
 """
 
+import sys
+
 def raiseException(message, expt=None):
 	"""
 	Raise an exception
@@ -46,3 +51,88 @@ def raiseException(message, expt=None):
 	else:
 		raise expt, message
 
+def velocityRange(owner, width):
+	"""
+	Returns the velocity limits, the *rangeVelmin* and *rangeVelmax* params of the
+	owner, the default limits are -/+ the width times the *velocityFraction* param
+	(default is Consts.CDefVelocityFraction). It is used by the particles and by the
+	engines which move their own positions, so they share the same defaults.
+	Example:
+		>>> vel_min, vel_max = Util.velocityRange(particle, pos_max - pos_min)
+	
+	:param owner: the object of the params, a particle or an engine (getParam method)
+	:param width: the width of the search space, the number of options of a categorical dimmension
+	:rtype: the tuple (minimum, maximum)
+	
+	"""
+	#Consts imports the modules which import Util
+	import Consts
+	width = width * owner.getParam("velocityFraction", Consts.CDefVelocityFraction)
+	return owner.getParam("rangeVelmin", -width), owner.getParam("rangeVelmax", width)
+
+
+class LazyModule(object):
+	""" LazyModule Class - A module proxy which imports the module only on the first
+	attribute access, used for the heavy optional dependencies (sqlite3, matplotlib, numpy)
+	and for the pypso modules of the optional features
+	
+	Example:
+		>>> sqlite3 = Util.LazyModule("sqlite3")
+		>>> sqlite3.isLoaded()
+		False
+		>>> conn = sqlite3.connect("simulation.db")
+		>>> sqlite3.isLoaded()
+		True
+	
+	:param name: the module name, dotted names are accepted
+	:param message: if not None, the message of the ImportError raised when
+	                the module can't be imported
+	:param context: the globals() of the importing module, a module of the same
+	                package is imported like the *import* statement would do
+	
+	"""
+	
+	def __init__(self, name, message=None, context=None):
+		""" The LazyModule Class Creator """
+		self.__name = name
+		self.__message = message
+		self.__context = context
+		self.__module = None
+	
+	def load(self):
+		""" Imports the module, if it was not imported yet
+		
+		:rtype: the module
+		
+		"""
+		if self.__module is None:
+			try:
+				module = __import__(self.__name, self.__context)
+				for name in self.__name.split(".")[1:]:
+					module = getattr(module, name)
+				self.__module = module
+			except ImportError:
+				if self.__message is None: raise
+				raiseException(self.__message, ImportError)
+		return self.__module
+	
+	def isLoaded(self):
+		""" Returns True if the module was already imported """
+		return self.__module is not None
+	
+	def isAvailable(self):
+		""" Returns True if the module can be imported, the module is imported by this call """
+		try:
+			self.load()
+		except ImportError:
+			return False
+		return True
+	
+	def __getattr__(self, attr):
+		""" Imports the module and returns its attribute """
+		return getattr(self.load(), attr)
+	
+	def __repr__(self):
+		""" The string representation of the lazy module """
+		state = "loaded" if self.isLoaded() else "not loaded"
+		return "<lazy module '%s' (%s)>" % (self.__name, state)
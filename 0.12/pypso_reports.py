@@ -17,6 +17,8 @@ See the License for the specific language governing permissions and
 limitations under the License.
 
 0.10 2009-05-29 Initial version.
+0.11 2026-10-19 Reportlab is imported only after the command line is validated.
+0.11 2026-10-19 Reportlab is imported by the report functions, so they work when the module is imported.
 
     This code is part of Pypso.
     Require matplotlib v.0.98.5.0+
@@ -25,11 +27,6 @@ limitations under the License.
 '''
 
 from optparse import OptionParser
-from reportlab.platypus import *
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.rl_config import defaultPageSize
-from reportlab.lib.units import inch
-from reportlab.lib import colors
 
 
 TOP = {
@@ -49,7 +46,11 @@ def parse(line_record, field):
 #@param all: All fetch data
 #@param filesave: The output filename
 def individual_report(all, filesave):
-        
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, LongTable
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.rl_config import defaultPageSize
+    from reportlab.lib import colors
+    
     PAGE_HEIGHT = defaultPageSize[1]
     styles = getSampleStyleSheet()
     
@@ -104,6 +105,11 @@ def group_report(all, filesave):
         print "\ERROR: cannot import Numpy ! Group Report is not available !"
         exit()
     
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, LongTable
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.rl_config import defaultPageSize
+    from reportlab.lib import colors
+    
     PAGE_HEIGHT = defaultPageSize[1]
     styles = getSampleStyleSheet()
     
@@ -0,0 +1,134 @@
+"""
+Tests of the :mod:`Archive` and :mod:`MultiObjectiveTopology` modules
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy
+import Archive
+import Consts
+import Constraints
+import MultiObjectiveTopology
+import Particle1D
+import ParticleBinary
+import Pso
+
+MINIMIZE = Consts.minimaxType["minimize"]
+MAXIMIZE = Consts.minimaxType["maximize"]
+
+
+def quadratic_objectives(particle):
+	x, y = particle.position
+	return (x * x + y * y, (x - 2.0) * (x - 2.0) + y * y)
+
+def binary_objectives(particle):
+	bits = particle.getBits().astype(numpy.float64)
+	weights = numpy.arange(1.0, len(bits) + 1.0)
+	return (float((bits * weights).sum()), float(((1.0 - bits) * weights[::-1]).sum()))
+
+
+class ParetoArchiveTestCase(unittest.TestCase):
+
+	def test_dominates(self):
+		self.assertTrue(Archive.dominates((1.0, 2.0), (1.0, 3.0), MINIMIZE))
+		self.assertFalse(Archive.dominates((1.0, 3.0), (1.0, 3.0), MINIMIZE))
+		self.assertFalse(Archive.dominates((0.0, 4.0), (1.0, 3.0), MINIMIZE))
+		self.assertTrue(Archive.dominates((1.0, 3.0), (1.0, 2.0), MAXIMIZE))
+
+	def test_constrained_dominates(self):
+		self.assertTrue(Archive.constrainedDominates((5.0, 5.0), 0.0, (1.0, 1.0), 0.1, MINIMIZE))
+		self.assertTrue(Archive.constrainedDominates((5.0, 5.0), 0.1, (1.0, 1.0), 0.2, MINIMIZE))
+		self.assertFalse(Archive.constrainedDominates((1.0, 1.0), 0.2, (5.0, 5.0), 0.2, MINIMIZE))
+		self.assertTrue(Archive.constrainedDominates((1.0, 1.0), 0.0, (5.0, 5.0), 0.0, MINIMIZE))
+
+	def test_insert_compares_the_violations_first(self):
+		archive = Archive.ParetoArchive(size=10)
+		self.assertTrue(archive.insert((1.0, 1.0), [1.0], 0.5))
+		self.assertFalse(archive.insert((0.0, 0.0), [0.0], 0.5))
+		self.assertTrue(archive.insert((2.0, 2.0), [2.0], 0.1))
+		self.assertEqual(archive.getFront(), [((2.0, 2.0), [2.0])])
+		self.assertTrue(archive.insert((5.0, 3.0), [5.0]))
+		self.assertTrue(archive.insert((3.0, 5.0), [3.0]))
+		self.assertFalse(archive.insert((0.0, 0.0), [0.0], 0.01))
+		self.assertEqual(archive.violation, 0.0)
+		self.assertEqual(sorted([fitness for fitness, position in archive]), [(3.0, 5.0), (5.0, 3.0)])
+
+	def test_insert_keeps_the_non_dominated_front(self):
+		for objectives in (2, 3):
+			archive = Archive.ParetoArchive(size=10)
+			pad = (0.0,) * (objectives - 2)
+			self.assertTrue(archive.insert((1.0, 5.0) + pad, [1.0]))
+			self.assertTrue(archive.insert((3.0, 2.0) + pad, [3.0]))
+			self.assertFalse(archive.insert((4.0, 6.0) + pad, [4.0]))
+			self.assertTrue(archive.insert((2.0, 1.0) + pad, [2.0]))
+			self.assertEqual(sorted([fitness for fitness, position in archive]),
+							[(1.0, 5.0) + pad, (2.0, 1.0) + pad])
+
+	def test_prune_removes_the_most_crowded(self):
+		archive = Archive.ParetoArchive(size=3)
+		for x in (0.0, 1.0, 1.1, 4.0):
+			archive.insert((x, 10.0 - x), [x])
+		archive.prune()
+		self.assertEqual(len(archive), 3)
+		self.assertEqual(archive.pruned, 1)
+		self.assertEqual(sorted([position[0] for fitness, position in archive])[::2], [0.0, 4.0])
+
+	def test_positions_are_copied(self):
+		position = numpy.array([1, 2], dtype=numpy.uint8)
+		blocks = (numpy.zeros(2), numpy.zeros(1, dtype=numpy.int64))
+		archive = Archive.ParetoArchive()
+		archive.insert((1.0, 2.0), position)
+		archive.insert((2.0, 1.0), blocks)
+		position[:] = 0
+		blocks[0][:] = 1.0
+		front = dict(archive.getFront())
+		self.assertEqual(list(front[(1.0, 2.0)]), [1, 2])
+		self.assertEqual(list(front[(2.0, 1.0)][0]), [0.0, 0.0])
+
+
+class MultiObjectiveTopologyTestCase(unittest.TestCase):
+
+	def test_binary_archive_reproduces_its_fitness(self):
+		particle = ParticleBinary.ParticleBinary(12)
+		particle.evaluator.set(binary_objectives)
+		topology = MultiObjectiveTopology.MultiObjectiveTopology(particle, archive_size=20)
+		pso_engine = Pso.SimplePSO(topology, seed=7, interactiveMode=False)
+		pso_engine.setSwarmSize(10)
+		pso_engine.setTimeSteps(30)
+		for snapshot in pso_engine.iterate(stats=("size",)):
+			pass
+		self.assertTrue(len(topology.getArchive()) > 1)
+		probe = particle.clone()
+		for fitness, position in topology.getArchive():
+			probe.getPosition()[:] = position
+			probe.evaluate()
+			self.assertEqual(probe.getFitness(), fitness)
+
+	def test_constrained_front_is_feasible(self):
+		#The constraint x >= 1 cuts the front 0 <= x <= 2 in half
+		particle = Particle1D.Particle1D(2)
+		particle.evaluator.set(quadratic_objectives)
+		particle.constraints.add(Constraints.Inequality(lambda p: 1.0 - p.position[0]))
+		particle.setParams(rangePosmin=-5.0, rangePosmax=5.0,
+							constraintHandling=Consts.constraintHandling["feasibility"])
+		topology = MultiObjectiveTopology.MultiObjectiveTopology(particle, archive_size=20)
+		pso_engine = Pso.SimplePSO(topology, seed=3, interactiveMode=False)
+		pso_engine.setSwarmSize(20)
+		pso_engine.setTimeSteps(40)
+		pso_engine.initializeSwarm()
+		while not pso_engine.constructSolution():
+			pass
+		archive = topology.getArchive()
+		self.assertEqual(archive.violation, 0.0)
+		self.assertTrue(len(archive) > 5)
+		for fitness, position in archive:
+			self.assertTrue(position[0] >= 1.0)
+		self.assertEqual(topology.bestParticle.ownBestViolation, 0.0)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,104 @@
+"""
+Tests of the :mod:`Boundaries` module and of the velocity limits of the 1D List particles
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Boundaries
+import Consts
+import Cooperative
+import Ensemble
+import GlobalTopology
+import Particle1D
+import Pso
+
+
+def sphere(particle):
+	return sum([x * x for x in particle.position])
+
+
+class BoundariesTestCase(unittest.TestCase):
+
+	def setUp(self):
+		particle = Particle1D.Particle1D(3)
+		particle.evaluator.set(sphere)
+		particle.setParams(rangePosmin=-1.0, rangePosmax=1.0)
+		self.pso_engine = Pso.SimplePSO(GlobalTopology.GlobalTopology(particle), seed=1, interactiveMode=False)
+		self.pso_engine.setSwarmSize(2)
+		self.pso_engine.initializeSwarm()
+		self.inside, self.outside = self.pso_engine.getTopology().internalSwarm
+
+	def move(self, handler):
+		self.inside.position[:] = [0.5, -0.5, 0.0]
+		self.inside.velocity[:] = [0.3, 0.3, 0.3]
+		self.outside.position[:] = [1.5, -1.25, 0.25]
+		self.outside.velocity[:] = [1.0, -0.5, 0.25]
+		handler(self.pso_engine)
+		self.assertEqual(self.inside.position, [0.5, -0.5, 0.0])
+		self.assertEqual(self.inside.velocity, [0.3, 0.3, 0.3])
+		for x in self.outside.position:
+			self.assertTrue(-1.0 <= x <= 1.0)
+		return self.outside.position, self.outside.velocity
+
+	def test_clamp_reverse(self):
+		self.assertEqual(self.move(Boundaries.BoundaryClampReverse), ([1.0, -1.0, 0.25], [-1.0, 0.5, 0.25]))
+
+	def test_absorb(self):
+		self.assertEqual(self.move(Boundaries.BoundaryAbsorb), ([1.0, -1.0, 0.25], [0.0, 0.0, 0.25]))
+
+	def test_reflect(self):
+		self.assertEqual(self.move(Boundaries.BoundaryReflect), ([0.5, -0.75, 0.25], [-1.0, 0.5, 0.25]))
+
+	def test_periodic(self):
+		self.assertEqual(self.move(Boundaries.BoundaryPeriodic), ([-0.5, 0.75, 0.25], [1.0, -0.5, 0.25]))
+
+	def test_random(self):
+		position, velocity = self.move(Boundaries.BoundaryRandom)
+		self.assertEqual(position[2], 0.25)
+		self.assertEqual(velocity, [1.0, -0.5, 0.25])
+
+	def test_hyperbolic(self):
+		position, velocity = self.move(Boundaries.BoundaryHyperbolic)
+		self.assertTrue(0.5 < position[0] < 1.0)
+		self.assertTrue(-1.0 < position[1] < -0.75)
+		self.assertEqual(position[2], 0.25)
+
+
+class VelocityRangeTestCase(unittest.TestCase):
+
+	def test_default_velocity_range_is_symmetric(self):
+		particle = Particle1D.Particle1D(2)
+		particle.setParams(rangePosmin=-5.0, rangePosmax=5.0)
+		self.assertEqual(particle.getVelocityRange(), (-5.0, 5.0))
+		particle.setParams(rangeVelmin=-1.0, rangeVelmax=2.0)
+		self.assertEqual(particle.getVelocityRange(), (-1.0, 2.0))
+
+	def test_engines_share_the_default_fraction(self):
+		engines = [Particle1D.Particle1D(2), Ensemble.EnsemblePSO(2, 2), Cooperative.CooperativePSO(2)]
+		for engine in engines:
+			engine.setParams(rangePosmin=-5.0, rangePosmax=5.0)
+			self.assertEqual(engine.getVelocityRange(), (-5.0, 5.0))
+			engine.setParams(velocityFraction=0.1)
+			self.assertEqual(engine.getVelocityRange(), (-1.0, 1.0))
+
+	def test_default_limits_converge(self):
+		for pso_type in ("BASIC", "INERTIA", "CONSTRICTED"):
+			particle = Particle1D.Particle1D(5)
+			particle.evaluator.set(sphere)
+			particle.setParams(rangePosmin=-5.0, rangePosmax=5.0)
+			pso_engine = Pso.SimplePSO(GlobalTopology.GlobalTopology(particle), seed=3, interactiveMode=False)
+			pso_engine.setSwarmSize(20)
+			pso_engine.setTimeSteps(200)
+			pso_engine.setPsoType(Consts.psoType[pso_type])
+			for snapshot in pso_engine.iterate():
+				pass
+			self.assertTrue(snapshot.bestFitness < 1.0, pso_type)
+			self.assertTrue(min([min(p.velocity) for p in pso_engine.getTopology()]) < 0.0)
+
+
+if __name__ == "__main__":
+	unittest.main()
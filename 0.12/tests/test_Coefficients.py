@@ -0,0 +1,85 @@
+"""
+Tests of the :mod:`Coefficients` module
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Coefficients
+import Consts
+import GlobalTopology
+import Particle1D
+import Pso
+
+
+def create_engine(pso_type, steps=10):
+	particle = Particle1D.Particle1D(2)
+	particle.evaluator.set(lambda p: sum([x * x for x in p.position]))
+	pso_engine = Pso.SimplePSO(GlobalTopology.GlobalTopology(particle), seed=7, interactiveMode=False)
+	pso_engine.setPsoType(Consts.psoType[pso_type])
+	pso_engine.setTimeSteps(steps)
+	return pso_engine
+
+
+class ConstrictionFactorTestCase(unittest.TestCase):
+
+	def test_clerc_kennedy_value(self):
+		self.assertAlmostEqual(Coefficients.constrictionFactor(2.05, 2.05), 0.729843788, 8)
+
+	def test_requires_fi_above_four(self):
+		self.assertRaises(ValueError, Coefficients.constrictionFactor, 2.0, 2.0)
+
+
+class CoefficientScheduleTestCase(unittest.TestCase):
+
+	def test_products_of_each_type(self):
+		schedule = Coefficients.CoefficientSchedule()
+		pso_engine = create_engine("CONSTRICTED")
+		pso_engine.setCoefficients(2.05, 2.05)
+		schedule.update(pso_engine)
+		self.assertAlmostEqual(schedule.inertiaWeight, 0.729843788, 8)
+		self.assertAlmostEqual(schedule.cognitive, 0.729843788 * 2.05, 8)
+		self.assertEqual(schedule.social, schedule.cognitive)
+
+		pso_engine = create_engine("BASIC")
+		pso_engine.setCoefficients(1.5, 2.5)
+		schedule.update(pso_engine)
+		self.assertEqual((schedule.inertiaWeight, schedule.cognitive, schedule.social), (1.0, 1.5, 2.5))
+
+		pso_engine = create_engine("INERTIA")
+		pso_engine.setParams(inertiaMax=0.9, inertiaMin=0.4)
+		pso_engine.currentStep = 5
+		schedule.update(pso_engine)
+		self.assertAlmostEqual(schedule.inertiaWeight, 0.65)
+		self.assertEqual(schedule.chi, 1.0)
+
+	def test_time_varying_coefficients(self):
+		schedule = Coefficients.CoefficientSchedule()
+		schedule.setTimeVarying(0.5, 2.5)
+		pso_engine = create_engine("BASIC", steps=10)
+		pso_engine.setCoefficients(2.5, 0.5)
+		coefficients = []
+		for step in (0, 5, 10):
+			pso_engine.currentStep = step
+			schedule.update(pso_engine)
+			coefficients.append((schedule.C1, schedule.C2))
+		self.assertEqual(coefficients, [(2.5, 0.5), (1.5, 1.5), (0.5, 2.5)])
+
+	def test_constriction_is_cached(self):
+		schedule = Coefficients.CoefficientSchedule()
+		pso_engine = create_engine("CONSTRICTED")
+		pso_engine.setCoefficients(2.05, 2.05)
+		schedule.update(pso_engine)
+		schedule.chi = 0.5
+		schedule.update(pso_engine)
+		self.assertEqual(schedule.chi, 0.5)
+		pso_engine.setCoefficients(2.1, 2.1)
+		schedule.update(pso_engine)
+		self.assertAlmostEqual(schedule.chi, Coefficients.constrictionFactor(2.1, 2.1))
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,89 @@
+"""
+Tests of the :mod:`Constraints` module
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Consts
+import Constraints
+import GlobalTopology
+import Particle1D
+import Pso
+
+
+def sphere(particle):
+	return sum([x * x for x in particle.position])
+
+def at_least_one(particle):
+	""" x0 >= 1 """
+	return 1.0 - particle.position[0]
+
+def create_particle(handling):
+	particle = Particle1D.Particle1D(2)
+	particle.evaluator.set(sphere)
+	particle.constraints.add(Constraints.Inequality(at_least_one))
+	particle.setParams(rangePosmin=-5.0, rangePosmax=5.0, constraintHandling=Consts.constraintHandling[handling])
+	return particle
+
+
+class ConstraintFunctionsTestCase(unittest.TestCase):
+
+	def test_violations(self):
+		particle = create_particle("penalty")
+		particle.position[:] = [0.25, 0.0]
+		self.assertEqual(Constraints.Inequality(at_least_one)(particle), 0.75)
+		self.assertEqual(Constraints.Equality(at_least_one, tolerance=0.5)(particle), 0.25)
+		particle.position[:] = [3.0, 0.0]
+		self.assertEqual(Constraints.Inequality(at_least_one)(particle), 0.0)
+		self.assertEqual(Constraints.Equality(at_least_one, tolerance=0.5)(particle), 1.5)
+		self.assertEqual(particle.evaluateConstraints(), 0.0)
+		self.assertTrue(particle.isFeasible())
+
+	def test_feasibility_rules(self):
+		minimize, maximize = Consts.minimaxType["minimize"], Consts.minimaxType["maximize"]
+		self.assertTrue(Constraints.isBetter(9.0, 0.0, 1.0, 0.1, minimize))
+		self.assertTrue(Constraints.isBetter(9.0, 0.1, 1.0, 0.2, minimize))
+		self.assertTrue(Constraints.isBetter(1.0, 0.0, 2.0, 0.0, minimize))
+		self.assertFalse(Constraints.isBetter(1.0, 0.0, 2.0, 0.0, maximize))
+
+	def test_repair_bisection(self):
+		particle = create_particle("feasibility")
+		particle.setOwnBestPosition([2.0, 2.0])
+		particle.ownBestViolation = 0.0
+		particle.position[:] = [-2.0, 0.0]
+		particle.evaluateConstraints()
+		Constraints.RepairBisection(particle)
+		self.assertEqual(particle.evaluateConstraints(), 0.0)
+		#The nearest feasible point of the segment is (1, 1.5)
+		self.assertTrue(1.0 <= particle.position[0] < 1.0 + 4.0 / 2 ** Consts.CDefRepairSteps)
+		self.assertAlmostEqual(particle.position[1], 2.0 - (2.0 - particle.position[0]) * 0.5)
+
+
+class ConstrainedEngineTestCase(unittest.TestCase):
+
+	def run_engine(self, handling, repairer=None):
+		particle = create_particle(handling)
+		if repairer is not None:
+			particle.repairer.set(repairer)
+		pso_engine = Pso.SimplePSO(GlobalTopology.GlobalTopology(particle), seed=11, interactiveMode=False)
+		pso_engine.setPsoType(Consts.psoType["CONSTRICTED"])
+		pso_engine.setSwarmSize(20)
+		pso_engine.setTimeSteps(200)
+		list(pso_engine.iterate())
+		return pso_engine.bestParticle()
+
+	def test_the_constrained_optimum_is_found(self):
+		for handling in ("penalty", "feasibility"):
+			for repairer in (None, Constraints.RepairBisection):
+				best = self.run_engine(handling, repairer)
+				self.assertEqual(best.ownBestViolation, 0.0)
+				self.assertTrue(best.getOwnBestPosition()[0] >= 1.0)
+				self.assertAlmostEqual(best.ownBestFitness, 1.0, 4)
+
+
+if __name__ == "__main__":
+	unittest.main()
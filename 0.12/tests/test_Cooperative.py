@@ -0,0 +1,107 @@
+"""
+Tests of the :mod:`Cooperative` module
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy
+import Consts
+import Cooperative
+
+
+def sphere(positions):
+	return (positions ** 2).sum(axis=1)
+
+def sphere_term(blocks, indices):
+	return (blocks ** 2).sum(axis=1)
+
+def coupled(positions):
+	""" The dimmensions 0 and 3 interact """
+	return sphere(positions) + positions[:, 0] * positions[:, 3]
+
+def create_engine(dimmensions, objective=sphere, steps=60, group_size=5):
+	coop = Cooperative.CooperativePSO(dimmensions, seed=2)
+	coop.evaluator.set(objective)
+	coop.setPsoType(Consts.psoType["CONSTRICTED"])
+	coop.setCoefficients(2.05, 2.05)
+	coop.setParams(rangePosmin=-5.0, rangePosmax=5.0, groupSize=group_size)
+	coop.setSwarmSize(10)
+	coop.setTimeSteps(steps)
+	return coop
+
+
+class GroupingTestCase(unittest.TestCase):
+
+	def test_static_and_random_groups(self):
+		coop = create_engine(12)
+		groups = Cooperative.StaticGrouping(coop)
+		self.assertEqual([list(group) for group in groups], [range(0, 5), range(5, 10), [10, 11]])
+		coop.groups = groups
+		self.assertTrue(Cooperative.StaticGrouping(coop) is None)
+		groups = Cooperative.RandomGrouping(coop)
+		self.assertEqual([len(group) for group in groups], [5, 5, 2])
+		self.assertEqual(sorted(numpy.concatenate(groups)), range(12))
+
+	def test_groups_must_cover_the_dimmensions(self):
+		coop = create_engine(4)
+		coop.initialize()
+		self.assertRaises(ValueError, coop.regroup, [numpy.array([0, 1]), numpy.array([3])])
+
+	def test_differential_grouping(self):
+		coop = create_engine(6, objective=coupled, group_size=2)
+		coop.initialize()
+		groups = Cooperative.DifferentialGrouping(coop)
+		self.assertEqual([list(group) for group in groups], [[0, 3], [1, 2], [4, 5]])
+		#The swarm, the lower and moved positions, then the rows of 0, 1, 2, 4 and 5
+		self.assertEqual(coop.getEvaluations(), 10 + 1 + 6 + (1 + 5) + (1 + 3) + (1 + 2) + (1 + 1) + 1)
+
+
+class CooperativePSOTestCase(unittest.TestCase):
+
+	def test_full_context_evaluations(self):
+		coop = create_engine(20, objective=coupled, steps=100)
+		coop.execute()
+		self.assertEqual(coop.getBlockEvaluations(), 0)
+		self.assertAlmostEqual(coop.getBestFitness(), coupled(coop.getBestPosition()[numpy.newaxis, :])[0])
+		self.assertTrue(coop.getBestFitness() < 1e-3)
+
+	def test_cached_block_terms(self):
+		coop = create_engine(200, steps=500, group_size=20)
+		coop.blockTerm.set(sphere_term)
+		coop.execute()
+		self.assertEqual(coop.getEvaluations(), 10)
+		#The context terms, the own best scores, then every cycle moves the 10 sub-swarms
+		self.assertEqual(coop.getBlockEvaluations(), 10 + 10 * 10 + 500 * 10 * 10)
+		self.assertAlmostEqual(coop.getBestFitness(), sphere(coop.getBestPosition()[numpy.newaxis, :])[0])
+		self.assertTrue(coop.getBestFitness() < 1e-2)
+
+	def test_regrouping_cost(self):
+		#With a constant context, the random groups are scored again every cycle,
+		#the static groups and the same groups given again only once
+		flat = lambda positions: numpy.ones(len(positions))
+		coop = create_engine(12, objective=flat, steps=3, group_size=4)
+		coop.grouping.set(Cooperative.RandomGrouping)
+		coop.execute()
+		self.assertEqual(coop.getEvaluations(), 10 + 3 * 3 * (10 + 10))
+		static = create_engine(12, objective=flat, steps=3, group_size=4)
+		static.execute()
+		self.assertEqual(static.getEvaluations(), 10 + 3 * 10 + 3 * 3 * 10)
+		same = create_engine(12, objective=flat, steps=3, group_size=4)
+		same.grouping.set(lambda coop: [numpy.arange(start, start + 4) for start in (8, 0, 4)])
+		same.execute()
+		self.assertEqual(same.getEvaluations(), static.getEvaluations())
+
+	def test_stagnation_criteria(self):
+		coop = create_engine(4, objective=lambda positions: numpy.ones(len(positions)), steps=100)
+		coop.setParams(stagnationSteps=5)
+		coop.terminationCriteria.set(Cooperative.CooperativeStagnationCriteria)
+		coop.execute()
+		self.assertEqual(coop.currentStep, 5)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,103 @@
+"""
+Tests of the :mod:`Ensemble` module
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy
+import Consts
+import Ensemble
+
+
+def sphere(positions):
+	return (positions ** 2).sum(axis=2)
+
+def create_ensemble(runs=8, steps=150, seed=3, seeds=None):
+	ensemble = Ensemble.EnsemblePSO(runs, 5, seed=seed, seeds=seeds)
+	ensemble.evaluator.set(sphere)
+	ensemble.setPsoType(Consts.psoType["CONSTRICTED"])
+	ensemble.setCoefficients(2.05, 2.05)
+	ensemble.setParams(rangePosmin=-5.0, rangePosmax=5.0)
+	ensemble.setSwarmSize(10)
+	ensemble.setTimeSteps(steps)
+	return ensemble
+
+
+class EnsemblePSOTestCase(unittest.TestCase):
+
+	def test_every_run_converges(self):
+		ensemble = create_ensemble()
+		ensemble.execute()
+		self.assertEqual(ensemble.getBestFitness().shape, (8,))
+		self.assertTrue((ensemble.getBestFitness() < 1e-4).all())
+		self.assertTrue(numpy.allclose(sphere(ensemble.getBestPosition()[:, numpy.newaxis, :])[:, 0], ensemble.getBestFitness()))
+		self.assertTrue((ensemble.getEvaluations() == 10 * 151).all())
+		self.assertTrue((ensemble.getStoppedStep() == 150).all())
+		self.assertTrue((numpy.abs(ensemble.position) <= 5.0).all())
+
+	def test_runs_are_independent_and_seeded(self):
+		first, second = create_ensemble(runs=4, steps=20), create_ensemble(runs=4, steps=20)
+		first.execute()
+		second.execute()
+		self.assertTrue(numpy.array_equal(first.getBestFitness(), second.getBestFitness()))
+		self.assertEqual(len(set(first.getBestFitness())), 4)
+		self.assertEqual(first.getSeeds(), second.getSeeds())
+		self.assertEqual(len(set(first.getSeeds())), 4)
+
+	def test_run_reproduced_from_its_seed(self):
+		ensemble = create_ensemble(runs=3, steps=30, seeds=[5, 6, 7])
+		ensemble.setParams(bestFitness=1.0)
+		ensemble.terminationCriteria.set(Ensemble.EnsembleFitnessCriteria)
+		ensemble.execute()
+		self.assertEqual(ensemble.getSeeds(), [5, 6, 7])
+		for run, seed in enumerate(ensemble.getSeeds()):
+			single = create_ensemble(runs=1, steps=30, seeds=[seed])
+			single.setParams(bestFitness=1.0)
+			single.terminationCriteria.set(Ensemble.EnsembleFitnessCriteria)
+			single.execute()
+			self.assertEqual(single.getBestFitness()[0], ensemble.getBestFitness()[run])
+			self.assertEqual(single.getStoppedStep()[0], ensemble.getStoppedStep()[run])
+		self.assertRaises(ValueError, Ensemble.EnsemblePSO, 3, 5, seeds=[1, 2])
+
+	def test_stopped_runs_are_frozen(self):
+		ensemble = create_ensemble(steps=300)
+		ensemble.setParams(bestFitness=1e-3)
+		ensemble.terminationCriteria.set(Ensemble.EnsembleFitnessCriteria)
+		shapes = []
+		ensemble.evaluator.add(lambda positions: shapes.append(positions.shape[0]) or 0.0)
+		ensemble.initialize()
+		frozen = {}
+		while not ensemble.constructSolution():
+			for run in numpy.flatnonzero(~ensemble.getActiveRuns()):
+				if run not in frozen:
+					frozen[run] = (ensemble.position[run].copy(), ensemble.getBestFitness()[run])
+		stopped = ensemble.getStoppedStep()
+		self.assertTrue(len(set(stopped)) > 1)
+		self.assertTrue((ensemble.getBestFitness() <= 1e-3).all())
+		self.assertTrue((ensemble.getEvaluations() == 10 * (stopped + 1)).all())
+		self.assertEqual(shapes[1:], [int((stopped >= step).sum()) for step in xrange(1, stopped.max() + 1)])
+		for run, (position, fitness) in frozen.items():
+			self.assertTrue(numpy.array_equal(ensemble.position[run], position))
+			self.assertEqual(ensemble.getBestFitness()[run], fitness)
+
+	def test_stagnation_criteria(self):
+		ensemble = create_ensemble(runs=3, steps=100)
+		ensemble.evaluator.set(lambda positions: numpy.ones(positions.shape[:2]))
+		ensemble.setParams(stagnationSteps=7)
+		ensemble.terminationCriteria.set(Ensemble.EnsembleStagnationCriteria)
+		ensemble.execute()
+		self.assertEqual(list(ensemble.getStoppedStep()), [7, 7, 7])
+
+	def test_evaluator_shape_is_checked(self):
+		ensemble = create_ensemble()
+		ensemble.evaluator.set(lambda positions: positions.sum(axis=1))
+		self.assertRaises(ValueError, ensemble.initialize)
+		self.assertRaises(ValueError, Ensemble.EnsemblePSO, 0, 5)
+
+
+if __name__ == "__main__":
+	unittest.main()
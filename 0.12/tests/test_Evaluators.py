@@ -0,0 +1,197 @@
+"""
+Tests of the :mod:`Evaluators` module
+"""
+
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Consts
+import Evaluators
+import GlobalTopology
+import Particle1D
+import ParticleMixed
+import Pso
+import PsoDimmension
+
+LOW = Consts.fidelityLevel["low"]
+HIGH = Consts.fidelityLevel["high"]
+
+
+def create_engine(objective, dimmensions=2, swarm_size=4, seed=4):
+	particle = Particle1D.Particle1D(dimmensions)
+	particle.evaluator.set(objective)
+	particle.setParams(rangePosmin=-5.0, rangePosmax=5.0)
+	topology = GlobalTopology.GlobalTopology(particle)
+	pso_engine = Pso.SimplePSO(topology, seed=seed, interactiveMode=False)
+	pso_engine.setSwarmSize(swarm_size)
+	pso_engine.setPsoType(Consts.psoType["CONSTRICTED"])
+	return pso_engine
+
+
+class MultiFidelityTestCase(unittest.TestCase):
+
+	def setUp(self):
+		self.calls = []
+		self.pso_engine = create_engine(self.objective)
+		self.pso_engine.initializeSwarm()
+		self.swarm = self.pso_engine.getTopology().internalSwarm
+		del self.calls[:]
+
+	def objective(self, particle, fidelity=HIGH):
+		self.calls.append((particle, fidelity))
+		#The low fidelity is the high one shifted by 1.0
+		return particle.position[0] + (1.0 if fidelity == LOW else 0.0)
+
+	def evaluate(self, positions):
+		for particle, x in zip(self.swarm, positions):
+			particle.position[:] = [x, 0.0]
+		Evaluators.MultiFidelityEvaluation(self.pso_engine)
+		return [particle for particle, fidelity in self.calls if fidelity == HIGH]
+
+	def test_all_promoted_until_calibrated(self):
+		promoted = self.evaluate([1.0, 2.0, 3.0, 4.0])
+		self.assertEqual(promoted, self.swarm)
+		counters = self.pso_engine.getParam("evaluationCounters")
+		self.assertEqual((counters[LOW], counters[HIGH]), (4, 4))
+		self.assertEqual(len(counters["fidelityPairs"]), 4)
+		self.assertEqual([particle.fitness for particle in self.swarm], [1.0, 2.0, 3.0, 4.0])
+
+	def test_promotion_near_the_own_and_the_global_best(self):
+		self.evaluate([1.0, 2.0, 3.0, 4.0])
+		del self.calls[:]
+		topology = self.pso_engine.getTopology()
+		for particle, best in zip(self.swarm, [2.0, 2.0, 2.0, -3.0]):
+			particle.ownBestFitness = best
+		#Global best kept by the topology, the last own best is stale (lower than it)
+		topology.bestFitness = 2.0
+		promoted = self.evaluate([1.9, 5.0, 2.05, -1.0])
+		self.assertEqual(promoted, [self.swarm[0], self.swarm[2], self.swarm[3]])
+		self.assertEqual(self.swarm[1].fidelity, LOW)
+		self.assertEqual(self.swarm[3].fidelity, HIGH)
+
+	def test_low_fidelity_never_updates_the_own_best(self):
+		pso_engine = create_engine(self.objective, swarm_size=10)
+		pso_engine.getTopology().evaluation_updater.set(Evaluators.MultiFidelityEvaluation)
+		pso_engine.setTimeSteps(30)
+		for snapshot in pso_engine.iterate():
+			pass
+		for particle in pso_engine.getTopology():
+			self.assertEqual(particle.ownBestFidelity, HIGH)
+			self.assertEqual(particle.ownBestFitness, particle.ownBestPosition[0])
+		counters = pso_engine.getParam("evaluationCounters")
+		self.assertTrue(counters[HIGH] < counters[LOW])
+
+
+class BoundedEvaluationTestCase(unittest.TestCase):
+
+	def test_bounded_sum(self):
+		self.assertEqual(Evaluators.boundedSum([1.0, 2.0, 3.0]), 6.0)
+		self.assertFalse(hasattr(Evaluators.boundedSum([1.0, 2.0, 3.0], 6.0), "partial"))
+		terms = iter([1.0, 2.0, 3.0, 4.0])
+		bound = Evaluators.boundedSum(terms, 2.5)
+		self.assertEqual((bound, bound.partial), (3.0, True))
+		self.assertEqual(list(terms), [3.0, 4.0])
+		bound = Evaluators.boundedSum([-1.0, -2.0, -3.0], -2.5, maximize=True)
+		self.assertEqual(bound, -3.0)
+		self.assertTrue(bound.partial)
+
+	def run_engine(self, bounded):
+		terms = []
+		def objective(particle, threshold=None):
+			squares = [x * x for x in particle.position]
+			return Evaluators.boundedSum((terms.append(x) or x for x in squares), threshold)
+		pso_engine = create_engine(objective, dimmensions=8, swarm_size=10)
+		pso_engine.setTimeSteps(40)
+		if bounded:
+			pso_engine.getTopology().evaluation_updater.set(Evaluators.BoundedEvaluation)
+		fitness = [snapshot.bestFitness for snapshot in pso_engine.iterate()]
+		return pso_engine, fitness, len(terms)
+
+	def test_same_search_with_fewer_terms(self):
+		pso_engine, fitness, terms = self.run_engine(True)
+		full_engine, full_fitness, full_terms = self.run_engine(False)
+		self.assertEqual(fitness, full_fitness)
+		self.assertTrue(terms < 0.8 * full_terms)
+		self.assertTrue(pso_engine.getParam("evaluationCounters")["partial"] > 0)
+		for particle in pso_engine.getTopology():
+			self.assertAlmostEqual(particle.ownBestFitness, sum([x * x for x in particle.ownBestPosition]))
+
+
+class NoisyEvaluationTestCase(unittest.TestCase):
+
+	def test_sample_statistics(self):
+		values = [2.0, 4.0, 4.0, 5.0]
+		samples = (0, 0.0, 0.0)
+		for value in values:
+			samples = Evaluators.addSample(samples, value)
+		self.assertEqual(samples[:2], (4, 3.75))
+		self.assertAlmostEqual(samples[2] / 3.0, 1.5833333333)
+		self.assertAlmostEqual(Evaluators.pooledVariance([samples, (2, 1.0, 2.0)]), (4.75 + 2.0) / 4)
+		self.assertTrue(Evaluators.pooledVariance([(1, 3.0, 0.0)]) is None)
+
+	def run_engine(self, noise, budget=0.5):
+		def objective(particle):
+			return sum([x * x for x in particle.position]) + random.gauss(0.0, noise)
+		pso_engine = create_engine(objective, swarm_size=10)
+		pso_engine.getTopology().evaluation_updater.set(Evaluators.NoisyEvaluation)
+		pso_engine.setParams(noiseBudget=budget)
+		pso_engine.setTimeSteps(30)
+		list(pso_engine.iterate())
+		return pso_engine
+
+	def test_resamples_within_the_budget(self):
+		pso_engine = self.run_engine(0.5)
+		resamples = pso_engine.getParam("evaluationCounters")["resamples"]
+		self.assertTrue(0 < resamples <= 5 * 30)
+		self.assertEqual(pso_engine.getEvaluations(), 10 * 31 + resamples)
+		swarm = pso_engine.getTopology()
+		self.assertTrue(max([particle.ownBestSamples[0] for particle in swarm]) > 1)
+		for particle in swarm:
+			self.assertEqual(particle.ownBestFitness, particle.ownBestSamples[1])
+
+	def test_noiseless_objective_is_hardly_resampled(self):
+		#Only the OCBA warm up of the best own best, until a variance is known
+		pso_engine = self.run_engine(0.0)
+		resamples = pso_engine.getParam("evaluationCounters")["resamples"]
+		self.assertTrue(resamples < 10, resamples)
+		self.assertEqual(pso_engine.getEvaluations(), 10 * 31 + resamples)
+		for particle in pso_engine.getTopology():
+			self.assertEqual(particle.ownBestFitness, sum([x * x for x in particle.ownBestPosition]))
+
+	def test_mixed_particles_bypass_the_cache(self):
+		spec = PsoDimmension.PsoDimmensions()
+		spec.add(PsoDimmension.DimmensionRange(0, 3))
+		spec.add(PsoDimmension.DimmensionList(["a", "b"]))
+		calls = []
+		def objective(particle):
+			calls.append(particle)
+			integer, option = particle.getValues()
+			return integer + (option == "b") + random.gauss(0.0, 0.5)
+		particle = ParticleMixed.ParticleMixed(spec)
+		particle.evaluator.set(objective)
+		particle.setParams(cacheSize=100)
+		topology = GlobalTopology.GlobalTopology(particle)
+		topology.evaluation_updater.set(Evaluators.NoisyEvaluation)
+		pso_engine = Pso.SimplePSO(topology, seed=4, interactiveMode=False)
+		pso_engine.setSwarmSize(10)
+		pso_engine.setParams(noiseBudget=0.5)
+		pso_engine.setTimeSteps(10)
+		list(pso_engine.iterate())
+		#Only 8 positions, every evaluation of the noisy steps is a new sample, the
+		#cache only serves the initial evaluation of the swarm
+		resamples = pso_engine.getParam("evaluationCounters")["resamples"]
+		self.assertTrue(resamples > 0)
+		self.assertEqual(len(calls), pso_engine.getEvaluations())
+		self.assertTrue(10 * 10 + resamples < len(calls) <= 10 * 11 + resamples)
+		samples = [p.ownBestSamples for p in pso_engine.getTopology() if p.ownBestSamples[0] > 1]
+		self.assertTrue(samples)
+		self.assertTrue(max([m2 for count, mean, m2 in samples]) > 0.0)
+		self.assertTrue(len(particle.cache) <= 8)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,73 @@
+"""
+Import-time tests: importing the engine must not load the optional dependencies,
+and the import time of the engine is measured in a fresh interpreter
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+#Modules which are only loaded by the optional features
+OPTIONAL_MODULES = ("sqlite3", "csv", "numpy", "matplotlib", "pylab", "reportlab",
+					"threading", "Archive", "Constraints", "InteractiveListener")
+
+#Budget of the import of the engine modules, in seconds (best of the runs)
+IMPORT_TIME_BUDGET = 0.25
+IMPORT_TIME_RUNS = 3
+
+IMPORT_SCRIPT = """
+import sys
+from time import time
+start = time()
+import Pso, Particle1D, GlobalTopology, ReportAdapters, Interaction
+elapsed = time() - start
+print repr(elapsed)
+print " ".join([name for name in %r if sys.modules.get(name) is not None])
+"""
+
+#The Python 2.6 features are hidden to import the modules as on Python 2.5
+PYTHON25_SCRIPT = """
+import sys, itertools, signal, collections
+sys.modules["json"] = None
+del itertools.product, signal.setitimer, collections.namedtuple
+import Sweep, Racing, Pso
+print Sweep.gridDesign({"a": [1, 2], "b": ["x"]})
+"""
+
+
+def run_import():
+	""" Imports the engine in a fresh interpreter, returns the import time and
+	the optional modules loaded """
+	process = subprocess.Popen([sys.executable, "-c", IMPORT_SCRIPT % (OPTIONAL_MODULES,)],
+							cwd=PACKAGE_DIR, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+	out, err = process.communicate()
+	if process.returncode != 0:
+		raise AssertionError(err)
+	lines = out.splitlines()
+	return float(lines[0]), lines[1].split() if len(lines) > 1 else []
+
+
+class ImportTestCase(unittest.TestCase):
+
+	def test_optional_modules_are_not_imported(self):
+		elapsed, loaded = run_import()
+		self.assertEqual(loaded, [])
+
+	def test_import_time(self):
+		elapsed = min([run_import()[0] for run in xrange(IMPORT_TIME_RUNS)])
+		sys.stderr.write("\n\tImport time of the engine: %.1f ms " % (elapsed * 1000.0,))
+		self.assertTrue(elapsed < IMPORT_TIME_BUDGET, "%.3f seconds" % (elapsed,))
+
+	def test_no_python26_features_at_import(self):
+		process = subprocess.Popen([sys.executable, "-c", PYTHON25_SCRIPT], cwd=PACKAGE_DIR,
+								stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+		out, err = process.communicate()
+		self.assertEqual(process.returncode, 0, err)
+		self.assertEqual(out.strip(), "[{'a': 1, 'b': 'x'}, {'a': 2, 'b': 'x'}]")
+
+
+if __name__ == "__main__":
+	unittest.main()
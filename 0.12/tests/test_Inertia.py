@@ -0,0 +1,90 @@
+"""
+Tests of the :mod:`Inertia` module
+"""
+
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Consts
+import GlobalTopology
+import Inertia
+import Particle1D
+import Pso
+
+
+def create_engine(steps=10):
+	particle = Particle1D.Particle1D(2)
+	particle.evaluator.set(lambda p: sum([x * x for x in p.position]))
+	pso_engine = Pso.SimplePSO(GlobalTopology.GlobalTopology(particle), seed=7, interactiveMode=False)
+	pso_engine.setPsoType(Consts.psoType["INERTIA"])
+	pso_engine.setSwarmSize(4)
+	pso_engine.setTimeSteps(steps)
+	pso_engine.setParams(inertiaMax=0.9, inertiaMin=0.4)
+	return pso_engine
+
+
+def schedule(pso_engine, function, steps):
+	pso_engine.inertiaState = None
+	weights = []
+	for step in steps:
+		pso_engine.currentStep = step
+		weights.append(function(pso_engine))
+	return weights
+
+
+class InertiaScheduleTestCase(unittest.TestCase):
+
+	def setUp(self):
+		self.pso_engine = create_engine()
+
+	def test_constant(self):
+		self.assertEqual(Inertia.InertiaConstant(self.pso_engine), Consts.CDefInertia)
+		self.pso_engine.setParams(inertia=0.5)
+		self.assertEqual(Inertia.InertiaConstant(self.pso_engine), 0.5)
+
+	def test_linear_decay(self):
+		weights = schedule(self.pso_engine, Inertia.InertiaLinearDecay, (0, 5, 10))
+		for weight, expected in zip(weights, (0.9, 0.65, 0.4)):
+			self.assertAlmostEqual(weight, expected)
+
+	def test_exponential_decay(self):
+		weights = schedule(self.pso_engine, Inertia.InertiaExponentialDecay, range(11))
+		self.assertAlmostEqual(weights[0], 0.9)
+		self.assertEqual(weights, sorted(weights, reverse=True))
+		self.assertTrue(0.4 < weights[-1] < 0.41)
+
+	def test_chaotic_stays_in_range(self):
+		random.seed(1)
+		weights = schedule(self.pso_engine, Inertia.InertiaChaotic, range(11))
+		self.assertTrue(0.0 < self.pso_engine.inertiaState < 1.0)
+		self.assertTrue(len(set(weights)) == len(weights))
+		for weight in weights:
+			self.assertTrue(0.0 <= weight <= 0.9 + 0.4)
+
+	def test_adaptive_follows_the_success_rate(self):
+		self.pso_engine.initialize()
+		topology = self.pso_engine.getTopology()
+		topology.improvements = 0
+		self.assertAlmostEqual(Inertia.InertiaAdaptive(self.pso_engine), 0.4)
+		topology.improvements = 2
+		self.assertAlmostEqual(Inertia.InertiaAdaptive(self.pso_engine), 0.65)
+
+	def test_engine_updates_the_factor_every_step(self):
+		pso_engine = create_engine(steps=10)
+		factors = []
+		def recorded(engine):
+			factors.append(Inertia.InertiaLinearDecay(engine))
+			return factors[-1]
+		pso_engine.inertiaSchedule.set(recorded)
+		list(pso_engine.iterate())
+		self.assertEqual(len(factors), 10)
+		self.assertEqual(factors, sorted(factors, reverse=True))
+		self.assertEqual(pso_engine.getInertiaFactor(), factors[-1])
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,96 @@
+"""
+Tests of the :mod:`InteractiveListener` module
+"""
+
+import os
+import signal
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import GlobalTopology
+import InteractiveListener
+import Particle1D
+import Pso
+
+
+class BatchListener(InteractiveListener.InteractiveListener):
+	""" A listener that runs without a terminal """
+
+	def isTerminal(self):
+		return False
+
+
+class TerminalListener(InteractiveListener.InteractiveListener):
+	""" A listener that believes it owns a terminal but never touches it """
+
+	def isTerminal(self):
+		return True
+
+	def _InteractiveListener__setTerminal(self):
+		pass
+
+	def _InteractiveListener__listen(self):
+		pass
+
+
+class InteractiveListenerTestCase(unittest.TestCase):
+
+	def test_batch_mode_starts_no_thread(self):
+		listener = BatchListener(poll_time=0.01)
+		listener.start()
+		try:
+			self.assertEqual(listener.listening, hasattr(signal, "SIGUSR1"))
+			self.assertTrue(listener.thread is None)
+			self.assertTrue(listener.termSettings is None)
+		finally:
+			listener.stop()
+
+	@unittest.skipUnless(hasattr(signal, "SIGUSR1"), "SIGUSR1 is POSIX only")
+	def test_sigusr1_in_batch_mode(self):
+		listener = BatchListener(poll_time=0.01)
+		previous = signal.getsignal(signal.SIGUSR1)
+		listener.start()
+		try:
+			os.kill(os.getpid(), signal.SIGUSR1)
+			self.assertTrue(listener.requested)
+			listener.pause()
+			listener.resume()
+			self.assertFalse(listener.requested)
+			self.assertTrue(listener.termSettings is None)
+		finally:
+			listener.stop()
+		self.assertFalse(listener.listening)
+		self.assertEqual(signal.getsignal(signal.SIGUSR1), previous)
+
+	@unittest.skipUnless(hasattr(signal, "SIGUSR1"), "SIGUSR1 is POSIX only")
+	def test_sigusr1_raises_the_flag(self):
+		listener = TerminalListener(poll_time=0.01)
+		previous = signal.getsignal(signal.SIGUSR1)
+		listener.start()
+		try:
+			self.assertTrue(listener.listening)
+			os.kill(os.getpid(), signal.SIGUSR1)
+			self.assertTrue(listener.requested)
+			listener.pause()
+			listener.resume()
+			self.assertFalse(listener.requested)
+		finally:
+			listener.stop()
+		self.assertEqual(signal.getsignal(signal.SIGUSR1), previous)
+
+	def test_engine_releases_the_listener(self):
+		particle = Particle1D.Particle1D(2)
+		particle.evaluator.set(lambda p: sum([x * x for x in p.position]))
+		pso_engine = Pso.SimplePSO(GlobalTopology.GlobalTopology(particle), seed=1)
+		pso_engine.setInteractiveMode(True, freq=1, poll_time=0.01)
+		pso_engine.setSwarmSize(4)
+		pso_engine.setTimeSteps(5)
+		pso_engine.execute()
+		self.assertEqual(pso_engine.getCurrentStep(), 5)
+		self.assertTrue(pso_engine.listener is None)
+
+
+if __name__ == "__main__":
+	unittest.main()
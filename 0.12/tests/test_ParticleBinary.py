@@ -0,0 +1,94 @@
+"""
+Tests of the :mod:`ParticleBinary` module and of the categorical particles
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy
+import Consts
+import Communicators
+import GlobalTopology
+import Initializators
+import Particle1D
+import ParticleBinary
+import Pso
+import PsoDimmension
+
+
+def create_engine(particle, steps, minimax="minimize", pso_type="INERTIA"):
+	pso_engine = Pso.SimplePSO(GlobalTopology.GlobalTopology(particle), seed=9, interactiveMode=False)
+	pso_engine.setMinimax(Consts.minimaxType[minimax])
+	pso_engine.setPsoType(Consts.psoType[pso_type])
+	pso_engine.setSwarmSize(20)
+	pso_engine.setTimeSteps(steps)
+	return pso_engine
+
+
+class ParticleBinaryTestCase(unittest.TestCase):
+
+	def test_bits_are_packed(self):
+		particle = ParticleBinary.ParticleBinary(12)
+		self.assertEqual(particle.getPosition().shape, (2,))
+		bits = [1, 0, 1, 1, 0, 0, 0, 0, 1, 0, 0, 1]
+		particle.setBits(bits)
+		self.assertEqual(list(particle.getBits()), bits)
+		self.assertEqual([particle[i] for i in xrange(12)], bits)
+		self.assertEqual(list(particle.getPosition()), [0xb0, 0x90])
+		self.assertEqual(list(particle.getCoordinates()), map(float, bits))
+
+	def test_clone_does_not_share_the_arrays(self):
+		particle = ParticleBinary.ParticleBinary(10)
+		particle.setBits([1] * 10)
+		clone = particle.clone()
+		self.assertEqual(clone, particle)
+		particle.setBits([0] * 10)
+		self.assertEqual(clone.getBits().sum(), 10)
+		buffer = numpy.zeros(2, dtype=numpy.uint8)
+		self.assertTrue(clone.copyOwnBestPosition(buffer) is buffer)
+		self.assertTrue(particle.copyOwnBestPosition([]) is not particle.getOwnBestPosition())
+
+	def test_one_max(self):
+		particle = ParticleBinary.ParticleBinary(40)
+		particle.evaluator.set(lambda p: int(p.getBits().sum()))
+		pso_engine = create_engine(particle, 60, "maximize", "BASIC")
+		list(pso_engine.iterate())
+		best = pso_engine.bestParticle()
+		self.assertTrue(best.ownBestFitness >= 38)
+		self.assertEqual(best.ownBestFitness, best.getCoordinates(best.getOwnBestPosition()).sum())
+
+
+class CategoricalTestCase(unittest.TestCase):
+
+	target = ["relu", 64, 0.1, "adam"]
+
+	def create_particle(self):
+		dimmensions = PsoDimmension.PsoDimmensions()
+		for options in (["tanh", "relu", "sigmoid"], [16, 32, 64, 128, 256], [0.001, 0.01, 0.1], ["sgd", "adam"]):
+			dimmensions.add(PsoDimmension.DimmensionList(options))
+		particle = Particle1D.Particle1D(4)
+		particle.setParams(dimmension=dimmensions)
+		particle.position_initializator.set(Initializators.P1DListInitializatorCategorical)
+		particle.velocity_initializator.set(Initializators.P1DVelListInitializatorCategorical)
+		particle.position_communicator.set(Communicators.P1DCategoricalPosCommunicator)
+		particle.evaluator.set(lambda p: sum([a != b for a, b in zip(dimmensions.decode(p.position), self.target)]))
+		return particle, dimmensions
+
+	def test_indexes_stay_in_the_options(self):
+		particle, dimmensions = self.create_particle()
+		pso_engine = create_engine(particle, 30)
+		for snapshot in pso_engine.iterate():
+			for particle in pso_engine.getTopology():
+				for index, dimmension in zip(particle.position, dimmensions):
+					self.assertTrue(isinstance(index, int))
+					self.assertTrue(0 <= index < len(dimmension))
+		best = pso_engine.bestParticle()
+		self.assertEqual(best.ownBestFitness, 0)
+		self.assertEqual(dimmensions.decode(best.getOwnBestPosition()), self.target)
+
+
+if __name__ == "__main__":
+	unittest.main()
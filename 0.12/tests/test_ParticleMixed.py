@@ -0,0 +1,73 @@
+"""
+Tests of the :mod:`ParticleMixed` module
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy
+import FloatStatistics
+import GlobalTopology
+import ParticleMixed
+import Pso
+import PsoDimmension
+
+
+def mixed_spec():
+	spec = PsoDimmension.PsoDimmensions()
+	spec.add(PsoDimmension.DimmensionRange(-5.0, 5.0, real=True))
+	spec.add(PsoDimmension.DimmensionList(["a", "b", "c"]))
+	spec.add(PsoDimmension.DimmensionRange(0, 10))
+	spec.add(PsoDimmension.DimmensionRange(-5.0, 5.0, real=True))
+	return spec
+
+def mixed_objective(particle):
+	real, option, integer, other = particle.getValues()
+	return real * real + other * other + integer + (option != "b")
+
+
+class ParticleMixedTestCase(unittest.TestCase):
+
+	def setUp(self):
+		self.particle = ParticleMixed.ParticleMixed(mixed_spec())
+		self.particle.evaluator.set(mixed_objective)
+
+	def test_coordinates_in_spec_order(self):
+		real, integer, categorical = self.particle.getPosition()
+		real[:] = [1.5, -2.5]
+		integer[:] = [7]
+		categorical[:] = [2]
+		self.particle.setOwnBestPosition(self.particle.getPosition())
+		expected = [1.5, 2.0, 7.0, -2.5]
+		self.assertEqual(list(self.particle.getCoordinates()), expected)
+		values = self.particle.copyOwnBestPosition([])
+		self.assertEqual(values, [1.5, "c", 7, -2.5])
+		self.assertEqual(list(self.particle.getCoordinates(values)), expected)
+
+	def test_statistics_of_a_mixed_swarm(self):
+		topology = GlobalTopology.GlobalTopology(self.particle)
+		topology.setDiversityStatistics(FloatStatistics.DiversityStatistics())
+		pso_engine = Pso.SimplePSO(topology, seed=10, interactiveMode=False)
+		pso_engine.setSwarmSize(10)
+		pso_engine.setTimeSteps(15)
+		pso_engine.setParams(diameterMin=0.0)
+		pso_engine.terminationCriteria.set(Pso.DiameterCriteria)
+		for snapshot in pso_engine.iterate(stats=("diameter", "velocityAvg", "position")):
+			pass
+		self.assertEqual(snapshot.step, 15)
+		stats = dict(snapshot.stats)
+		self.assertTrue(stats["diameter"] > 0.0)
+		self.assertTrue(stats["velocityAvg"] >= 0.0)
+		self.assertEqual(len(stats["position"]), 4)
+		topology.setDiversityStatistics(None)
+		self.assertTrue(topology.getSwarmDiameter() > 0.0)
+		best = topology.getBestParticle()
+		self.assertTrue(numpy.array_equal(best.getCoordinates(topology.getBestPosition()),
+										best.getCoordinates(best.getOwnBestPosition())))
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,127 @@
+"""
+Tests of the :mod:`Profiler` module
+"""
+
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Consts
+import FloatStatistics
+import GlobalTopology
+import Particle1D
+import Profiler
+import Pso
+import ReportAdapters
+
+
+class FakeClock(object):
+	""" A clock advanced by hand """
+
+	def __init__(self):
+		self.now = 0.0
+
+	def __call__(self):
+		return self.now
+
+
+class StepProfilerTestCase(unittest.TestCase):
+
+	def setUp(self):
+		self.profiler = Profiler.StepProfiler(phases=("a", "b"))
+		self.clock = self.profiler.clock = FakeClock()
+
+	def step(self, a, b):
+		self.profiler.begin()
+		self.clock.now += a
+		self.profiler.mark("a")
+		self.clock.now += 100.0
+		self.profiler.skip()
+		self.clock.now += b
+		self.profiler.mark("b")
+		self.profiler.end()
+
+	def test_marks_charge_the_elapsed_time(self):
+		self.step(1.0, 2.0)
+		self.step(3.0, 1.0)
+		self.assertEqual(self.profiler.getSteps(), 2)
+		self.assertEqual(self.profiler.asTuple(), (3.0, 1.0))
+		self.assertEqual(self.profiler.getTotal("a"), 4.0)
+		self.assertEqual(self.profiler.getTotal(), 7.0)
+		self.assertEqual(self.profiler.getAverage("b"), 1.5)
+		self.assertEqual(self.profiler.getPeak("b"), 2.0)
+		self.assertEqual(self.profiler.items(), [("a", 3.0, 4.0), ("b", 1.0, 3.0)])
+
+	def test_begin_closes_the_open_step(self):
+		self.profiler.begin()
+		self.clock.now += 1.0
+		self.profiler.mark("a")
+		self.profiler.begin()
+		self.assertEqual(self.profiler.getSteps(), 1)
+		self.assertEqual(self.profiler.getLast("a"), 1.0)
+		self.profiler.reset()
+		self.assertEqual(self.profiler.getSteps(), 0)
+		self.assertFalse(self.profiler.running)
+
+
+class EngineProfileTestCase(unittest.TestCase):
+
+	def setUp(self):
+		self.directory = tempfile.mkdtemp()
+
+	def tearDown(self):
+		shutil.rmtree(self.directory)
+
+	def test_one_profile_row_per_step(self):
+		particle = Particle1D.Particle1D(3)
+		particle.evaluator.set(lambda p: sum([x * x for x in p.position]))
+		pso_engine = Pso.SimplePSO(GlobalTopology.GlobalTopology(particle), seed=1, interactiveMode=False)
+		pso_engine.setSwarmSize(5)
+		pso_engine.setTimeSteps(12)
+		profiler = Profiler.StepProfiler(report=True)
+		pso_engine.setProfiler(profiler)
+		profile_filename = os.path.join(self.directory, "profile.csv")
+		pso_engine.setReportAdapter(ReportAdapters.ReportFileCSV(os.path.join(self.directory, "stats.csv"),
+										identify="run", profile_filename=profile_filename))
+		pso_engine.execute()
+		self.assertEqual(profiler.getSteps(), 12)
+		self.assertTrue(profiler.getTotal("evaluation") > 0.0)
+		rows = [line.strip().split(";") for line in open(profile_filename)]
+		self.assertEqual(rows[0], ["identify", "iteration"] + list(profiler.phases))
+		self.assertEqual([int(row[1]) for row in rows[1:]], range(1, 13))
+
+	def test_database_of_an_older_version(self):
+		#An older database, without the diversity and profile tables
+		dbname = os.path.join(self.directory, "stats.db")
+		adapter = ReportAdapters.ReportDB(dbname, identify="old")
+		adapter.open()
+		cursor = adapter.getCursor()
+		cursor.execute("drop table %s" % (Consts.CDefReportDBDivTable,))
+		cursor.execute("drop table %s" % (Consts.CDefReportDBProfTable,))
+		adapter.saveAndClose()
+
+		particle = Particle1D.Particle1D(3)
+		particle.evaluator.set(lambda p: sum([x * x for x in p.position]))
+		topology = GlobalTopology.GlobalTopology(particle)
+		topology.setDiversityStatistics(FloatStatistics.DiversityStatistics())
+		pso_engine = Pso.SimplePSO(topology, seed=1, interactiveMode=False)
+		pso_engine.setSwarmSize(5)
+		pso_engine.setTimeSteps(4)
+		pso_engine.setProfiler(Profiler.StepProfiler(report=True))
+		adapter = ReportAdapters.ReportDB(dbname, identify="new", resetDB=False)
+		pso_engine.setReportAdapter(adapter)
+		pso_engine.execute()
+		connection = sqlite3.connect(dbname)
+		for table in (Consts.CDefReportDBDivTable, Consts.CDefReportDBProfTable):
+			rows = connection.execute("select distinct iteration from %s where identify = 'new'" % (table,))
+			self.assertTrue(len(rows.fetchall()) >= 4, table)
+		connection.close()
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,176 @@
+"""
+Tests of the :mod:`Pso` module
+"""
+
+import os
+import pickle
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy
+import GlobalTopology
+import Particle1D
+import ParticleBinary
+import Pso
+
+
+def sphere(particle):
+	return sphere_of(particle.position)
+
+def sphere_of(position):
+	return sum([x * x for x in position])
+
+def create_engine(dimmensions=4, swarm_size=10, steps=30, seed=5, objective=sphere):
+	particle = Particle1D.Particle1D(dimmensions)
+	particle.evaluator.set(objective)
+	particle.setParams(rangePosmin=-5.0, rangePosmax=5.0)
+	pso_engine = Pso.SimplePSO(GlobalTopology.GlobalTopology(particle), seed=seed, interactiveMode=False)
+	pso_engine.setSwarmSize(swarm_size)
+	pso_engine.setTimeSteps(steps)
+	return pso_engine
+
+
+class StepSnapshotTestCase(unittest.TestCase):
+
+	def test_attribute_and_tuple_access(self):
+		snapshot = Pso.StepSnapshot(3, 1.5, (0.0, 1.0), 40, 2, (("fitAvg", 2.0),))
+		self.assertEqual(snapshot.step, 3)
+		self.assertEqual(snapshot.bestPosition, (0.0, 1.0))
+		self.assertEqual(snapshot.stats, (("fitAvg", 2.0),))
+		self.assertEqual(snapshot[:2], (3, 1.5))
+		self.assertEqual(len(snapshot), 6)
+		self.assertRaises(AttributeError, setattr, snapshot, "step", 4)
+		self.assertEqual(pickle.loads(pickle.dumps(snapshot, 2)), snapshot)
+		self.assertTrue(repr(snapshot).startswith("StepSnapshot(step=3, bestFitness=1.5"))
+
+
+class IterateTestCase(unittest.TestCase):
+
+	def test_one_snapshot_per_step(self):
+		pso_engine = create_engine(steps=25)
+		snapshots = list(pso_engine.iterate(stats=("fitAvg", "bestFitness")))
+		self.assertEqual([snapshot.step for snapshot in snapshots], range(1, 26))
+		fitness = [snapshot.bestFitness for snapshot in snapshots]
+		self.assertEqual(fitness, sorted(fitness, reverse=True))
+		last = snapshots[-1]
+		self.assertEqual(last.bestFitness, pso_engine.bestParticle().ownBestFitness)
+		self.assertEqual(last.evaluations, 26 * 10)
+		self.assertEqual(dict(last.stats)["bestFitness"], last.bestFitness)
+		for previous, snapshot in zip(snapshots, snapshots[1:]):
+			if snapshot.bestFitness == previous.bestFitness:
+				self.assertTrue(snapshot.bestPosition is previous.bestPosition)
+
+	def test_stopped_by_the_caller_and_the_criteria(self):
+		pso_engine = create_engine(steps=100)
+		for snapshot in pso_engine.iterate():
+			if snapshot.step == 5: break
+		self.assertEqual(pso_engine.getCurrentStep(), 5)
+		pso_engine.stepCallback.set(lambda engine: engine.getCurrentStep() >= 7)
+		self.assertEqual(len(list(pso_engine.iterate())), 7)
+
+	def test_unknown_statistic(self):
+		pso_engine = create_engine()
+		self.assertRaises(KeyError, list, pso_engine.iterate(stats=("unknown",)))
+
+
+class CriteriaTestCase(unittest.TestCase):
+
+	def run_until(self, criteria, objective=sphere, **params):
+		pso_engine = create_engine(steps=200, objective=objective)
+		pso_engine.setParams(**params)
+		pso_engine.terminationCriteria.set(criteria)
+		for snapshot in pso_engine.iterate():
+			pass
+		return pso_engine
+
+	def test_stagnation(self):
+		pso_engine = self.run_until(Pso.StagnationCriteria, lambda particle: 1.0, stagnationSteps=6)
+		self.assertEqual(pso_engine.getCurrentStep(), 6)
+
+	def test_tolerance(self):
+		pso_engine = self.run_until(Pso.ToleranceCriteria, toleranceAbs=1e9, toleranceSteps=4)
+		self.assertEqual(pso_engine.getCurrentStep(), 4)
+		pso_engine = self.run_until(Pso.ToleranceCriteria, toleranceAbs=0.0, toleranceRel=0.0, toleranceSteps=40)
+		self.assertTrue(pso_engine.getCurrentStep() > 40)
+
+	def test_diameter(self):
+		pso_engine = self.run_until(Pso.DiameterCriteria, diameterMin=1e9)
+		self.assertEqual(pso_engine.getCurrentStep(), 1)
+		pso_engine = self.run_until(Pso.DiameterCriteria, diameterMin=1e-12)
+		self.assertEqual(pso_engine.getCurrentStep(), 200)
+
+	def test_evaluation_budget(self):
+		pso_engine = self.run_until(Pso.EvaluationBudgetCriteria, evaluationBudget=55)
+		self.assertEqual(pso_engine.getEvaluations(), 60)
+
+	def test_budgets_are_required(self):
+		self.assertRaises(ValueError, self.run_until, Pso.TimeBudgetCriteria)
+		self.assertRaises(ValueError, self.run_until, Pso.EvaluationBudgetCriteria)
+		pso_engine = self.run_until(Pso.TimeBudgetCriteria, timeBudget=0.0)
+		self.assertEqual(pso_engine.getCurrentStep(), 1)
+
+
+class RestartTestCase(unittest.TestCase):
+
+	def test_swarm_grows_and_is_restored(self):
+		pso_engine = create_engine(steps=20, objective=lambda particle: 1.0)
+		pso_engine.setParams(stagnationSteps=3, restartPopInc=2, restartMax=2, restartMaxSwarmSize=30)
+		pso_engine.restartCriteria.set(Pso.StagnationCriteria)
+		snapshots = list(pso_engine.iterate())
+		self.assertEqual(len(snapshots), 20)
+		self.assertEqual(pso_engine.getRestarts(), 2)
+		self.assertEqual(len(pso_engine.getTopology()), 30)
+		#Restarts at the steps 3 and 6, the new swarms are evaluated in the same budget
+		self.assertEqual(pso_engine.getEvaluations(), 4 * 10 + 20 + 3 * 20 + 30 + 14 * 30)
+		pso_engine.initializeSwarm()
+		self.assertEqual(len(pso_engine.getTopology()), 10)
+		self.assertEqual(pso_engine.getRestarts(), 0)
+
+	def test_best_of_the_whole_run(self):
+		pso_engine = create_engine(steps=15)
+		pso_engine.setParams(diameterMin=1e9, restartMax=3)
+		pso_engine.restartCriteria.set(Pso.DiameterCriteria)
+		fitness = [snapshot.bestFitness for snapshot in pso_engine.iterate()]
+		self.assertEqual(pso_engine.getRestarts(), 3)
+		self.assertEqual(fitness, sorted(fitness, reverse=True))
+		self.assertEqual(pso_engine.bestParticle().ownBestFitness, fitness[-1])
+
+
+class AskTellTestCase(unittest.TestCase):
+
+	def test_ask_tell_loop(self):
+		pso_engine = create_engine(steps=60)
+		self.assertRaises(ValueError, pso_engine.tell, [0.0] * 10)
+		told = 0
+		while True:
+			positions = pso_engine.ask()
+			self.assertEqual(positions.shape, (10, 4))
+			self.assertTrue(pso_engine.ask() is positions)
+			told += 1
+			if pso_engine.tell([float((row * row).sum()) for row in positions]): break
+		self.assertEqual(told, 61)
+		self.assertEqual(pso_engine.getCurrentStep(), 60)
+		self.assertEqual(pso_engine.getEvaluations(), 610)
+		best = pso_engine.bestParticle()
+		self.assertAlmostEqual(best.ownBestFitness, sphere_of(best.getOwnBestPosition()))
+		self.assertTrue(best.ownBestFitness < 1.0)
+
+	def test_ask_the_bits_of_binary_particles(self):
+		particle = ParticleBinary.ParticleBinary(12)
+		pso_engine = Pso.SimplePSO(GlobalTopology.GlobalTopology(particle), seed=2, interactiveMode=False)
+		pso_engine.setSwarmSize(4)
+		for step in xrange(3):
+			positions = pso_engine.ask()
+			self.assertEqual(positions.shape, (4, 12))
+			self.assertTrue(set(numpy.unique(positions)) <= set([0.0, 1.0]))
+			for row, particle in zip(positions, pso_engine.getTopology()):
+				self.assertTrue(numpy.array_equal(row, particle.getBits()))
+			pso_engine.tell(positions.sum(axis=1))
+		best = pso_engine.bestParticle()
+		self.assertEqual(best.ownBestFitness, best.getCoordinates(best.getOwnBestPosition()).sum())
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,101 @@
+"""
+Tests of the :mod:`Racing` module
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Consts
+import Racing
+
+
+class CostEngine(object):
+	""" A stub engine whose best fitness is given by the configuration """
+
+	def __init__(self, fitness):
+		self.ownBestFitness = fitness
+
+	def execute(self):
+		pass
+
+	def bestParticle(self):
+		return self
+
+	def getEvaluations(self):
+		return 1
+
+	def getCurrentStep(self):
+		return 1
+
+def builder(config, instance):
+	if config.get("broken"):
+		raise RuntimeError("broken candidate")
+	#The instances shift the costs, the ranking of the candidates is kept
+	return CostEngine(config["level"] + 10.0 * instance + 0.1 * ((config["level"] * instance) % 3))
+
+
+class QuantilesTestCase(unittest.TestCase):
+
+	def test_normal(self):
+		self.assertAlmostEqual(Racing.normalQuantile(0.975), 1.959964, 5)
+		self.assertAlmostEqual(Racing.normalQuantile(0.01), -2.326348, 5)
+		self.assertEqual(Racing.normalQuantile(0.5), 0.0)
+		self.assertRaises(ValueError, Racing.normalQuantile, 1.0)
+
+	def test_chi_square_and_student(self):
+		self.assertAlmostEqual(Racing.chiSquareQuantile(0.95, 4), 9.4877, 1)
+		self.assertAlmostEqual(Racing.chiSquareQuantile(0.95, 20), 31.4104, 1)
+		self.assertAlmostEqual(Racing.studentQuantile(0.975, 10), 2.2281, 2)
+		self.assertAlmostEqual(Racing.studentQuantile(0.975, 60), 2.0003, 3)
+
+
+class FriedmanTestCase(unittest.TestCase):
+
+	def test_ranks_with_ties(self):
+		self.assertEqual(Racing.rankBlock([3.0, 1.0, 3.0, 2.0]), [3.5, 1.0, 3.5, 2.0])
+
+	def test_equivalent_candidates_are_kept(self):
+		sums, worse = Racing.friedmanTest([[1.0, 1.0, 1.0]] * 6, 0.05)
+		self.assertEqual((sums, worse), ([12.0, 12.0, 12.0], []))
+		blocks = [[1.0, 2.0, 3.0], [2.0, 3.0, 1.0], [3.0, 1.0, 2.0]] * 2
+		self.assertEqual(Racing.friedmanTest(blocks, 0.05)[1], [])
+
+	def test_worse_candidates_are_discarded(self):
+		blocks = [[1.0, 2.0, 3.0, 4.0], [1.0, 3.0, 2.0, 4.0], [2.0, 1.0, 3.0, 4.0]] * 3
+		sums, worse = Racing.friedmanTest(blocks, 0.05)
+		self.assertEqual(sums, [12.0, 18.0, 24.0, 36.0])
+		#T = 21 > 7.81, the Conover critical difference is 2.064 * sqrt(7.5) = 5.65
+		self.assertEqual(worse, [1, 2, 3])
+		#Four instances: T = 9.9, the critical difference is 2.262 * sqrt(3.11) = 3.99
+		sums, worse = Racing.friedmanTest(blocks[:4], 0.05)
+		self.assertEqual((sums, worse), ([5.0, 8.0, 11.0, 16.0], [2, 3]))
+
+
+class RaceTestCase(unittest.TestCase):
+
+	def test_race_keeps_the_best_candidate(self):
+		candidates = [{"level": level} for level in (3, 0, 5, 1, 4)] + [{"level": 2, "broken": True}]
+		race = Racing.Race(builder, candidates, range(20), first_test=3, processes=2)
+		survivors = race.execute(verbose=False)
+		self.assertEqual(survivors[0], {"level": 0})
+		self.assertTrue(race.getRuns() < len(candidates) * 20)
+		self.assertEqual(race.getBest(), {"level": 0})
+		self.assertTrue(5 in race.discarded)
+		failures = race.getFailures()
+		self.assertEqual(len(failures), race.discarded[5])
+		self.assertTrue(failures[0][2]["message"].startswith("RuntimeError"))
+
+	def test_maximize_and_budget(self):
+		candidates = [{"level": level} for level in range(4)]
+		race = Racing.Race(builder, candidates, range(20), minimax=Consts.minimaxType["maximize"],
+						   max_runs=10, processes=1)
+		race.execute(verbose=False)
+		self.assertTrue(race.getRuns() <= 10)
+		self.assertEqual(race.getBest(), {"level": 3})
+
+
+if __name__ == "__main__":
+	unittest.main()
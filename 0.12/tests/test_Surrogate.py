@@ -0,0 +1,98 @@
+"""
+Tests of the :mod:`Surrogate` module
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy
+import Consts
+import GlobalTopology
+import Particle1D
+import Pso
+import Surrogate
+
+
+def sphere(particle):
+	return sum([x * x for x in particle.position])
+
+
+class RBFSurrogateTestCase(unittest.TestCase):
+
+	def create_model(self, count, size=None):
+		model = Surrogate.RBFSurrogate(size=size)
+		points = numpy.random.RandomState(1).uniform(-2.0, 2.0, (count, 2))
+		for point in points:
+			model.add(point, (point ** 2).sum())
+		return model, points
+
+	def test_interpolates_the_archive(self):
+		model, points = self.create_model(30)
+		mean, deviation = model.predict(points)
+		self.assertTrue(numpy.allclose(mean, (points ** 2).sum(axis=1), atol=1e-2))
+		self.assertTrue((deviation < 0.05).all())
+		mean, deviation = model.predict([[0.1, -0.2], [40.0, 40.0]])
+		self.assertTrue(abs(mean[0] - 0.05) < 0.3)
+		self.assertTrue(deviation[1] > 10.0 * deviation[0])
+		self.assertRaises(ValueError, Surrogate.RBFSurrogate().predict, points)
+
+	def test_incremental_kernel_and_fifo_archive(self):
+		model, points = self.create_model(10, size=12)
+		model.predict(points)
+		scale = model.lengthScale
+		for point in numpy.random.RandomState(2).uniform(-2.0, 2.0, (5, 2)):
+			model.add(point, (point ** 2).sum())
+			model.predict(points)
+		self.assertEqual(len(model), 12)
+		self.assertTrue(numpy.array_equal(model.points[0], points[3]))
+		self.assertEqual(model.lengthScale, scale)
+		self.assertEqual(model.factorizations, 1)
+		matrix = model.kernelOf(model.points, model.points) + model.nugget * numpy.eye(12)
+		self.assertTrue(numpy.allclose(model.inverse.dot(matrix), numpy.eye(12), atol=1e-6))
+		weights = model.weights
+		model.inverse = None
+		model.fit()
+		self.assertEqual(model.factorizations, 2)
+		self.assertTrue(numpy.allclose(model.weights, weights, rtol=1e-4, atol=1e-6))
+
+	def test_scale_reset_factorizes_again(self):
+		model, points = self.create_model(10)
+		model.predict(points)
+		for point in points * 10.0:
+			model.add(point, (point ** 2).sum())
+		model.predict(points)
+		self.assertEqual(model.factorizations, 2)
+
+
+class PrescreeningTestCase(unittest.TestCase):
+
+	def run_engine(self, prescreening):
+		particle = Particle1D.Particle1D(3)
+		particle.evaluator.set(sphere)
+		particle.setParams(rangePosmin=-5.0, rangePosmax=5.0)
+		topology = GlobalTopology.GlobalTopology(particle)
+		pso_engine = Pso.SimplePSO(topology, seed=4, interactiveMode=False)
+		pso_engine.setPsoType(Consts.psoType["CONSTRICTED"])
+		pso_engine.setSwarmSize(10)
+		pso_engine.setTimeSteps(60)
+		if prescreening:
+			topology.evaluation_updater.set(Surrogate.SurrogatePrescreening)
+		list(pso_engine.iterate())
+		return pso_engine
+
+	def test_fewer_evaluations_and_true_own_bests(self):
+		pso_engine = self.run_engine(True)
+		model = pso_engine.getParam("surrogate")
+		self.assertTrue(model.predictions > 0)
+		self.assertEqual(pso_engine.getEvaluations(), 10 + model.evaluations)
+		self.assertTrue(pso_engine.getEvaluations() < self.run_engine(False).getEvaluations())
+		for particle in pso_engine.getTopology():
+			self.assertAlmostEqual(particle.ownBestFitness, sum([x * x for x in particle.getOwnBestPosition()]))
+		self.assertTrue(pso_engine.bestParticle().ownBestFitness < 1e-2)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,140 @@
+"""
+Tests of the :mod:`Sweep` module
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Consts
+import GlobalTopology
+import Particle1D
+import Pso
+import Sweep
+
+
+def sphere(particle):
+	return sum([x * x for x in particle.position])
+
+def slow_sphere(particle):
+	time.sleep(0.01)
+	return sphere(particle)
+
+def builder(config, seed):
+	particle = Particle1D.Particle1D(3)
+	particle.evaluator.set(slow_sphere if config.get("slow") else sphere)
+	particle.setParams(rangePosmin=-5.0, rangePosmax=5.0)
+	pso_engine = Pso.SimplePSO(GlobalTopology.GlobalTopology(particle), seed=seed, interactiveMode=False)
+	pso_engine.setPsoType(Consts.psoType[config["psoType"]])
+	pso_engine.setSwarmSize(config["swarmSize"])
+	pso_engine.setTimeSteps(config.get("steps", 20))
+	return pso_engine
+
+
+class IntegerFitnessEngine(object):
+	""" A stub engine whose best fitness is an integer """
+
+	ownBestFitness = 3
+
+	def execute(self):
+		pass
+
+	def bestParticle(self):
+		return self
+
+	def getEvaluations(self):
+		return 1
+
+	def getCurrentStep(self):
+		return 1
+
+def integer_builder(config, seed):
+	return IntegerFitnessEngine()
+
+
+class DesignTestCase(unittest.TestCase):
+
+	def test_grid_design(self):
+		design = Sweep.gridDesign({"a": [1, 2], "b": ["x", "y", "z"]})
+		self.assertEqual(len(design), 6)
+		self.assertTrue({"a": 2, "b": "z"} in design)
+
+	def test_product_and_keys(self):
+		self.assertEqual(Sweep.product([[1, 2], ["x", "y"]]), [(1, "x"), (1, "y"), (2, "x"), (2, "y")])
+		self.assertEqual(Sweep.product([]), [()])
+		self.assertEqual(Sweep.configKey({"b": 1.5, "a": "x"}, 3), Sweep.configKey({"a": "x", "b": 1.5}, 3))
+		config = {"a": u"x", "b": 1.5, "c": None, "d": True}
+		self.assertEqual(Sweep.decodeConfig(Sweep.encodeConfig(config)), config)
+
+	def test_random_design(self):
+		design = Sweep.randomDesign({"c": (1.0, 3.0), "n": (10, 20), "t": ["A", "B"]}, 50, seed=1)
+		self.assertEqual(design, Sweep.randomDesign({"c": (1.0, 3.0), "n": (10, 20), "t": ["A", "B"]}, 50, seed=1))
+		for config in design:
+			self.assertTrue(1.0 <= config["c"] <= 3.0)
+			self.assertTrue(isinstance(config["n"], int) and 10 <= config["n"] <= 20)
+			self.assertTrue(config["t"] in ("A", "B"))
+
+
+class ExecuteRunTestCase(unittest.TestCase):
+
+	def test_fractional_time_limit(self):
+		config = {"psoType": "CONSTRICTED", "swarmSize": 10, "steps": 1000, "slow": True}
+		config, seed, result = Sweep.executeRun((builder, config, 1, 0.3))
+		self.assertEqual(result["status"], "timeout")
+		self.assertTrue(0.25 < result["elapsed"] < 0.9, result["elapsed"])
+
+	def test_numeric_fitness_is_stored_as_float(self):
+		config, seed, result = Sweep.executeRun((integer_builder, {}, 1, None))
+		self.assertEqual(result["status"], "done")
+		self.assertEqual(result["bestFitness"], 3.0)
+		self.assertTrue(isinstance(result["bestFitness"], float))
+
+	def test_error_keeps_its_reason(self):
+		config, seed, result = Sweep.executeRun((builder, {"psoType": "UNKNOWN", "swarmSize": 10}, 1, None))
+		self.assertEqual(result["status"], "error")
+		self.assertTrue(result["message"].startswith("KeyError"))
+
+
+class SweepTestCase(unittest.TestCase):
+
+	def setUp(self):
+		self.directory = tempfile.mkdtemp()
+		self.dbname = os.path.join(self.directory, "sweep.db")
+
+	def tearDown(self):
+		shutil.rmtree(self.directory)
+
+	def test_sweep_stores_and_resumes(self):
+		design = Sweep.gridDesign({"psoType": ["CONSTRICTED", "INERTIA"], "swarmSize": [5, 10]})
+		sweep = Sweep.Sweep(builder, design, seeds=[1, 2], dbname=self.dbname, processes=2)
+		self.assertEqual(sweep.execute(verbose=False), 8)
+		results = sweep.getResults()
+		self.assertEqual(len(results), 8)
+		for config, seed, result in results:
+			self.assertEqual(result["status"], "done")
+			self.assertEqual(result["steps"], 20)
+			self.assertTrue(isinstance(result["bestFitness"], float))
+		sweep = Sweep.Sweep(builder, design, seeds=[1, 2, 3], dbname=self.dbname, processes=2)
+		self.assertEqual(len(sweep.getPending()), 4)
+		self.assertEqual(sweep.execute(verbose=False), 4)
+		self.assertEqual(len(sweep.getPending()), 0)
+
+	def test_failed_runs_are_executed_again(self):
+		design = [{"psoType": "CONSTRICTED", "swarmSize": 5}, {"psoType": "UNKNOWN", "swarmSize": 5}]
+		sweep = Sweep.Sweep(builder, design, seeds=[1], dbname=self.dbname, processes=1)
+		self.assertEqual(sweep.execute(verbose=False), 2)
+		self.assertEqual(sweep.getPending(), [(design[1], 1)])
+		self.assertEqual(sweep.execute(verbose=False), 1)
+		statuses = sorted([result["status"] for config, seed, result in sweep.getResults()])
+		self.assertEqual(statuses, ["done", "error"])
+		sweep = Sweep.Sweep(builder, design, seeds=[1], dbname=self.dbname, processes=1, keep_failed=True)
+		self.assertEqual(sweep.getPending(), [])
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,124 @@
+"""
+Tests of the :mod:`TopologyBase` module
+"""
+
+import math
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Consts
+import FloatStatistics
+import GlobalTopology
+import Particle1D
+import Pso
+
+
+def create_topology():
+	particle = Particle1D.Particle1D(2)
+	particle.evaluator.set(lambda p: sum([x * x for x in p.position]))
+	topology = GlobalTopology.GlobalTopology(particle)
+	pso_engine = Pso.SimplePSO(topology, seed=3, interactiveMode=False)
+	pso_engine.setSwarmSize(4)
+	pso_engine.initialize()
+	#A square of side 2 centered at (1, 1), still particles but the last one
+	for particle, position in zip(topology, [(0.0, 0.0), (2.0, 0.0), (0.0, 2.0), (2.0, 2.0)]):
+		particle.position[:] = position
+		particle.velocity[:] = [0.0, 0.0]
+	topology[3].velocity[:] = [3.0, 4.0]
+	topology.clear_flags()
+	return topology
+
+
+class DiversityTestCase(unittest.TestCase):
+
+	def test_disabled_by_default(self):
+		topology = create_topology()
+		self.assertTrue(topology.getDiversityStatistics() is None)
+		self.assertAlmostEqual(topology.getSwarmDiameter(), math.sqrt(8.0))
+
+	def test_diversity_of_a_square(self):
+		topology = create_topology()
+		topology.setDiversityStatistics(FloatStatistics.DiversityStatistics())
+		stats = topology.getDiversityStatistics()
+		self.assertAlmostEqual(stats["centroidDist"], math.sqrt(2.0))
+		self.assertAlmostEqual(stats["radius"], math.sqrt(2.0))
+		self.assertAlmostEqual(stats["diameter"], math.sqrt(8.0))
+		self.assertEqual(stats.dimSpread, [1.0, 1.0])
+		self.assertEqual((stats["spreadMin"], stats["spreadMax"]), (1.0, 1.0))
+		self.assertAlmostEqual(stats["velocityAvg"], 1.25)
+		self.assertAlmostEqual(stats["velocityMax"], 5.0)
+		self.assertAlmostEqual(topology.getSwarmDiameter(), stats["diameter"])
+
+	def test_cached_until_the_flags_are_cleared(self):
+		topology = create_topology()
+		topology.setDiversityStatistics(FloatStatistics.DiversityStatistics())
+		self.assertAlmostEqual(topology.getSwarmDiameter(), math.sqrt(8.0))
+		topology[3].position[:] = [4.0, 2.0]
+		self.assertAlmostEqual(topology.getSwarmDiameter(), math.sqrt(8.0))
+		topology.clear_flags()
+		self.assertAlmostEqual(topology.getSwarmDiameter(), math.sqrt(20.0))
+
+
+class BestTrackingTestCase(unittest.TestCase):
+
+	def setBests(self, topology, fitness):
+		for index, (particle, value) in enumerate(zip(topology, fitness)):
+			particle.ownBestFitness = value
+			particle.setOwnBestPosition([float(index), float(index)])
+
+	def test_single_reduction_over_the_own_bests(self):
+		topology = create_topology()
+		self.setBests(topology, [3.0, 1.0, 2.0, 4.0])
+		topology.updateBestParticle()
+		self.assertEqual(topology.getBestIndex(), 1)
+		self.assertEqual(topology.getBestFitness(), 1.0)
+		self.assertTrue(topology.getBestParticle() is topology[1])
+		self.assertEqual(topology.getBestPosition(), [1.0, 1.0])
+		topology.minimax = Consts.minimaxType["maximize"]
+		topology.updateBestParticle()
+		self.assertEqual(topology.getBestIndex(), 3)
+		self.assertEqual(topology.getBestPosition(), [3.0, 3.0])
+
+	def test_snapshot_does_not_follow_the_particle(self):
+		topology = create_topology()
+		self.setBests(topology, [3.0, 1.0, 2.0, 4.0])
+		topology.updateBestParticle()
+		snapshot = topology.getBestPosition()
+		topology[1].position[:] = [9.0, 9.0]
+		topology[1].setOwnBestPosition([5.0, 5.0])
+		self.assertEqual(snapshot, [1.0, 1.0])
+		topology.updateBestParticle()
+		self.assertTrue(topology.getBestPosition() is snapshot)
+
+	def test_best_positions_are_updated_in_place(self):
+		topology = create_topology()
+		particle = topology[0]
+		own_best = particle.getOwnBestPosition()
+		particle.setOwnBestPosition([7.0, 8.0])
+		self.assertTrue(particle.getOwnBestPosition() is own_best)
+		self.assertEqual(own_best, [7.0, 8.0])
+		buffer = [0.0, 0.0]
+		self.assertTrue(particle.copyOwnBestPosition(buffer) is buffer)
+		self.assertEqual(buffer, [7.0, 8.0])
+
+	def test_double_buffered_snapshot(self):
+		topology = create_topology()
+		self.setBests(topology, [3.0, 1.0, 2.0, 4.0])
+		topology.updateBestParticle()
+		first = topology.getBestPosition()
+		topology[2].ownBestFitness = 0.5
+		topology.updateBestParticle()
+		second = topology.getBestPosition()
+		self.assertFalse(second is first)
+		self.assertEqual((first, second), ([1.0, 1.0], [2.0, 2.0]))
+		topology[3].ownBestFitness = 0.25
+		topology.updateBestParticle()
+		self.assertTrue(topology.getBestPosition() is first)
+		self.assertEqual((topology.getBestPosition(), second), ([3.0, 3.0], [2.0, 2.0]))
+
+
+if __name__ == "__main__":
+	unittest.main()